@@ -12,6 +12,11 @@
 # ================================================
 
 import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod  # noqa: E402
 
 # -------- Parameter HIER anpassen (Beispiel: Aufgabe 6) --------
 p = 43                  # Primzahl des Feldes oft in GF(p)
@@ -25,11 +30,6 @@ A = (12, 26)            # Zielpunkt A = x*P
 INF = None  # Punkt im Unendlichen (neutrales Element)
 
 
-def inv_mod(x, p):
-    """Modulare Inverse von x modulo p (p prim)."""
-    return pow(x % p, -1, p)
-
-
 def point_add(P, Q, a, p):
     """Punktaddition P + Q auf der elliptischen Kurve."""
     if P is INF:
@@ -2,6 +2,12 @@
 # Elliptische Kurve: Baby-Step-Tabelle generieren
 # ================================================
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod  # noqa: E402
+
 # Kurvenparameter: y^2 = x^3 + a*x + b (mod p)
 p = 43          # Primzahl (z.B. 43) oft auch GF(p)
 a = 22          # Parameter a (z.B. 22)
@@ -19,11 +25,6 @@ m = 8           # z.B. m = ceil(sqrt(n)) = 8 bei n = 53, wurzel von n aufgerunde
 INF = None  # Punkt im Unendlichen (neutrales Element)
 
 
-def inv_mod(x, p):
-    """Modulare Inverse von x modulo p (p prim)."""
-    return pow(x % p, -1, p)
-
-
 def point_add(P, Q, a, p):
     """
     Punktaddition P + Q auf der elliptischen Kurve y^2 = x^3 + a*x + b (mod p).
@@ -20,26 +20,12 @@ Beispiel:
     g = 3, a = 57, p = 113  →  3^x ≡ 57 (mod 113)
 """
 
+import sys
 from math import ceil, sqrt
+from pathlib import Path
 
-# ------------------------------------------------------------
-# 🧮 Hilfsfunktion: Modularer Inverser (für Division in mod p)
-# ------------------------------------------------------------
-def modinv(a, m):
-    """
-    Berechnet das Inverse von a modulo m (Erweiterter euklidischer Algorithmus).
-    Liefert ein u mit (a * u) % m == 1.
-    """
-    t, new_t = 0, 1
-    r, new_r = m, a % m
-    while new_r != 0:
-        q = r // new_r
-        t, new_t = new_t, t - q * new_t
-        r, new_r = new_r, r - q * new_r
-    if r != 1:
-        raise ValueError(f"Kein Inverses für {a} mod {m} (ggT ≠ 1)")
-    return t % m
-
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod as modinv  # noqa: E402
 
 # ------------------------------------------------------------
 # ⚙️ Hauptfunktion: Baby-Step Giant-Step Algorithmus
@@ -10,22 +10,12 @@
 #
 # The function returns an integer x in [0, order-1] such that g^x ≡ h (mod p), or None if no solution found.
 
+import sys
 from math import ceil, sqrt
+from pathlib import Path
 
-def egcd(a, b):
-    """Extended gcd. Returns (g, x, y) with g = gcd(a,b) and ax + by = g."""
-    if b == 0:
-        return (a, 1, 0)
-    else:
-        g, x1, y1 = egcd(b, a % b)
-        return (g, y1, x1 - (a // b) * y1)
-
-def modinv(a, m):
-    """Modular inverse of a mod m (works for general m if inverse exists)."""
-    g, x, _ = egcd(a, m)
-    if g != 1:
-        return None  # inverse does not exist
-    return x % m
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod_or_none  # noqa: E402
 
 def discrete_log_bsgs(g, h, p, order=None):
     """
@@ -53,15 +43,10 @@ def discrete_log_bsgs(g, h, p, order=None):
 
     # Compute factor = g^{-m} mod p
     g_m = pow(g, m, p)
-    try:
-        factor = pow(g_m, -1, p)  # modular inverse of g^m mod p (Python 3.8+)
-    except ValueError:
-        # fallback: use modinv (works for general modulus if inverse exists)
-        inv = modinv(g_m, p)
-        if inv is None:
-            # no inverse, algorithm fails for this modulus
-            return None
-        factor = inv
+    factor = inv_mod_or_none(g_m, p)  # modular inverse of g^m mod p
+    if factor is None:
+        # no inverse, algorithm fails for this modulus
+        return None
 
     # Giant steps: look for collision h * (g^{-m})^i in baby
     giant = h
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Batch-GCD (Bernstein / Heninger et al.): welche RSA-Moduli teilen sich
+eine Primzahl?
+
+Paarweise gcd(N_i, N_j) sind O(k^2) gcds. Stattdessen:
+1. Produktbaum: Blätter N_1..N_k, jeder Knoten ist das Produkt seiner
+   Kinder, die Wurzel P = N_1 * ... * N_k
+2. Restbaum von oben nach unten: R_Knoten = R_Eltern mod Knoten^2,
+   an den Blättern r_i = P mod N_i^2
+3. g_i = gcd(r_i / N_i, N_i) = gcd(N_i, Produkt aller anderen N_j)
+
+g_i > 1 heißt: N_i hat einen Primfaktor mit einem anderen Modulus gemeinsam.
+(g_i = N_i: beide Primfaktoren geteilt oder N_i doppelt, dann paarweise nachsehen.)
+
+Aufwand: Baumtiefe log k, pro Ebene nur Multiplikationen und Divisionen
+großer Zahlen, also quasi-linear bei schneller Multiplikation (mit
+CPythons Karatsuba O(n^1.58) statt der O(k^2) gcds). Pythons eigene
+Division ist bis 3.11 schulbuchmäßig quadratisch, daher die rekursive
+Division nach Burnikel–Ziegler in mod(). Optional werden die Knoten einer
+Ebene auf mehrere Prozesse verteilt.
+"""
+
+import math
+import random
+import sys
+from multiprocessing import Pool
+from pathlib import Path
+
+# -------------------------------------------------------------
+# HIER ANPASSEN:
+datei = "moduli.txt"  # <- ein Modulus pro Zeile (dezimal oder 0x-hex); fehlt die Datei: Demo
+workers = 1  # <- Prozesse für die Baum-Ebenen (1 = alles im aktuellen Prozess)
+
+PARALLEL_MIN_NODES = 8  # kleinere Ebenen lohnen das Verschicken an Prozesse nicht
+DIV_LIMIT = 4000  # Bits, darunter rechnet Pythons % direkt
+
+
+def read_moduli(path):
+    """Generator over the moduli in a text file, Zeile für Zeile gelesen."""
+    with open(path, encoding="ascii") as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                yield int(line, 0)
+
+
+# ---------- schnelle Division (Burnikel–Ziegler) ----------
+
+def _div2n1n(a, b, n):
+    """divmod(a, b) for a < b * 2^n and b with n bits."""
+    if a.bit_length() - n <= DIV_LIMIT:
+        return divmod(a, b)
+    pad = n & 1
+    if pad:
+        a, b, n = a << 1, b << 1, n + 1
+    half = n >> 1
+    mask = (1 << half) - 1
+    b1, b2 = b >> half, b & mask
+    q1, r = _div3n2n(a >> n, (a >> half) & mask, b, b1, b2, half)
+    q2, r = _div3n2n(r, a & mask, b, b1, b2, half)
+    if pad:
+        r >>= 1
+    return q1 << half | q2, r
+
+
+def _div3n2n(a12, a3, b, b1, b2, n):
+    if a12 >> n == b1:
+        q, r = (1 << n) - 1, a12 - (b1 << n) + b1
+    else:
+        q, r = _div2n1n(a12, b1, n)
+    r = (r << n | a3) - q * b2
+    while r < 0:
+        q -= 1
+        r += b
+    return q, r
+
+
+def mod(a: int, b: int) -> int:
+    """a % b for a >= 0, b > 0, subquadratisch für große Zahlen."""
+    n = b.bit_length()
+    if n <= DIV_LIMIT or a.bit_length() - n <= DIV_LIMIT:
+        return a % b
+    # a in Blöcke zu n Bits zerlegen, von oben nach unten dividieren
+    blocks = []
+    mask = (1 << n) - 1
+    while a:
+        blocks.append(a & mask)
+        a >>= n
+    r = 0
+    for block in reversed(blocks):
+        _, r = _div2n1n(r << n | block, b, n)
+    return r
+
+
+def _mul_pair(pair):
+    a, b = pair
+    return a * b
+
+
+def _mod_square(args):
+    r, node = args
+    return mod(r, node * node)
+
+
+def _mod_node(args):
+    r, node = args
+    return mod(r, node)
+
+
+def _map(pool, fn, items, workers: int = 1):
+    """fn over items, auf dem Pool in etwa 4 Stücken pro Prozess (workers = Poolgröße)."""
+    if pool is None or len(items) < PARALLEL_MIN_NODES:
+        return [fn(item) for item in items]
+    return pool.map(fn, items, chunksize=max(1, len(items) // (4 * workers)))
+
+
+def product_tree(moduli, pool=None, workers: int = 1):
+    """
+    Levels of the product tree, levels[0] = moduli, levels[-1] = [P].
+    pool = multiprocessing.Pool mit workers Prozessen (oder None).
+    """
+    levels = [list(moduli)]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        pairs = [(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        nxt = _map(pool, _mul_pair, pairs, workers)
+        if len(level) % 2:
+            nxt.append(level[-1])
+        levels.append(nxt)
+    return levels
+
+
+def remainder_tree(levels, pool=None, value=None, square=True, workers: int = 1):
+    """
+    value mod N_i^2 for every leaf, von der Wurzel nach unten.
+    value = None: P selbst; square = False: value mod N_i.
+    pool/workers wie bei product_tree.
+    """
+    fn = _mod_square if square else _mod_node
+    root = levels[-1][0]
+    if value is None:
+        rems = [root]
+    else:
+        rems = [mod(value, root * root if square else root)]
+    for level in reversed(levels[:-1]):
+        rems = _map(pool, fn, [(rems[i // 2], node) for i, node in enumerate(level)], workers)
+    return rems
+
+
+def batch_gcd(moduli, workers: int = 1):
+    """g_i = gcd(N_i, prod_{j != i} N_j) for every modulus."""
+    moduli = list(moduli)
+    if not moduli:
+        return []
+    pool = Pool(workers) if workers > 1 else None
+    try:
+        levels = product_tree(moduli, pool, workers)
+        rems = remainder_tree(levels, pool, workers=workers)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return [math.gcd(r // N, N) for r, N in zip(rems, moduli)]
+
+
+def shared_factors(moduli, workers: int = 1):
+    """
+    Moduli with a nontrivial shared factor.
+    Returns a list of (index, N, g) with g = gcd(N, Produkt der anderen) > 1.
+    """
+    moduli = list(moduli)
+    return [(i, N, g) for i, (N, g) in enumerate(zip(moduli, batch_gcd(moduli, workers)))
+            if g > 1]
+
+
+def _demo_moduli(count: int = 500, bits: int = 256, shared: int = 5, seed: int = 1):
+    """Random RSA moduli; `shared` Paare teilen sich eine Primzahl."""
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Primzahltest"))
+    from primzahltest import is_prime
+
+    rng = random.Random(seed)
+
+    def prime():
+        while True:
+            p = rng.getrandbits(bits // 2) | (1 << (bits // 2 - 1)) | 1
+            if is_prime(p):
+                return p
+
+    moduli = [prime() * prime() for _ in range(count)]
+    for k in range(shared):
+        p = prime()
+        moduli[2 * k] = p * prime()
+        moduli[count - 1 - 2 * k] = p * prime()
+    return moduli
+
+
+# -------------------------------------------------------------
+# Läuft als Skript:
+if __name__ == "__main__":
+    import time
+
+    if Path(datei).exists():
+        moduli = list(read_moduli(datei))
+        print(f"{len(moduli)} Moduli aus {datei}")
+    else:
+        moduli = _demo_moduli()
+        print(f"{datei} fehlt: Demo mit {len(moduli)} zufälligen Moduli")
+
+    start = time.perf_counter()
+    found = shared_factors(moduli, workers)
+    print(f"Batch-GCD: {time.perf_counter() - start:.2f} s, {len(found)} Moduli mit gemeinsamem Faktor")
+    for i, N, g in found:
+        if g == N:
+            print(f"  #{i}: N = {N} (alle Faktoren geteilt, paarweise prüfen)")
+        else:
+            print(f"  #{i}: N = {N}\n        p = {g}, q = {N // g}")
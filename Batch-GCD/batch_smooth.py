@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Batch-Glattheitstest (Bernstein, "How to find smooth parts of integers").
+
+Statt jeden Kandidaten einzeln durch die Faktorbasis zu dividieren:
+1. P = Produkt aller Primzahlen der Faktorbasis (einmal, per Produktbaum)
+2. Produktbaum über die Kandidaten x_1..x_k, Restbaum: y_i = P mod x_i
+3. z_i = y_i^(2^e) mod x_i mit 2^e >= log2(x_i)
+   -> gcd(x_i, z_i) = gcd(x_i, P^(2^e)) ist der glatte Teil von x_i
+      (jeder Primfaktor aus P kommt in x_i höchstens log2(x_i)-mal vor)
+4. x_i glatt  <=>  glatter Teil = x_i; nur diese werden noch zerlegt
+
+Die Zerlegung der glatten Kandidaten läuft über ihr Radikal gcd(x_i, y_i):
+sobald alle Primteiler gefunden sind, bricht die Probedivision ab.
+
+smooth_parts(values, P)        glatter Teil jedes |v| (Rest = |v| / Teil)
+batch_smooth(values, primes)   [(i, {p: e})] für die glatten Werte
+"""
+
+import math
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from batch_gcd import product_tree, remainder_tree  # noqa: E402
+
+# -------------------------------------------------------------
+# HIER ANPASSEN:
+B = 1000  # <- Faktorbasis: alle Primzahlen <= B
+count = 5000  # <- Anzahl zufälliger Kandidaten für die Demo
+bits = 40  # <- Größe der Kandidaten
+
+
+def prime_product(primes) -> int:
+    """Product of the factor base (Produktbaum statt Schleife)."""
+    primes = [p for p in primes if p > 1]
+    return product_tree(primes)[-1][0] if primes else 1
+
+
+def smooth_parts(values, P: int, pool=None, workers: int = 1):
+    """
+    Largest divisor of |v| built from the primes of P, for every v.
+    v = 0 ergibt 0 (kein sinnvoller glatter Teil).
+    pool = multiprocessing.Pool mit workers Prozessen (oder None).
+    """
+    xs = [abs(v) for v in values]
+    nonzero = [x for x in xs if x]
+    if not nonzero:
+        return [0] * len(xs)
+    rems = iter(remainder_tree(product_tree(nonzero, pool, workers), pool, value=P,
+                               square=False, workers=workers))
+    parts = []
+    for x in xs:
+        if x == 0:
+            parts.append(0)
+            continue
+        y = next(rems)
+        e = max(1, (x.bit_length() - 1).bit_length())
+        parts.append(math.gcd(x, pow(y, 1 << e, x)))
+    return parts
+
+
+def smooth_factors(x: int, primes, radical: int | None = None):
+    """
+    {p: e} of the smooth |x| over primes (Probedivision, aber nur bis alle
+    Primteiler des Radikals gefunden sind).
+    """
+    x = abs(x)
+    if radical is None:
+        radical = math.gcd(x, prime_product(primes))
+    factors = {}
+    for p in primes:
+        if radical == 1:
+            break
+        if p < 2 or radical % p:
+            continue
+        radical //= p
+        e = 0
+        while x % p == 0:
+            x //= p
+            e += 1
+        factors[p] = e
+    return factors
+
+
+def batch_smooth(values, primes, P: int | None = None, pool=None, workers: int = 1):
+    """
+    Smooth values among `values` with their factorisations.
+    Returns [(i, {p: e})] for every nonzero v whose |v| only has primes
+    from `primes` (das Vorzeichen bleibt beim Aufrufer).
+    P = prime_product(primes), wenn schon vorhanden.
+    """
+    values = list(values)
+    if P is None:
+        P = prime_product(primes)
+    result = []
+    for i, (v, s) in enumerate(zip(values, smooth_parts(values, P, pool, workers))):
+        if v and s == abs(v):
+            result.append((i, smooth_factors(v, primes, math.gcd(s, P))))
+    return result
+
+
+# -------------------------------------------------------------
+# Läuft als Skript:
+if __name__ == "__main__":
+    import time
+
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Primzahlsieb"))
+    from primzahlsieb import primes_up_to
+
+    primes = primes_up_to(B)
+    rng = random.Random(1)
+    values = [rng.getrandbits(bits) | 1 for _ in range(count)]
+
+    start = time.perf_counter()
+    found = batch_smooth(values, primes)
+    t_batch = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = []
+    for i, v in enumerate(values):
+        m, f = v, {}
+        for p in primes:
+            while m % p == 0:
+                m //= p
+                f[p] = f.get(p, 0) + 1
+        if m == 1:
+            single.append((i, f))
+    t_single = time.perf_counter() - start
+
+    print(f"{len(found)} von {count} Kandidaten sind {B}-glatt")
+    print(f"Batch: {t_batch:.3f} s, einzeln: {t_single:.3f} s, gleich: {found == single}")
+    for i, f in found[:5]:
+        print(f"  {values[i]} = " + " * ".join(f"{p}^{e}" if e > 1 else str(p) for p, e in f.items()))
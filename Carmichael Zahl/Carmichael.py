@@ -1,31 +1,20 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Faktorisierung"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Primzahltest"))
+from faktorisierung import factor  # noqa: E402
+from primzahltest import is_prime  # noqa: E402
+
+
 def ist_primzahl(n):
-    """Prüft ob n eine Primzahl ist"""
-    if n < 2:
-        return False
-    if n == 2:
-        return True
-    if n % 2 == 0:
-        return False
-    for i in range(3, int(n ** 0.5) + 1, 2):
-        if n % i == 0:
-            return False
-    return True
+    """Prüft ob n eine Primzahl ist (Miller–Rabin / BPSW statt Probedivision)"""
+    return is_prime(n)
 
 
 def primfaktoren(n):
     """Gibt die Liste der eindeutigen Primfaktoren zurück"""
-    faktoren = []
-    d = 2
-    temp_n = n
-    while d * d <= temp_n:
-        if temp_n % d == 0:
-            faktoren.append(d)
-            while temp_n % d == 0:
-                temp_n //= d
-        d += 1
-    if temp_n > 1:
-        faktoren.append(temp_n)
-    return faktoren
+    return list(factor(n))
 
 
 def ist_quadratfrei(n, faktoren):
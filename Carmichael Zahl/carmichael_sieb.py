@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Alle Carmichael-Zahlen bis N aufzählen.
+
+Korselt: n ist Carmichael-Zahl <=> n zusammengesetzt, quadratfrei und
+(p - 1) | (n - 1) für jeden Primteiler p.
+
+Ein Sieb mit Korselt-Test für jede einzelne Zahl (korselt_sieve, unten als
+Referenz) braucht in Python für N = 10^10 Stunden. Stattdessen wird
+Korselt direkt zum Aufzählen benutzt:
+- n = p_1 * ... * p_k mit p_1 < ... < p_k, M = p_1 * ... * p_(k-1),
+  L = kgV(p_i - 1)
+- kein p_i teilt p_j - 1 (sonst p_i | n - 1), also neue Primzahl q nur,
+  wenn ggT(M, q - 1) = 1
+- die größte Primzahl P ist durch M festgelegt bis auf
+  P ≡ M^(-1) (mod L) und (P - 1) | (M - 1), also P <= M und P <= sqrt(N):
+  Primtest per Nachschlagen im Sieb bis sqrt(N)
+Gesucht wird per Tiefensuche über M; die Teilbäume ab den ersten beiden
+Primzahlen sind unabhängig und werden auf einen Prozess-Pool verteilt.
+Die meisten Teilbäume sind winzig, daher bekommt jeder Prozess nur wenige
+große Pakete (reihum verteilt, weil die Teilbäume kleiner Primzahlen am
+größten sind); unter PARALLEL_MIN rechnet alles im aktuellen Prozess.
+N = 10^10 (1547 Zahlen) dauert so wenige Sekunden.
+"""
+
+import math
+import sys
+from array import array
+from multiprocessing import Pool
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Primzahlsieb"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod  # noqa: E402
+from primzahlsieb import primes_up_to  # noqa: E402
+
+# -------------------------------------------------------------
+# HIER ANPASSEN:
+N = 10 ** 10  # <- alle Carmichael-Zahlen bis hier
+workers = 1  # <- Prozesse (1 = ohne Pool)
+
+PARALLEL_MIN = 10 ** 9  # darunter (< 0.5 s seriell) lohnt der Pool nicht: Start + Versand
+BATCHES_PER_WORKER = 4  # Pakete pro Prozess, für den Ausgleich ungleicher Teilbäume
+
+# Zustand der Worker (einmal pro Prozess aufgebaut)
+_N = None
+_primes = []
+_is_prime = bytearray()
+
+
+def _setup(limit: int):
+    """Odd primes <= sqrt(limit) as list and lookup table."""
+    global _N, _primes, _is_prime
+    r = math.isqrt(limit)
+    _N = limit
+    _primes = [p for p in primes_up_to(r) if p > 2]
+    _is_prime = bytearray(r + 1)
+    for p in _primes:
+        _is_prime[p] = 1
+
+
+def _search(M: int, L: int, i: int, k: int, out):
+    """Carmichael numbers M * ... <= _N whose next prime is _primes[i] or later."""
+    pmax = _primes[i - 1]
+    if k >= 2:
+        # letzte (größte) Primzahl P: P ≡ M^-1 (mod L), (P - 1) | (M - 1)
+        hi = min(M, _N // M)
+        if hi > pmax:
+            P = inv_mod(M, L)
+            if P <= pmax:
+                P += (pmax - P) // L * L + L
+            while P <= hi:
+                if _is_prime[P] and (M - 1) % (P - 1) == 0:
+                    out.append(M * P)
+                P += L
+    for j in range(i, len(_primes)):
+        q = _primes[j]
+        if M * q * (q + 2) > _N:
+            break
+        if math.gcd(M, q - 1) != 1:
+            continue
+        _search(M * q, L * (q - 1) // math.gcd(L, q - 1), j + 1, k + 1, out)
+
+
+def _subtree(task):
+    """Sorted Carmichael numbers whose two smallest primes are given by task."""
+    i, j = task
+    p, q = _primes[i], _primes[j]
+    out = []
+    _search(p * q, (p - 1) * (q - 1) // math.gcd(p - 1, q - 1), j + 1, 2, out)
+    return sorted(out)
+
+
+def _subtrees(batch):
+    """Carmichael numbers of several subtrees (one pool task)."""
+    out = []
+    for task in batch:
+        out.extend(_subtree(task))
+    return out
+
+
+def _tasks():
+    """(i, j) for every start p_i < p_j with p_i ∤ p_j - 1 and room for a third prime."""
+    for i, p in enumerate(_primes):
+        if p * p * p > _N:
+            break
+        for j in range(i + 1, len(_primes)):
+            q = _primes[j]
+            if p * q * (q + 2) > _N:
+                break
+            if (q - 1) % p:
+                yield i, j
+
+
+def iter_carmichael(limit: int, workers: int = 1):
+    """
+    Generator over the Carmichael numbers <= limit, Teilbaum für Teilbaum
+    (innerhalb eines Teilbaums aufsteigend, insgesamt nicht sortiert).
+    """
+    _setup(limit)
+    if workers <= 1 or limit < PARALLEL_MIN:
+        for task in _tasks():
+            yield from _subtree(task)
+        return
+    tasks = list(_tasks())
+    count = min(len(tasks), BATCHES_PER_WORKER * workers)
+    batches = [tasks[k::count] for k in range(count)]
+    with Pool(workers, initializer=_setup, initargs=(limit,)) as pool:
+        for found in pool.imap_unordered(_subtrees, batches):
+            yield from found
+
+
+def carmichael_numbers(limit: int, workers: int = 1):
+    """Sorted list of all Carmichael numbers <= limit."""
+    return sorted(iter_carmichael(limit, workers))
+
+
+def korselt_sieve(lo: int, hi: int):
+    """
+    Carmichael numbers in [lo, hi) per segmentiertem Sieb (langsame Referenz):
+    rest[i] wird durch jede Primzahl p <= sqrt(hi) geteilt, die lo + i teilt,
+    dabei werden p^2 | n und (p - 1) ∤ (n - 1) markiert. Die Primteiler einer
+    Carmichael-Zahl liegen alle unter sqrt(n), also muss rest = 1 übrig bleiben.
+    """
+    size = hi - lo
+    rest = array("Q", range(lo, hi))
+    ok = bytearray([1]) * size
+    count = bytearray(size)
+    for p in primes_up_to(math.isqrt(hi - 1)):
+        if p == 2:
+            continue
+        for i in range((-lo) % p, size, p):
+            r = rest[i] // p
+            if r % p == 0 or (lo + i - 1) % (p - 1):
+                ok[i] = 0
+            rest[i] = r
+            count[i] += 1
+    return [lo + i for i in range(size)
+            if ok[i] and rest[i] == 1 and count[i] >= 3 and (lo + i) % 2]
+
+
+# -------------------------------------------------------------
+# Läuft als Skript:
+if __name__ == "__main__":
+    import time
+
+    ref = korselt_sieve(2, 10 ** 6)
+    print(f"Referenz-Sieb bis 10^6: {len(ref)} Zahlen, gleich: {carmichael_numbers(10 ** 6) == ref}")
+
+    start = time.perf_counter()
+    found = carmichael_numbers(N, workers)
+    print(f"{len(found)} Carmichael-Zahlen <= {N} ({time.perf_counter() - start:.2f} s)")
+    print("erste:", found[:10])
+    print("letzte:", found[-3:])
@@ -2,7 +2,12 @@
 # CRT (Chinesischer Restsatz) – für 3 (oder mehr) Gleichungen
 # ============================================================
 
+import sys
 from math import gcd
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod_or_none as inv_mod  # noqa: E402
 
 # ------------------- HIER ANPASSEN --------------------------
 # Beispiel mit 3 Kongruenzen:
@@ -15,19 +20,6 @@ verbose = True
 # ------------------------------------------------------------
 
 
-def egcd(a, b):
-    if b == 0:
-        return a, 1, 0
-    g, x1, y1 = egcd(b, a % b)
-    return g, y1, x1 - (a // b) * y1
-
-def inv_mod(a, m):
-    a %= m
-    g, x, _ = egcd(a, m)
-    if g != 1:
-        return None
-    return x % m
-
 def crt_pair(a1, m1, a2, m2, verbose=True):
     """
     Kombiniert:
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+CRT über einen Produktbaum, für Hunderte bis Tausende Moduli.
+
+crt() faltet von links: x ≡ a (mod m_0 m_1 ... m_i) wächst Schritt für
+Schritt, jeder Schritt multipliziert und invertiert mit dem ganzen
+bisherigen Modul -> O(k^2) Operationen mit großen Zahlen.
+
+Teilerfremde Moduli (Test per Batch-GCD, Batch-GCD/batch_gcd.py):
+1. Produktbaum der m_i, Wurzel M
+2. Restbaum: M mod m_i^2, geteilt durch m_i ergibt (M/m_i) mod m_i
+3. c_i = a_i * ((M/m_i) mod m_i)^(-1) mod m_i   (nur kleine Inverse)
+4. x = Σ c_i * M/m_i von unten nach oben: Knoten = links * Produkt(rechts)
+   + rechts * Produkt(links)
+Alles nur Multiplikationen und Divisionen im Baum, also quasi-linear.
+
+Nicht teilerfremde Moduli: paarweise wie crt_pair (g = ggT, Konsistenz
+(a2 - a1) ≡ 0 mod g, Reduktion auf m1/g, m2/g), aber als Baum
+(Paare, dann Paare von Paaren) statt von links gefaltet.
+"""
+
+import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Batch-GCD"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from batch_gcd import product_tree, remainder_tree  # noqa: E402
+from modarith import inv_mod  # noqa: E402
+
+# ------------------- HIER ANPASSEN --------------------------
+a_list = [2, 3, 2, 11]
+m_list = [3, 5, 7, 12]  # <- dürfen gemeinsame Teiler haben (hier 3 und 12)
+k = 2000  # <- Anzahl Primzahlmoduli für den Zeitvergleich
+# ------------------------------------------------------------
+
+
+def combine(a1, m1, a2, m2):
+    """
+    x ≡ a1 (mod m1), x ≡ a2 (mod m2) -> (x, kgV) oder None (wie crt_pair,
+    ohne Ausgabe und mit inv_mod statt rekursivem egcd).
+    """
+    g = math.gcd(m1, m2)
+    if (a2 - a1) % g:
+        return None
+    m1p, m2p = m1 // g, m2 // g
+    t = (a2 - a1) // g * inv_mod(m1p, m2p) % m2p if m2p > 1 else 0
+    lcm = m1 * m2p
+    return (a1 + m1 * t) % lcm, lcm
+
+
+def _crt_coprime(a_list, m_list, levels, cofactors):
+    """Product-tree CRT for pairwise coprime moduli, cofactors[i] = (M / m_i) mod m_i."""
+    values = [a * inv_mod(q, m) % m if m > 1 else 0
+              for a, m, q in zip(a_list, m_list, cofactors)]
+    for level in levels[:-1]:
+        nxt = [values[i] * level[i + 1] + values[i + 1] * level[i]
+               for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            nxt.append(values[-1])
+        values = nxt
+    M = levels[-1][0]
+    return values[0] % M, M
+
+
+def crt_tree(a_list, m_list):
+    """
+    Löse x ≡ a_i (mod m_i) für alle i.
+    Rückgabe: (x, M) mit M = kgV der m_i, oder None wenn unlösbar.
+    """
+    if len(a_list) != len(m_list) or len(a_list) == 0:
+        raise ValueError("Listen müssen gleich lang und nicht leer sein.")
+    if min(m_list) < 1:
+        raise ValueError("Moduli müssen positiv sein.")
+    a_list = [a % m for a, m in zip(a_list, m_list)]
+
+    # Batch-GCD: ggT(m_i, M / m_i) = 1 für alle i <=> paarweise teilerfremd
+    levels = product_tree(m_list)
+    cofactors = [r // m for r, m in zip(remainder_tree(levels), m_list)]
+    if all(math.gcd(q, m) == 1 for q, m in zip(cofactors, m_list)):
+        return _crt_coprime(a_list, m_list, levels, cofactors)
+
+    # gemeinsame Teiler: Paare, dann Paare von Paaren
+    pairs = list(zip(a_list, m_list))
+    while len(pairs) > 1:
+        nxt = []
+        for i in range(0, len(pairs) - 1, 2):
+            res = combine(*pairs[i], *pairs[i + 1])
+            if res is None:
+                return None
+            nxt.append(res)
+        if len(pairs) % 2:
+            nxt.append(pairs[-1])
+        pairs = nxt
+    return pairs[0]
+
+
+# -------------------------------------------------------------
+# Läuft als Skript:
+if __name__ == "__main__":
+    import random
+    import time
+
+    from ChinesischerRestsatz2Gleichungen import crt
+
+    sol = crt_tree(a_list, m_list)
+    if sol is None:
+        print("❌ Keine Lösung.")
+    else:
+        x, M = sol
+        print(f"x ≡ {x} (mod {M})")
+        print("Kontrolle:", all((x - a) % m == 0 for a, m in zip(a_list, m_list)))
+
+    # Vergleich mit crt(): k Primzahlen um 2^31
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Primzahlsieb"))
+    from primzahlsieb import primes_between
+
+    primes = []
+    for p in primes_between(1 << 31, (1 << 31) + 100 * k):
+        primes.append(p)
+        if len(primes) == k:
+            break
+    rng = random.Random(1)
+    residues = [rng.randrange(p) for p in primes]
+
+    start = time.perf_counter()
+    fold = crt(residues, primes, verbose=False)
+    t_fold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tree = crt_tree(residues, primes)
+    t_tree = time.perf_counter() - start
+    print(f"{k} Moduli: crt() {t_fold:.2f} s, Baum {t_tree:.2f} s, gleich: {fold == tree}")
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+CRT nach Garner für viele Restvektoren mit denselben Moduli.
+
+crt() in ChinesischerRestsatz2Gleichungen.py faltet die Moduli paarweise
+und berechnet dabei jedes Mal Inverse neu. Bei festen, paarweise
+teilerfremden Moduli m_0, ..., m_(k-1) hängen die Inversen aber nur von
+den Moduli ab:
+
+    C_j = (m_0 * ... * m_(j-1))^(-1) mod m_j      (einmal in CRTContext)
+
+Pro Restvektor r dann die Ziffern der gemischten Basis
+    v_0 = r_0 mod m_0
+    v_j = (r_j - (v_0 + v_1 m_0 + ... + v_(j-1) m_0...m_(j-2))) * C_j  mod m_j
+und x = v_0 + v_1 m_0 + v_2 m_0 m_1 + ...
+Das sind O(k^2) Multiplikationen kleiner Zahlen, keine Inversen.
+reconstruct_many rechnet die Ziffern mit NumPy für alle Vektoren
+gleichzeitig (Moduli < 2^32, damit die Produkte in uint64 passen).
+"""
+
+import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod  # noqa: E402
+
+# Optional für reconstruct_many
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# ------------------- HIER ANPASSEN --------------------------
+moduli = [97, 103, 107, 109]
+residues = [30, 16, 5, 77]
+count = 100000  # <- Anzahl zufälliger Restvektoren für den Zeitvergleich
+# ------------------------------------------------------------
+
+
+class CRTContext:
+    """
+    Garner-Konstanten für feste, paarweise teilerfremde Moduli.
+    reconstruct(r) -> x mit x ≡ r_i (mod m_i), 0 <= x < M
+    """
+
+    def __init__(self, moduli):
+        self.moduli = [int(m) for m in moduli]
+        if not self.moduli or min(self.moduli) < 1:
+            raise ValueError("Moduli müssen positiv und nicht leer sein.")
+        self.M = math.prod(self.moduli)
+        self.constants = [0]
+        prefix = self.moduli[0]
+        for m in self.moduli[1:]:
+            if math.gcd(prefix, m) != 1:
+                raise ValueError(f"Modul {m} ist nicht teilerfremd zu den vorherigen")
+            self.constants.append(inv_mod(prefix, m) if m > 1 else 0)
+            prefix *= m
+
+    def digits(self, residues):
+        """Mixed-radix digits v_0, ..., v_(k-1) of the solution."""
+        if len(residues) != len(self.moduli):
+            raise ValueError("Anzahl Reste und Moduli verschieden.")
+        m = self.moduli
+        v = [residues[0] % m[0]]
+        for j in range(1, len(m)):
+            mj = m[j]
+            t = v[j - 1]
+            for i in range(j - 2, -1, -1):
+                t = (t * m[i] + v[i]) % mj
+            v.append((residues[j] - t) * self.constants[j] % mj)
+        return v
+
+    def reconstruct(self, residues) -> int:
+        """Smallest x >= 0 with x ≡ residues[i] (mod moduli[i])."""
+        v = self.digits(residues)
+        x = v[-1]
+        for j in range(len(v) - 2, -1, -1):
+            x = x * self.moduli[j] + v[j]
+        return x
+
+    def reconstruct_many(self, residues):
+        """
+        reconstruct für viele Vektoren: residues als Liste von Vektoren oder
+        Array der Form (Anzahl, k). Mit NumPy (und Moduli < 2^32)
+        vektorisiert über alle Vektoren, sonst eine Schleife.
+        Returns a list of ints.
+        """
+        if np is None or max(self.moduli) >= 1 << 32:
+            return [self.reconstruct(r) for r in residues]
+        try:
+            r = np.asarray(residues, dtype=np.int64).reshape(-1, len(self.moduli))
+        except OverflowError:
+            return [self.reconstruct(r) for r in residues]
+        m = [np.uint64(mj) for mj in self.moduli]
+        v = [(r[:, 0] % self.moduli[0]).astype(np.uint64)]
+        for j in range(1, len(m)):
+            t = v[j - 1] % m[j]
+            for i in range(j - 2, -1, -1):
+                # t < m_j, v_i < m_i: t * m_i + v_i < 2^64
+                t = (t * m[i] + v[i]) % m[j]
+            rj = (r[:, j] % self.moduli[j]).astype(np.uint64)
+            v.append((rj + m[j] - t) % m[j] * np.uint64(self.constants[j]) % m[j])
+        # Ziffern zur ganzen Zahl zusammensetzen (Python-ints, dtype=object)
+        x = v[-1].astype(object)
+        for j in range(len(v) - 2, -1, -1):
+            x = x * self.moduli[j] + v[j].astype(object)
+        return x.tolist()
+
+
+# -------------------------------------------------------------
+# Läuft als Skript:
+if __name__ == "__main__":
+    import random
+    import time
+
+    from ChinesischerRestsatz2Gleichungen import crt
+
+    ctx = CRTContext(moduli)
+    x = ctx.reconstruct(residues)
+    print(f"x ≡ {x} (mod {ctx.M})")
+    print("Kontrolle:", all(x % m == r % m for r, m in zip(residues, moduli)))
+
+    rng = random.Random(1)
+    batch = [[rng.randrange(m) for m in moduli] for _ in range(count)]
+
+    start = time.perf_counter()
+    fold = [crt(r, moduli, verbose=False)[0] for r in batch]
+    t_fold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    garner = ctx.reconstruct_many(batch)
+    t_garner = time.perf_counter() - start
+
+    print(f"{count} Vektoren: crt() {t_fold:.2f} s, Garner {t_garner:.2f} s, gleich: {fold == garner}")
@@ -4,24 +4,14 @@ Berechnet den gemeinsamen Schlüssel basierend auf der elliptischen Kurve
 oder modularer Arithmetik
 """
 
+import sys
+from pathlib import Path
 
-def gcd(a, b):
-    """Berechnet den größten gemeinsamen Teiler"""
-    while b:
-        a, b = b, a % b
-    return a
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Primzahltest"))
+from primzahltest import is_prime  # noqa: E402
 
-
-def mod_inverse(a, m):
-    """Berechnet das modulare Inverse von a mod m"""
-    if gcd(a, m) != 1:
-        return None
-    u1, u2, u3 = 1, 0, a
-    v1, v2, v3 = 0, 1, m
-    while v3 != 0:
-        q = u3 // v3
-        v1, v2, v3, u1, u2, u3 = (u1 - q * v1), (u2 - q * v2), (u3 - q * v3), v1, v2, v3
-    return u1 % m
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod_or_none as mod_inverse  # noqa: E402
 
 
 def point_add(P, Q, a, p):
@@ -198,6 +188,11 @@ def diffie_hellman_ec(P, a, b, p, kA, kB):
     print(f"Primzahl p = {p}")
     print(f"Basispunkt P = {P}")
 
+    # Überprüfe ob p prim ist (sonst ist GF(p) kein Körper)
+    if not is_prime(p):
+        print(f"\nFEHLER: p = {p} ist keine Primzahl!")
+        return None
+
     # Überprüfe ob P auf der Kurve liegt
     if not verify_point_on_curve(P, a, b, p):
         print("\nFEHLER: Punkt P liegt nicht auf der Kurve!")
@@ -1,5 +1,14 @@
 # Diffie-Hellman „Allround“-Skript (mit vollständigen Zwischenschritten)
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Primzahltest"))
+from primzahltest import is_prime  # noqa: E402
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import egcd  # noqa: E402
+
 VERBOSE = True   # <--- Zwischenschritte anzeigen (True/False)
 
 def log(msg):
@@ -35,16 +44,6 @@ def discrete_log_bruteforce(g, value, p, max_exp=None):
     return None
 
 
-def egcd(a, b):
-    """Erweiterter euklidischer Algorithmus (mit optionalen Zwischenschritten)."""
-    if b == 0:
-        return a, 1, 0
-    g, x1, y1 = egcd(b, a % b)
-    x = y1
-    y = x1 - (a // b) * y1
-    return g, x, y
-
-
 def modinv(a, m):
     """Multiplikatives Inverses von a modulo m (zeigt Zwischenschritte)."""
     log(f"\n[ModInv] Berechne Inverses von {a} mod {m}")
@@ -80,6 +79,9 @@ def main():
     if p is None or g is None:
         print("\n❌ Du musst mindestens p und g eingeben.")
         return
+    if not is_prime(p):
+        print(f"\n❌ p = {p} ist keine Primzahl.")
+        return
 
     ord_g = p - 1
 
@@ -1,11 +1,18 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import egcd, inv_mod  # noqa: E402
+
 # Eingaben
 p = 467                 # sichere Primzahl
 g = 464                 # Beispiel-Erzeuger (optional, für K irrelevant)
 unknown = "b"           # "a" oder "b": welches möchtest du berechnen?
 known_value = 99        # der bekannte Wert (a oder b)
 
-# Erweiterter euklidischer Algorithmus MIT Zwischenschritten
-def extended_euclid(a, b):
+# Zwischenschritte des erweiterten euklidischen Algorithmus (nur Ausgabe,
+# gerechnet wird mit egcd / inv_mod aus Modulare Arithmetik/modarith.py)
+def show_euclid_steps(a, b):
     print(f"Starte erweiterten euklidischen Algorithmus für a={a}, b={b}\n")
 
     old_r, r = a, b
@@ -36,10 +43,6 @@ def extended_euclid(a, b):
         step += 1
 
     print("Algorithmus beendet.\n")
-    print(f"ggT = {old_r}")
-    print(f"Koeffizienten: s = {old_s}, t = {old_t}\n")
-
-    return old_r, old_s, old_t
 
 
 # Ordnung der Gruppe Z*_p ist p-1
@@ -47,7 +50,10 @@ modulus = p - 1
 print(f"Modulus (p-1) = {modulus}\n")
 
 # Berechne modulare Inverse mit Zwischenschritten
-gcd, s, t = extended_euclid(known_value, modulus)
+show_euclid_steps(known_value, modulus)
+gcd, s, t = egcd(known_value, modulus)
+print(f"ggT = {gcd}")
+print(f"Koeffizienten: s = {s}, t = {t}\n")
 
 # Zusätzliche Erklärung, wie man auf s,t und b kommt
 print("Nachweis (Bézout-Gleichung):")
@@ -56,11 +62,9 @@ print(f"  => ggT({known_value}, {modulus}) = {gcd}\n")
 
 print("In Pari GP: lift(Mod(99, 466)^(-1)): 466 = p-1 / 99 = a oder b\n")
 
-if gcd != 1:
-    raise ValueError("Keine Inverse vorhanden (ggT != 1)!")
-
-# s ist die Inverse modulo modulus (aber evtl. negativ -> mod nehmen)
-inverse = s % modulus
+# s ist die Inverse modulo modulus (aber evtl. negativ -> mod nehmen);
+# inv_mod wirft ValueError, wenn ggT != 1
+inverse = inv_mod(known_value, modulus)
 
 print("Modulo-Schritt:")
 print(f"  {known_value}*{s} ≡ 1 (mod {modulus})")
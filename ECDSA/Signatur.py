@@ -4,6 +4,12 @@
 # E: y^2 = x^3 + a*x + b (mod p)
 # ============================================
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+import modarith  # noqa: E402
+
 # --- HIER ANPASSEN ---
 p = 49037
 a = 11784
@@ -19,7 +25,7 @@ def inv_mod(x, p):
     x %= p
     if x == 0:
         raise ZeroDivisionError("Kein Inverses für 0 mod p.")
-    return pow(x, p - 2, p)
+    return modarith.inv_mod(x, p)
 
 def ec_add(P, Q):
     """P + Q auf der Kurve. None = Punkt im Unendlichen."""
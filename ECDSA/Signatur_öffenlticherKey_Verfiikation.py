@@ -3,6 +3,12 @@
 # Kurve: y^2 = x^3 + a*x + b (mod p)
 # ============================================================
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod  # noqa: E402
+
 # -------------------- HIER ANPASSEN -------------------------
 p = 49037
 a = 11784
@@ -20,26 +26,13 @@ verbose = True
 
 
 # -------------------- MATHE HILFEN --------------------------
-def egcd(A, B):
-    if B == 0:
-        return A, 1, 0
-    g, x1, y1 = egcd(B, A % B)
-    return g, y1, x1 - (A // B) * y1
-
-def inv_mod(x, m):
-    """Modulares Inverses von x mod m (Extended Euclid)."""
-    x %= m
-    g, u, _ = egcd(x, m)
-    if g != 1:
-        raise ValueError(f"Kein Inverses: gcd({x}, {m}) = {g} != 1")
-    return u % m
-
+# inv_mod(x, m) aus Modulare Arithmetik/modarith.py (ValueError wenn ggT != 1)
 def inv_mod_p(x):
     """Inverses mod p (p prim)."""
     x %= p
     if x == 0:
         raise ZeroDivisionError("Kein Inverses für 0 mod p.")
-    return pow(x, p - 2, p)
+    return inv_mod(x, p)
 
 
 # -------------------- EC-FUNKTIONEN --------------------------
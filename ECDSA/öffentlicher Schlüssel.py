@@ -3,6 +3,12 @@
 # Q = d * G
 # ============================================
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+import modarith  # noqa: E402
+
 # --------- HIER ANPASSEN ---------------------
 # Kurve: y^2 = x^3 + a*x + b (mod p)
 p = 49037
@@ -22,7 +28,7 @@ def inv_mod(x, p):
     x %= p
     if x == 0:
         raise ZeroDivisionError("Kein Inverses für 0 mod p.")
-    return pow(x, p - 2, p)
+    return modarith.inv_mod(x, p)
 
 
 def ec_add(P, Q):
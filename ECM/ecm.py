@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Lenstra ECM (elliptic curve method) auf Montgomery-Kurven.
+
+Wie bei p−1 wird ein Punkt mit einem glatten Skalar multipliziert, nur ist
+die Gruppenordnung #E(F_p) nicht p − 1, sondern liegt irgendwo in
+[p + 1 − 2 sqrt(p), p + 1 + 2 sqrt(p)]. Jede Kurve ist ein neuer Versuch.
+
+- Montgomery-Kurven B y^2 = x^3 + A x^2 + x, gerechnet wird nur mit (X : Z)
+  (x-only Leiter, keine Inversen, 5M + 6M pro Bit)
+- Suyama-Parametrisierung: 12 | #E, Startpunkt ohne Wurzelziehen
+- Stufe 1: Q = [k] P0 mit k = Produkt der Primzahlpotenzen <= B1
+- Stufe 2: Baby-Step/Giant-Step, Primzahl q = kD ± d in (B1, B2] ist
+  getroffen, wenn x([kD]Q) = x([d]Q) mod p
+- mehrere Kurven parallel in einem Prozess-Pool
+
+Kurvenform und Rechnung mod n statt mod p: das Verfahren findet p, sobald
+eine Inversion / ein gcd nicht 1 ist.
+"""
+
+import math
+import random
+import sys
+from multiprocessing import Pool
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "Pollard p-1"))
+sys.path.insert(0, str(ROOT / "Primzahlsieb"))
+from p_minus_1 import prime_power  # noqa: E402
+from primzahlsieb import primes_between  # noqa: E402
+
+# -------------------------------------------------------------
+# HIER ANPASSEN:
+n = (10 ** 15 + 37) * (10 ** 29 + 319)  # <- Zu faktorierende Zahl (16-stelliger Faktor)
+workers = 4  # <- Anzahl Prozesse (1 = alles im aktuellen Prozess)
+verbose = True  # <- True = Zwischenschritte mitdrucken
+
+# (Stellen des gesuchten Faktors, B1, Anzahl Kurven) wie bei GMP-ECM, B2 = 100 * B1
+ECM_PARAMETERS = [
+    (15, 2000, 25),
+    (20, 11000, 90),
+    (25, 50000, 300),
+    (30, 250000, 700),
+]
+GCD_EVERY = 1000
+
+
+class FactorFound(Exception):
+    """Eine Inversion mod n ist gescheitert: gcd ist ein Faktor."""
+
+    def __init__(self, factor: int):
+        super().__init__(factor)
+        self.factor = factor
+
+
+# ---------- Montgomery-Arithmetik (X : Z) ----------
+
+def xdbl(X: int, Z: int, a24: int, n: int):
+    """[2]P; a24 = (A + 2) / 4."""
+    s = (X + Z) * (X + Z) % n
+    d = (X - Z) * (X - Z) % n
+    t = s - d
+    return s * d % n, t * (d + a24 * t) % n
+
+
+def xadd(X1: int, Z1: int, X2: int, Z2: int, Xd: int, Zd: int, n: int):
+    """P1 + P2 aus P1, P2 und der Differenz P1 − P2 = (Xd : Zd)."""
+    u = (X1 - Z1) * (X2 + Z2)
+    v = (X1 + Z1) * (X2 - Z2)
+    s, t = u + v, u - v
+    return Zd * s * s % n, Xd * t * t % n
+
+
+def ladder(k: int, X: int, Z: int, a24: int, n: int):
+    """[k]P per Montgomery-Leiter: (R0, R1) = ([m]P, [m+1]P)."""
+    if k == 1:
+        return X, Z
+    X0, Z0 = X, Z
+    X1, Z1 = xdbl(X, Z, a24, n)
+    for bit in bin(k)[3:]:
+        if bit == "1":
+            X0, Z0 = xadd(X1, Z1, X0, Z0, X, Z, n)
+            X1, Z1 = xdbl(X1, Z1, a24, n)
+        else:
+            X1, Z1 = xadd(X1, Z1, X0, Z0, X, Z, n)
+            X0, Z0 = xdbl(X0, Z0, a24, n)
+    return X0, Z0
+
+
+def invert(a: int, n: int) -> int:
+    """a^-1 mod n, FactorFound wenn gcd(a, n) > 1."""
+    g = math.gcd(a, n)
+    if g != 1:
+        raise FactorFound(g)
+    # bewusst pow statt modarith.inv_mod: ein ggT > 1 ist hier kein Fehler,
+    # sondern der gesuchte Faktor und wird oben als FactorFound gemeldet
+    return pow(a, -1, n)
+
+
+def suyama_curve(sigma: int, n: int):
+    """
+    Suyama: u = sigma^2 − 5, v = 4 sigma, P0 = (u^3 : v^3),
+    a24 = (A + 2) / 4 = (v − u)^3 (3u + v) / (16 u^3 v).
+    Returns (X, Z, a24).
+    """
+    u = (sigma * sigma - 5) % n
+    v = 4 * sigma % n
+    X, Z = pow(u, 3, n), pow(v, 3, n)
+    a24 = pow(v - u, 3, n) * (3 * u + v) * invert(16 * X * v, n) % n
+    return X, Z, a24
+
+
+# ---------- Stufen ----------
+
+def ecm_stage1(n: int, X: int, Z: int, a24: int, B1: int):
+    """Q = [k] P0, k = Produkt der Primzahlpotenzen <= B1."""
+    count = 0
+    for p in primes_between(2, B1):
+        X, Z = ladder(prime_power(p, B1), X, Z, a24, n)
+        count += 1
+        if count % GCD_EVERY == 0 and math.gcd(Z, n) > 1:
+            break
+    return X, Z
+
+
+def ecm_stage2(n: int, X: int, Z: int, a24: int, B1: int, B2: int, D: int = 2310):
+    """
+    Baby-Steps: x([d]Q) für ungerade d < D/2 mit gcd(d, D) = 1, affin
+    (Z = 1) per gemeinsamer Inversion. Giant-Steps: [kD]Q über
+    [(k+1)D]Q = [kD]Q + [D]Q mit Differenz [(k−1)D]Q.
+    Pro Primzahl: acc *= X_g − x_d Z_g.
+    Returns gcd(acc, n).
+    """
+    half = D // 2
+    X2, Z2 = xdbl(X, Z, a24, n)
+    baby = {}
+    prev, cur = (X, Z), (X, Z)  # [-1]Q hat dasselbe x wie [1]Q
+    for d in range(1, half + 1, 2):
+        if math.gcd(d, D) == 1:
+            baby[d] = cur
+        prev, cur = cur, xadd(*cur, X2, Z2, *prev, n)
+
+    # alle Z gemeinsam invertieren (Montgomery-Trick)
+    keys = list(baby)
+    prefix = [1]
+    for d in keys:
+        prefix.append(prefix[-1] * baby[d][1] % n)
+    inv = invert(prefix[-1], n)
+    for i in range(len(keys) - 1, -1, -1):
+        Xd, Zd = baby[keys[i]]
+        baby[keys[i]] = Xd * inv * prefix[i] % n
+        inv = inv * Zd % n
+
+    k = max(1, (B1 + half) // D)
+    XD, ZD = ladder(D, X, Z, a24, n)
+    g_prev = ladder((k - 1) * D, X, Z, a24, n) if k > 1 else (X, Z)
+    g_cur = ladder(k * D, X, Z, a24, n)
+    if k == 1:
+        # [0]Q gibt es projektiv nicht, Differenz für [2D]Q = [D]Q + [D]Q
+        g_prev = None
+
+    acc = 1
+    count = 0
+    for q in primes_between(B1 + 1, B2):
+        kq = (q + half) // D
+        while k < kq:
+            if g_prev is None:
+                nxt = xdbl(*g_cur, a24, n)
+            else:
+                nxt = xadd(*g_cur, XD, ZD, *g_prev, n)
+            g_prev, g_cur = g_cur, nxt
+            k += 1
+        d = abs(q - k * D)
+        if d in baby:
+            Xg, Zg = g_cur
+            acc = acc * (Xg - baby[d] * Zg) % n
+        else:
+            # nur bei sehr kleinem B1
+            acc = acc * ladder(q, X, Z, a24, n)[1] % n
+        count += 1
+        if count % GCD_EVERY == 0:
+            g = math.gcd(acc, n)
+            if g > 1:
+                return g
+    return math.gcd(acc, n)
+
+
+def ecm_curve(n: int, sigma: int, B1: int, B2: int):
+    """
+    One ECM curve (Stufe 1 + Stufe 2).
+    Returns a nontrivial factor of n, or None.
+    """
+    try:
+        X, Z, a24 = suyama_curve(sigma, n)
+        X, Z = ecm_stage1(n, X, Z, a24, B1)
+        g = math.gcd(Z, n)
+        if g == 1 and B2 > B1:
+            g = ecm_stage2(n, X, Z, a24, B1, B2)
+    except FactorFound as found:
+        g = found.factor
+    if 1 < g < n:
+        return g
+    return None
+
+
+def ecm(n: int, B1: int | None = None, B2: int | None = None, curves: int | None = None,
+        workers: int = 1, max_digits: int = 30, seed: int | None = None,
+        verbose: bool = False):
+    """
+    Factor n with ECM.
+    B1/B2/curves = None: Stufen aus ECM_PARAMETERS bis max_digits Stellen
+    workers = Anzahl Prozesse; die Kurven werden auf einen Pool verteilt
+    Returns a nontrivial factor of n, or None.
+    """
+    # kleine Primteiler direkt; danach ist n >= 11, also gibt es sigma in [6, n - 2]
+    for p in (2, 3, 5, 7):
+        if n % p == 0:
+            return p if p < n else None
+    if n < 11:
+        return None
+    if B1 is not None:
+        plan = [(None, B1, curves or 1)]
+    else:
+        plan = [row for row in ECM_PARAMETERS if row[0] <= max_digits]
+    rng = random.Random(seed)
+
+    pool = Pool(workers) if workers > 1 else None
+    try:
+        for digits, b1, count in plan:
+            b2 = B2 if B2 is not None else 100 * b1
+            if verbose:
+                label = f"{digits} Stellen, " if digits else ""
+                print(f"ECM: {label}B1 = {b1}, B2 = {b2}, {count} Kurven")
+            sigmas = [rng.randrange(6, n - 1) for _ in range(count)]
+            if pool is None:
+                for sigma in sigmas:
+                    f = ecm_curve(n, sigma, b1, b2)
+                    if f is not None:
+                        return f
+            else:
+                f = _run_pool(pool, n, sigmas, b1, b2)
+                if f is not None:
+                    return f
+    finally:
+        if pool is not None:
+            # laufende Kurven wirklich beenden: factor() ruft ecm mehrfach auf
+            pool.terminate()
+            pool.join()
+    return None
+
+
+def _curve_task(task):
+    """ecm_curve for one (n, sigma, B1, B2) tuple (für Pool.imap_unordered)."""
+    return ecm_curve(*task)
+
+
+def _run_pool(pool, n: int, sigmas, B1: int, B2: int):
+    """Kurven einzeln auf den Pool verteilen; erster Faktor gewinnt."""
+    tasks = ((n, sigma, B1, B2) for sigma in sigmas)
+    for f in pool.imap_unordered(_curve_task, tasks):
+        if f is not None:
+            return f
+    return None
+
+
+# -------------------------------------------------------------
+# Läuft als Skript:
+if __name__ == "__main__":
+    factor = ecm(n, workers=workers, verbose=verbose)
+    if factor is None:
+        print("\nKein Faktor gefunden. Versuche größere max_digits oder mehr Kurven.")
+    else:
+        other = n // factor
+        print(f"\nGefundener Faktor: {factor}")
+        print(f"Anderer Faktor   : {other}")
+        print(f"Prüfung          : {factor} * {other} = {factor * other}")
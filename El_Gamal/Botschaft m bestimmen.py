@@ -13,6 +13,11 @@
 #   m = c · (B^a)^(-1) mod p
 # ============================================================
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod  # noqa: E402
 
 # --- HIER ANPASSEN ---
 p = 73
@@ -41,7 +46,7 @@ def elgamal_decrypt_verbose(p, g, A, a, B, c):
     print("🔹 Schritt 2: Inverses von s")
     print("s^(-1) mod p")
     print(f"  = {s}^(-1) mod {p}")
-    s_inv = pow(s, p - 2, p)
+    s_inv = inv_mod(s, p)
     print(f"  = {s_inv}\n")
 
     print("🔹 Schritt 3: Nachricht berechnen")
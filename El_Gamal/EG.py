@@ -1,8 +1,13 @@
 # elliptic_elgamal.py
 # Kleines Hilfsskript für EC-ElGamal-Aufgaben über GF(p)
 
+import sys
+from pathlib import Path
 from typing import Optional, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod  # noqa: E402
+
 Point = Optional[tuple[int, int]]  # (x, y) oder None für Punkt im Unendlichen
 
 
@@ -20,7 +25,7 @@ class EllipticCurve:
 
     def inv_mod(self, k: int) -> int:
         """Multiplikatives Inverses von k modulo p."""
-        return pow(k, -1, self.p)
+        return inv_mod(k, self.p)
 
     def is_on_curve(self, P: Point) -> bool:
         """Prüfen, ob Punkt auf der Kurve liegt."""
@@ -9,17 +9,13 @@ g = 42
 A = 107
 # ---------------------
 
-def factorize(n):
-    factors = {}
-    d = 2
-    while d * d <= n:
-        while n % d == 0:
-            factors[d] = factors.get(d, 0) + 1
-            n //= d
-        d += 1
-    if n > 1:
-        factors[n] = factors.get(n, 0) + 1
-    return factors
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Faktorisierung"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Primzahltest"))
+from faktorisierung import factor  # noqa: E402
+from primzahltest import is_prime  # noqa: E402
 
 
 print("Gegeben:")
@@ -30,7 +26,7 @@ print()
 
 # 1️⃣ p prim?
 print("1) Prüfe, ob p prim ist:")
-if all(p % i != 0 for i in range(2, int(p**0.5) + 1)):
+if is_prime(p):
     print(f"   p = {p} ist prim ✅")
 else:
     print(f"   p = {p} ist NICHT prim ❌")
@@ -41,7 +37,7 @@ print("\n2) Bestimme die Gruppenordnung:")
 order = p - 1
 print(f"   |Z_p*| = p - 1 = {p} - 1 = {order}")
 
-fac = factorize(order)
+fac = factor(order)
 fac_str = " · ".join(f"{k}^{v}" if v > 1 else str(k) for k, v in fac.items())
 print(f"   {order} = {fac_str}")
 
@@ -10,6 +10,11 @@ A = 52
 # ---------------------
 
 import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod  # noqa: E402
 
 def bsgs_verbose(p, g, A):
     print("Aufgabe 4(b) – Baby-Step-Giant-Step\n")
@@ -34,7 +39,7 @@ def bsgs_verbose(p, g, A):
 
     # Giant steps
     print("\n🔹 Giant-Steps:")
-    g_inv = pow(g, p - 2, p)
+    g_inv = inv_mod(g, p)
     factor = pow(g_inv, m, p)
     print(f"g^(-1) ≡ {g_inv} (mod {p})")
     print(f"g^(-m) ≡ {factor} (mod {p})\n")
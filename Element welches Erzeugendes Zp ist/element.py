@@ -1,5 +1,24 @@
 # Script: Erzeugende modulo p mit Zwischenschritten
 
+import itertools
+import math
+import sys
+from array import array
+from collections import Counter
+from pathlib import Path
+
+# Optional für die vektorisierte Ordnungstabelle
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Primzahltest"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Faktorisierung"))
+from faktorisierung import factor  # noqa: E402
+from primzahltest import is_prime  # noqa: E402
+
+
 def ord_mod(a, p, verbose=False, label=""):
     """
     Berechnet die Ordnung von a modulo p.
@@ -32,23 +51,212 @@ def ord_mod(a, p, verbose=False, label=""):
             return None
 
 
+def carmichael_lambda(n):
+    """
+    Carmichael-Funktion λ(n): Exponent von Z_n^*, d.h. a^λ(n) = 1 für alle
+    Einheiten a. λ(p^e) = φ(p^e), außer λ(2^e) = 2^(e-2) für e >= 3.
+    """
+    lam = 1
+    for p, e in factor(n).items():
+        part = p ** (e - 1) * (p - 1)
+        if p == 2 and e >= 3:
+            part //= 2
+        lam = lam * part // math.gcd(lam, part)
+    return lam
+
+
+def order_mod(a, n):
+    """
+    Ordnung von a in Z_n^* (n beliebig, nicht nur prim).
+    Start bei λ(n), dann jeden Primfaktor q von λ(n) abstreifen, solange
+    a^(ord/q) = 1 bleibt: O(log n) Potenzen, also O(log^2 n) Multiplikationen
+    statt bis zu n Schritten wie ord_mod. Die Faktorisierungen kommen aus
+    dem Cache von factor().
+    """
+    a %= n
+    if math.gcd(a, n) != 1:
+        raise ValueError(f"{a} ist keine Einheit modulo {n}")
+    order = carmichael_lambda(n)
+    for q, e in factor(order).items():
+        for _ in range(e):
+            if pow(a, order // q, n) != 1:
+                break
+            order //= q
+    return order
+
+
+def _prime_power_orders(p, e):
+    """Ordnungen aller Einheiten modulo p^e als Liste (0 für Nichteinheiten)."""
+    m = p ** e
+    orders = [0] * m
+    if p == 2 and e <= 2:
+        orders[1] = 1
+        if e == 2:
+            orders[3] = 2
+        return orders
+    if p == 2:
+        # Z_(2^e)^* = {±5^k}, 5 hat Ordnung 2^(e-2)
+        h = m // 4
+        x = 1
+        for k in range(h):
+            o = h // math.gcd(k, h)
+            orders[x] = o
+            orders[m - x] = max(o, 2)  # kgV(2, o), o ist Zweierpotenz
+            x = x * 5 % m
+        return orders
+    # zyklisch: g^k hat Ordnung φ / ggT(k, φ)
+    phi = m - m // p
+    g = smallest_generator(p)
+    if e > 1 and pow(g, p - 1, p * p) == 1:
+        g += p  # dann ist g + p Erzeugendes modulo p^e
+    x = 1
+    for k in range(phi):
+        orders[x] = phi // math.gcd(k, phi)
+        x = x * g % m
+    return orders
+
+
+def unit_orders(n):
+    """
+    Ordnungen aller a in Z_n^* auf einmal: Liste der Länge n mit 0 für
+    ggT(a, n) > 1. Pro Primzahlpotenz p^e von n eine Tabelle über ein
+    Erzeugendes, dann ord(a) = kgV der Ordnungen von a mod p^e (CRT).
+    """
+    if n == 1:
+        return [1]
+    tables = [(p ** e, _prime_power_orders(p, e)) for p, e in factor(n).items()]
+    orders = [0] * n
+    for a in range(n):
+        o = 1
+        for m, table in tables:
+            t = table[a % m]
+            if t == 0:
+                o = 0
+                break
+            o = o * t // math.gcd(o, t)
+        orders[a] = o
+    return orders
+
+
+def _power_table(g, count, m):
+    """g^0, ..., g^(count-1) mod m als uint64-Array (Verdoppeln: ein Vektorprodukt pro Schritt)."""
+    powers = np.empty(count, dtype=np.uint64)
+    powers[0] = 1
+    filled = 1
+    while filled < count:
+        step = min(filled, count - filled)
+        powers[filled:filled + step] = powers[:step] * np.uint64(pow(g, filled, m)) % np.uint64(m)
+        filled += step
+    return powers
+
+
+def _prime_power_order_table(p, e):
+    """Wie _prime_power_orders, aber als NumPy-Array ohne Python-Schleife."""
+    m = p ** e
+    table = np.zeros(m, dtype=np.uint64)
+    if p == 2 and e <= 2:
+        table[1] = 1
+        if e == 2:
+            table[3] = 2
+        return table
+    if p == 2:
+        h = m // 4
+        k = np.arange(h, dtype=np.uint64)
+        o = np.uint64(h) // np.gcd(k, np.uint64(h))
+        x = _power_table(5, h, m)
+        table[x] = o
+        table[m - x] = np.maximum(o, 2)
+        return table
+    phi = m - m // p
+    g = smallest_generator(p)
+    if e > 1 and pow(g, p - 1, p * p) == 1:
+        g += p
+    k = np.arange(phi, dtype=np.uint64)
+    table[_power_table(g, phi, m)] = np.uint64(phi) // np.gcd(k, np.uint64(phi))
+    return table
+
+
+def unit_order_table(n):
+    """
+    Ordnungen aller a in Z_n^* vektorisiert mit NumPy (n bis ca. 10^7).
+    Wie unit_orders: pro p^e || n eine Tabelle, deren Potenzen g^k des
+    Erzeugenden per Verdoppeln als Array entstehen, dann elementweise
+    kgV der periodisch fortgesetzten Tabellen (np.lcm, 0 bleibt 0).
+    Returns (orders, histogram): orders[a] als uint32-Array (0 für
+    Nichteinheiten), histogram = {Ordnung: Anzahl}.
+    Ohne NumPy: array("I") aus unit_orders(n).
+    """
+    if np is None:
+        orders = array("I", unit_orders(n))
+        histogram = Counter(o for o in orders if o)
+        return orders, dict(sorted(histogram.items()))
+
+    if n >= 1 << 32:
+        raise ValueError("n muss kleiner als 2^32 sein")
+    orders = np.ones(n, dtype=np.uint64)
+    for p, e in factor(n).items():
+        table = _prime_power_order_table(p, e)
+        orders = np.lcm(orders, np.tile(table, n // len(table)))
+    orders = orders.astype(np.uint32)
+
+    values, counts = np.unique(orders[orders > 0], return_counts=True)
+    histogram = {int(v): int(c) for v, c in zip(values, counts)}
+    return orders, histogram
+
+
+def is_generator(g, p, primes=None):
+    """
+    Prüft, ob g ein Erzeugendes modulo p ist: g^((p-1)/q) != 1 für jeden
+    Primteiler q von p-1 (primes = diese q, sonst wird p-1 faktorisiert).
+    """
+    if primes is None:
+        primes = factor(p - 1)
+    return g % p != 0 and all(pow(g, (p - 1) // q, p) != 1 for q in primes)
+
+
+def smallest_generator(p):
+    """Kleinstes Erzeugendes modulo p (p prim), O(log p) pro Kandidat."""
+    primes = list(factor(p - 1))
+    return next(g for g in range(1, p) if is_generator(g, p, primes))
+
+
+def largest_generator(p):
+    """Größtes Erzeugendes modulo p (p prim)."""
+    primes = list(factor(p - 1))
+    return next(g for g in range(p - 1, 0, -1) if is_generator(g, p, primes))
+
+
 def find_generators(p):
     """
-    Findet alle Erzeugenden modulo p (p prim).
-    Gibt eine Liste aller g mit Ordnung p-1 zurück.
+    Findet alle Erzeugenden modulo p (p prim), aufsteigend sortiert.
+    Statt ord_mod für jedes g (O(p^2)): p-1 einmal faktorisieren, ein
+    Erzeugendes g0 suchen, dann sind die Erzeugenden genau g0^k mit
+    ggT(k, p-1) = 1 -> O(p log p).
     """
+    if not is_prime(p):
+        raise ValueError(f"p = {p} ist keine Primzahl")
     phi = p - 1
-    generators = []
+    primes = list(factor(phi))
+    g0 = next(g for g in range(1, p) if is_generator(g, p, primes))
 
-    for g in range(1, p):
-        if ord_mod(g, p) == phi:
-            generators.append(g)
+    # k teilerfremd zu p-1: Vielfache der Primteiler streichen
+    coprime = bytearray([1]) * p
+    coprime[0] = 0
+    for q in primes:
+        coprime[::q] = bytes(len(range(0, p, q)))
 
-    return generators
+    # g0^k durchlaufen und die Erzeugenden als Wert markieren (spart das Sortieren)
+    is_gen = bytearray(p)
+    x = 1
+    for k in range(1, p):
+        x = x * g0 % p
+        if coprime[k]:
+            is_gen[x] = 1
+    return list(itertools.compress(range(p), is_gen))
 
 
 def main():
-    p = 467 # Prüfende Primzahl eingeben
+    p = 467  # Prüfende Primzahl eingeben
     print(f"Modul p = {p}")
     print(f"phi(p) = p - 1 = {p - 1}\n")
 
@@ -72,6 +280,12 @@ def main():
     ord_mod(smallest, p, verbose=True, label="(kleinstes Erzeugendes)")
     ord_mod(largest, p, verbose=True, label="(groesstes Erzeugendes)")
 
+    # 4) Wie viele Elemente haben welche Ordnung?
+    _, histogram = unit_order_table(p)
+    print("Ordnung -> Anzahl Elemente:")
+    for order, count in histogram.items():
+        print(f"  {order:5d} -> {count}")
+
 
 if __name__ == "__main__":
     main()
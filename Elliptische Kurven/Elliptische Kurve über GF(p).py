@@ -9,8 +9,13 @@ Das Skript:
  - optional: alle paarweisen Additionen ausgeben (aktivierbar)
 """
 
+import sys
+from pathlib import Path
 from typing import List, Tuple, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod_or_none as mod_inv, sqrt_mod, sqrt_mod_many  # noqa: E402
+
 # === Parameter (anpassen für jede Aufgabe) ===
 p = 43   # Primzahl für GF(p)
 a = 22
@@ -19,26 +24,22 @@ b = 17  # Kurve: y^2 = x^3 + a*x + b  (mod p)
 # === Hilfsfunktionen ===
 Point = Optional[Tuple[int,int]]  # None repräsentiert den Punkt im Unendlichen O
 
-def mod_inv(x: int, p: int) -> Optional[int]:
-    """Modulare Inverse von x mod p (gibt None zurück, wenn nicht invertierbar)."""
-    x = x % p
-    if x == 0:
-        return None
-    # p sollte prim sein -> Fermat's little theorem
-    return pow(x, p-2, p)
-
 def quadratic_residues(value: int, p: int) -> List[int]:
-    """Alle y in 0..p-1 mit y^2 ≡ value (mod p)."""
-    value %= p
-    return [y for y in range(p) if (y*y) % p == value]
+    """Alle y in 0..p-1 mit y^2 ≡ value (mod p) (Tonelli–Shanks statt alle y durchprobieren)."""
+    y = sqrt_mod(value, p)
+    if y is None:
+        return []
+    return sorted({y, (p - y) % p})
 
 def find_points(a: int, b: int, p: int) -> List[Point]:
     """Finde alle Punkte (x,y) auf der Kurve plus None für O nicht hier (wird separat behandelt)."""
     pts = []
-    for x in range(p):
-        rhs = (x**3 + a*x + b) % p
-        ys = quadratic_residues(rhs, p)
-        for y in ys:
+    # alle rechten Seiten auf einmal: eine Wurzel pro x, die andere ist p - y
+    roots = sqrt_mod_many([(x**3 + a*x + b) % p for x in range(p)], p)
+    for x, y in enumerate(roots):
+        if y is None:
+            continue
+        for y in sorted({y, (p - y) % p}):
             pts.append((x,y))
     return pts
 
@@ -11,8 +11,13 @@ die mit >>> MARKIERT <<< sind!
 """
 
 from dataclasses import dataclass
+from pathlib import Path
 from typing import List, Optional, Tuple
 import math
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import sqrt_mod_many  # noqa: E402
 
 # Optional für Nullstellen/Plots
 try:
@@ -122,10 +127,11 @@ class EllipticCurve:
 # ======================================================
 def points_over_fp(a: int, b: int, p: int) -> List[Tuple[int, int]]:
     pts = []
-    for x in range(p):
-        rhs = (x**3 + a*x + b) % p
-        for y in range(p):
-            if (y*y) % p == rhs:
+    # Wurzeln aller rechten Seiten auf einmal (statt alle y durchprobieren)
+    roots = sqrt_mod_many([(x**3 + a*x + b) % p for x in range(p)], p)
+    for x, y in enumerate(roots):
+        if y is not None:
+            for y in sorted({y, (p - y) % p}):
                 pts.append((x, y))
     pts.append((None, None))
     return pts
@@ -9,8 +9,13 @@ Anpassbar:
   SHOW_STEPS      -> True/False für detaillierte Zwischenschritte
 """
 
+import sys
+from pathlib import Path
 from typing import Optional, Tuple, List
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod_or_none as mod_inv, sqrt_mod_many  # noqa: E402
+
 Point = Optional[Tuple[int,int]]  # None repräsentiert O (unendlich)
 
 # ---------------------------
@@ -33,14 +38,6 @@ SHOW_STEPS = True   # True -> zeigt m, Zähler, Nenner, modulare Inverse etc.
 # ---------------------------
 # === Hilfsfunktionen
 # ---------------------------
-def mod_inv(x: int, p: int) -> Optional[int]:
-    """Modulare Inverse von x mod p. None falls nicht invertierbar."""
-    x %= p
-    if x == 0:
-        return None
-    # p prim -> Fermat
-    return pow(x, p-2, p)
-
 def is_on_curve(P: Point, a: int, b: int, p: int) -> bool:
     """Prüft, ob P auf der Kurve liegt. None (O) ist immer auf der Kurve."""
     if P is None:
@@ -128,10 +125,10 @@ if __name__ == "__main__":
 
     # 2) Prüfe alle Punkte (optional schnell)
     pts = []
-    for x in range(p):
-        rhs = (x**3 + a*x + b) % p
-        for y in range(p):
-            if (y*y) % p == rhs:
+    roots = sqrt_mod_many([(x**3 + a*x + b) % p for x in range(p)], p)
+    for x, y in enumerate(roots):
+        if y is not None:
+            for y in sorted({y, (p - y) % p}):
                 pts.append((x,y))
     print("Gefundene endliche Punkte (x,y):")
     print(sorted(pts))
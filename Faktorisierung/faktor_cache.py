@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Cache für Faktorisierungen und Primzahl-Zertifikate.
+
+- im Prozess: LRU (OrderedDict) mit maxsize Einträgen
+- optional auf der Platte: SQLite-Datei, Schlüssel ist n (als Text, da
+  Python-ints beliebig groß sind), Werte als JSON
+
+Zertifikate für Primzahlen p:
+    ("mr",)              Miller–Rabin mit den ersten 13 Primzahlen als Basen,
+                         für p < 3.3 * 10^24 ein Beweis
+    ("pratt", a, [q..])  Pratt: a^(p-1) ≡ 1 und a^((p-1)/q) ≢ 1 für alle
+                         Primteiler q von p - 1 (die q haben eigene Einträge)
+    ("prp",)             BPSW-wahrscheinlich prim (großes p, ohne Beweis)
+"""
+
+import json
+import sqlite3
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Primzahltest"))
+from primzahltest import MR_DETERMINISTIC_BOUND, is_prime  # noqa: E402
+
+
+class FactorCache:
+    """
+    n -> {p: e} und p -> Zertifikat, erst im LRU, dann in der Datei.
+    path = None: nur im Prozess
+    """
+
+    def __init__(self, path=None, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.factors = OrderedDict()
+        self.certificates = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.db = None
+        if path is not None:
+            self.db = sqlite3.connect(path)
+            with self.db:
+                self.db.execute("CREATE TABLE IF NOT EXISTS factors "
+                                "(n TEXT PRIMARY KEY, factors TEXT NOT NULL)")
+                self.db.execute("CREATE TABLE IF NOT EXISTS primes "
+                                "(p TEXT PRIMARY KEY, certificate TEXT NOT NULL)")
+
+    def _remember(self, table, key, value):
+        table[key] = value
+        table.move_to_end(key)
+        if len(table) > self.maxsize:
+            table.popitem(last=False)
+
+    def _lookup(self, table, sql, key):
+        if key in table:
+            table.move_to_end(key)
+            self.hits += 1
+            return table[key]
+        if self.db is not None:
+            row = self.db.execute(sql, (str(key),)).fetchone()
+            if row is not None:
+                value = json.loads(row[0])
+                self._remember(table, key, value)
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def _peek(self, table, sql, key):
+        """Like _lookup, but without counting hits/misses (für Schreibzugriffe)."""
+        if key in table:
+            return table[key]
+        if self.db is not None:
+            row = self.db.execute(sql, (str(key),)).fetchone()
+            if row is not None:
+                return json.loads(row[0])
+        return None
+
+    # ---------- Faktorisierungen ----------
+
+    def get(self, n: int):
+        """Cached factorisation {p: e} of n, or None."""
+        pairs = self._lookup(self.factors, "SELECT factors FROM factors WHERE n = ?", n)
+        if pairs is None:
+            return None
+        return {p: e for p, e in pairs}
+
+    def put(self, n: int, factors):
+        pairs = sorted(factors.items())
+        self._remember(self.factors, n, pairs)
+        if self.db is not None:
+            with self.db:
+                self.db.execute("INSERT OR REPLACE INTO factors VALUES (?, ?)",
+                                (str(n), json.dumps(pairs)))
+
+    # ---------- Primzahl-Zertifikate ----------
+
+    def certificate(self, p: int):
+        """Cached certificate of the prime p (Tupel, siehe oben), or None."""
+        cert = self._lookup(self.certificates,
+                            "SELECT certificate FROM primes WHERE p = ?", p)
+        return None if cert is None else tuple(cert)
+
+    def put_certificate(self, p: int, cert):
+        old = self._peek(self.certificates, "SELECT certificate FROM primes WHERE p = ?", p)
+        if old is not None and old[0] != "prp" and cert[0] == "prp":
+            return  # kein schwächeres Zertifikat über ein besseres schreiben
+        self._remember(self.certificates, p, list(cert))
+        if self.db is not None:
+            with self.db:
+                self.db.execute("INSERT OR REPLACE INTO primes VALUES (?, ?)",
+                                (str(p), json.dumps(list(cert))))
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+
+def pratt_witness(p: int, primes):
+    """Smallest a with a^(p-1) ≡ 1 and a^((p-1)/q) ≢ 1 (mod p) for all q, or None."""
+    for a in range(2, p):
+        if pow(a, p - 1, p) != 1:
+            return None  # p ist gar nicht prim
+        if all(pow(a, (p - 1) // q, p) != 1 for q in primes):
+            return a
+    return None
+
+
+def verify_certificate(p: int, cache: FactorCache) -> bool:
+    """Check a Pratt/MR certificate of p recursively from the cache."""
+    cert = cache.certificate(p)
+    if cert is None:
+        return False
+    if cert[0] == "mr":
+        # unterhalb der Schranke ist is_prime deterministisches Miller–Rabin
+        return p < MR_DETERMINISTIC_BOUND and is_prime(p)
+    if cert[0] != "pratt":
+        return False
+    _, a, primes = cert
+    rest = p - 1
+    for q in primes:
+        while rest % q == 0:
+            rest //= q
+    if rest != 1 or pow(a, p - 1, p) != 1:
+        return False
+    return all(pow(a, (p - 1) // q, p) != 1 and verify_certificate(q, cache)
+               for q in primes)
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Vollständige Faktorisierung: factor(n) -> {p: e}.
+
+Pipeline (jede Stufe nur für das, was übrig bleibt):
+1. Probedivision mit einem Rad mod 30 bis TRIAL_BOUND
+2. echte Potenz? m = r^k
+3. Primtest (Miller–Rabin / BPSW, Primzahltest/): Primzahl -> fertig
+4. Brent-ρ (Pollard’s ρ-Algorithmu/Aufgabe3.py) für kleine Faktoren
+5. Pollard p−1 (Pollard p-1/p_minus_1.py)
+6. ECM (ECM/ecm.py) für mittlere Faktoren
+7. quadratisches Sieb (Quadratisches Sieb/QS.py) für den Rest
+
+Zerlegte Teile kommen zurück auf den Stapel und laufen ab Schritt 2 erneut.
+Die Zeit pro Stufe wird mitgeschrieben (timings / verbose).
+
+Ergebnisse und Primzahl-Zertifikate landen in einem Cache (faktor_cache.py):
+im Prozess als LRU, mit set_cache_file(...) auch in einer SQLite-Datei.
+"""
+
+import math
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+for folder in ("Pollard’s ρ-Algorithmu", "Pollard p-1", "ECM", "Quadratisches Sieb",
+               "Primzahltest"):
+    if str(ROOT / folder) not in sys.path:
+        sys.path.insert(0, str(ROOT / folder))
+
+from Aufgabe3 import pollards_rho_brent  # noqa: E402
+from ecm import ecm  # noqa: E402
+from faktor_cache import FactorCache, pratt_witness  # noqa: E402
+from p_minus_1 import pollard_pm1  # noqa: E402
+from primzahltest import MR_DETERMINISTIC_BOUND, is_prime  # noqa: E402
+from QS import SIQS_MIN, quadratic_sieve  # noqa: E402
+
+# -------------------------------------------------------------
+# HIER ANPASSEN:
+n = 2 ** 128 + 1  # <- Zu faktorierende Zahl (F7 = 59649589127497217 * 5704689200685129054721)
+verbose = True  # <- True = Zeiten pro Stufe ausgeben
+cache_file = None  # <- z.B. "faktoren.sqlite": Cache über mehrere Läufe
+
+TRIAL_BOUND = 10 ** 4      # Probedivision bis hier
+RHO_ITERS = 1 << 16        # Brent-ρ: findet Faktoren bis ca. 10 Stellen
+PM1_B1 = 10 ** 4           # p−1: Schranken Stufe 1 / Stufe 2
+PM1_B2 = 10 ** 6
+QS_DIGITS = 50             # größere Reste erst mit mehr ECM-Kurven versuchen
+STAGES = ("Probedivision", "Potenz", "Primtest", "rho", "p-1", "ECM", "QS")
+
+WHEEL = (4, 2, 4, 2, 4, 6, 2, 6)  # Abstände der Zahlen teilerfremd zu 30 ab 7
+MR_PROOF_BOUND = MR_DETERMINISTIC_BOUND  # darunter ist Miller–Rabin ein Beweis
+
+_cache = FactorCache()
+
+
+def set_cache_file(path, maxsize: int = 4096):
+    """Use a SQLite file as the default cache (None = nur im Prozess)."""
+    global _cache
+    _cache.close()
+    _cache = FactorCache(path, maxsize)
+    return _cache
+
+
+def get_cache() -> FactorCache:
+    return _cache
+
+
+# ---------- einfache Stufen ----------
+
+def trial_division(n: int, bound: int = TRIAL_BOUND):
+    """
+    Divide out all primes below bound (Rad mod 30: nur 8 von 30 Kandidaten).
+    Returns ({p: e}, rest).
+    """
+    factors = {}
+    for p in (2, 3, 5):
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    d, i = 7, 0
+    while d < bound and d * d <= n:
+        while n % d == 0:
+            factors[d] = factors.get(d, 0) + 1
+            n //= d
+        d += WHEEL[i]
+        i = (i + 1) % 8
+    if 1 < n < d * d:
+        # kein Teiler bis sqrt(n): n ist selbst prim
+        factors[n] = factors.get(n, 0) + 1
+        n = 1
+    return factors, n
+
+
+def integer_root(n: int, k: int) -> int:
+    """floor(n^(1/k)) per Newton-Verfahren."""
+    if n < 2:
+        return n
+    x = 1 << -(-n.bit_length() // k)  # Startwert >= Wurzel
+    while True:
+        y = ((k - 1) * x + n // x ** (k - 1)) // k
+        if y >= x:
+            return x
+        x = y
+
+
+def perfect_power(n: int):
+    """(r, k) with r^k = n for the smallest k > 1, or None (r wird danach weiter geprüft)."""
+    k = 2
+    while (1 << k) <= n:
+        r = integer_root(n, k)
+        if r ** k == n:
+            return r, k
+        k += 1
+    return None
+
+
+# ---------- Faktor finden ----------
+
+def find_factor(m: int, times, workers: int = 1, verbose: bool = False):
+    """
+    Nontrivial factor of the composite m (keine Teiler < TRIAL_BOUND,
+    keine echte Potenz). Die Zeit jeder Stufe wird in times addiert.
+    """
+    def run(stage, fn, *args, **kwargs):
+        start = time.perf_counter()
+        d = fn(*args, **kwargs)
+        times[stage] += time.perf_counter() - start
+        if d is not None and 1 < d < m:
+            if verbose:
+                print(f"  {stage}: {m} = {d} * {m // d}")
+            return d
+        return None
+
+    for a in (1, 3):
+        d = run("rho", pollards_rho_brent, m, x0=2, a=a, max_iters=RHO_ITERS)
+        if d:
+            return d
+    d = run("p-1", pollard_pm1, m, B1=PM1_B1, B2=PM1_B2)
+    if d:
+        return d
+
+    digits = len(str(m))
+    d = run("ECM", ecm, m, max_digits=15 if digits <= QS_DIGITS else 30, workers=workers)
+    if d:
+        return d
+    if digits <= QS_DIGITS:
+        method = "siqs" if m >= SIQS_MIN else "qs"
+        d = run("QS", quadratic_sieve, m, method=method, workers=workers)
+        if d:
+            return d
+    # letzter Versuch: ECM ohne Obergrenze der Tabelle
+    d = run("ECM", ecm, m, max_digits=10 ** 6, workers=workers)
+    if d:
+        return d
+    raise RuntimeError(f"{m} konnte nicht zerlegt werden")
+
+
+def prime_certificate(p: int, cache: FactorCache | None = None):
+    """
+    Certificate for the prime p: ("mr",) unterhalb MR_PROOF_BOUND, sonst
+    Pratt ("pratt", a, Primteiler von p - 1), rekursiv mit Zertifikaten
+    für die Primteiler im Cache.
+    """
+    if p < MR_PROOF_BOUND:
+        return ("mr",)
+    primes = list(factor(p - 1, cache=cache, prove=True))
+    a = pratt_witness(p, primes)
+    if a is None:
+        raise ValueError(f"{p} ist nicht prim")
+    return ("pratt", a, primes)
+
+
+def prove_factors(factors, cache: FactorCache):
+    """Replace missing or "prp" certificates of the primes in factors by proofs."""
+    for p in factors:
+        if p < MR_PROOF_BOUND:
+            continue
+        cert = cache.certificate(p)
+        if cert is None or cert[0] == "prp":
+            cache.put_certificate(p, prime_certificate(p, cache))
+
+
+def factor(n: int, workers: int = 1, verbose: bool = False, timings=None,
+           cache: FactorCache | None = None, prove: bool = False):
+    """
+    Complete factorisation of n >= 1 as {p: e} (sortiert nach p).
+    workers  = Prozesse für ECM und QS
+    timings  = optional dict, bekommt die Sekunden pro Stufe (STAGES)
+    cache    = FactorCache (None = Standard-Cache, siehe set_cache_file)
+    prove    = große Primfaktoren mit Pratt-Zertifikat statt nur "prp"
+    """
+    if n < 1:
+        raise ValueError("n muss >= 1 sein")
+    if cache is None:
+        cache = _cache
+    cached = cache.get(n)
+    if cached is not None:
+        if prove:
+            prove_factors(cached, cache)
+        return cached
+    times = dict.fromkeys(STAGES, 0.0) if timings is None else timings
+    for stage in STAGES:
+        times.setdefault(stage, 0.0)
+
+    start = time.perf_counter()
+    result, rest = trial_division(n)
+    times["Probedivision"] += time.perf_counter() - start
+    for p in result:
+        cache.put_certificate(p, ("mr",))
+
+    stack = [(rest, 1)] if rest > 1 else []
+    while stack:
+        m, mult = stack.pop()
+
+        cached = cache.get(m)
+        if cached is None and cache.certificate(m) is not None:
+            cached = {m: 1}
+        if cached is not None:
+            if prove:
+                prove_factors(cached, cache)
+            for p, e in cached.items():
+                result[p] = result.get(p, 0) + e * mult
+            continue
+
+        start = time.perf_counter()
+        power = perfect_power(m)
+        times["Potenz"] += time.perf_counter() - start
+        if power is not None:
+            r, k = power
+            stack.append((r, mult * k))
+            continue
+
+        start = time.perf_counter()
+        prime = m < TRIAL_BOUND ** 2 or is_prime(m)
+        times["Primtest"] += time.perf_counter() - start
+        if prime:
+            result[m] = result.get(m, 0) + mult
+            if m < MR_PROOF_BOUND:
+                cache.put_certificate(m, ("mr",))
+            elif prove:
+                cache.put_certificate(m, prime_certificate(m, cache))
+            else:
+                cache.put_certificate(m, ("prp",))
+            continue
+
+        # die beiden Teile dürfen gemeinsame Primfaktoren haben,
+        # die Vielfachheiten addieren sich in result
+        d = find_factor(m, times, workers, verbose)
+        stack.append((d, mult))
+        stack.append((m // d, mult))
+
+    if verbose:
+        total = sum(times.values())
+        print(f"Zeiten ({total:.3f} s):")
+        for stage in STAGES:
+            if times[stage]:
+                print(f"  {stage:14s} {times[stage]:8.3f} s")
+    result = dict(sorted(result.items()))
+    cache.put(n, result)
+    return result
+
+
+# -------------------------------------------------------------
+# Läuft als Skript:
+if __name__ == "__main__":
+    if cache_file is not None:
+        set_cache_file(cache_file)
+    factors = factor(n, verbose=verbose)
+    text = " * ".join(f"{p}^{e}" if e > 1 else str(p) for p, e in factors.items())
+    print(f"\n{n} = {text}")
+    print(f"Prüfung: {math.prod(p ** e for p, e in factors.items()) == n}")
@@ -1,5 +1,11 @@
 from math import gcd
 
+# Optional für solve_many (vektorisiert)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # ======================================================
 # ✅ HIER ANPASSEN!
 # Trage hier deine Werte ein:
@@ -9,14 +15,19 @@ m = 61  # Modulus
 # ======================================================
 
 
-# --- Funktion: löst lineare Kongruenz a·x ≡ b (mod m) ---
-def solve_congruence(a, b, m):
+# --- Funktion: Lösungsmenge von a·x ≡ b (mod m) kompakt beschreiben ---
+def congruence_solutions(a, b, m):
+    """
+    Alle Lösungen von a·x ≡ b (mod m) als (x0, step, count):
+    x = x0 + k·step für k = 0, ..., count-1 (aufsteigend, alle in [0, m)).
+    count = d = gcd(a, m), step = m / d. Keine Lösung: None.
+    Auch für riesige d (z.B. m = 2^64) nur O(log m) Arbeit und Speicher.
+    """
     d = gcd(a, m)
 
     # Prüfen ob eine Lösung existiert
     if b % d != 0:
-        print("❌ Keine Lösung, da gcd(a, m) b nicht teilt.")
-        return []
+        return None
 
     # Gleichung kürzen
     a_reduced = a // d
@@ -26,12 +37,98 @@ def solve_congruence(a, b, m):
     # modular inverses: a_reduced * x ≡ b_reduced (mod m_reduced)
     # pow(a_reduced, -1, m_reduced) berechnet das multiplikative Inverse
     x0 = (b_reduced * pow(a_reduced, -1, m_reduced)) % m_reduced
+    return x0, m_reduced, d
+
+
+def iter_solutions(a, b, m):
+    """
+    Lösungen von a·x ≡ b (mod m) lazy als range (leer, wenn unlösbar):
+    Indizierung und Iteration, ohne die Liste anzulegen. Die Anzahl liefert
+    congruence_solutions (len() des range geht nur bis 2^63 - 1).
+    """
+    sol = congruence_solutions(a, b, m)
+    if sol is None:
+        return range(0)
+    x0, step, count = sol
+    return range(x0, x0 + count * step, step)
+
+
+# --- Funktion: löst lineare Kongruenz a·x ≡ b (mod m) ---
+def solve_congruence(a, b, m):
+    """Alle Lösungen als sortierte Liste (nur für kleine gcd(a, m) sinnvoll)."""
+    solutions = iter_solutions(a, b, m)
+    if not solutions:
+        print("❌ Keine Lösung, da gcd(a, m) b nicht teilt.")
+    return list(solutions)
+
+
+def solve_many(a, b, m):
+    """
+    congruence_solutions für viele Kongruenzen auf einmal (Listen oder
+    NumPy-Arrays gleicher Länge). Returns (x0, step, count) als Listen von
+    ints, count = 0 heißt: keine Lösung (x0 und step sind dann 0).
+    Mit NumPy und Moduli < 2^31 vektorisiert (erweiterter Euklid über
+    alle Einträge gleichzeitig), sonst eine Schleife über Python-ints.
+    """
+    if np is not None:
+        try:
+            arrays = [np.asarray(v, dtype=np.int64) for v in (a, b, m)]
+        except OverflowError:
+            arrays = None
+        if arrays is not None and arrays[2].size and 1 <= arrays[2].min() \
+                and arrays[2].max() < 1 << 31:
+            return tuple(col.tolist() for col in _solve_many_numpy(*arrays))
+
+    x0, step, count = [], [], []
+    for ai, bi, mi in zip(a, b, m):
+        sol = congruence_solutions(int(ai), int(bi), int(mi))
+        x0.append(sol[0] if sol else 0)
+        step.append(sol[1] if sol else 0)
+        count.append(sol[2] if sol else 0)
+    return x0, step, count
+
+
+def _solve_many_numpy(a, b, m):
+    """solve_many für int64-Arrays mit 1 <= m < 2^31 (Produkte passen in int64)."""
+    d = np.gcd(a, m)
+    ok = b % d == 0
+    m_red = m // d
+    a_red = a // d % m_red
+    b_red = np.where(ok, b // d, 0) % m_red
+
+    # Inverses von a_red mod m_red: r_i ≡ s_i · a_red (mod m_red)
+    r0, r1 = m_red, a_red
+    s0, s1 = np.zeros_like(m), np.ones_like(m)
+    active = r1 != 0
+    while active.any():
+        q = np.where(active, r0 // np.where(active, r1, 1), 0)
+        r0, r1 = np.where(active, r1, r0), np.where(active, r0 - q * r1, r1)
+        s0, s1 = np.where(active, s1, s0), np.where(active, s0 - q * s1, s1)
+        active = r1 != 0
+    inv = s0 % m_red
+
+    x0 = np.where(ok, b_red * inv % m_red, 0)
+    step = np.where(ok, m_red, 0)
+    count = np.where(ok, d, 0)
+    return x0, step, count
+
 
-    # Alle Lösungen erzeugen
-    solutions = [(x0 + k * m_reduced) % m for k in range(d)]
-    return sorted(solutions)
+def read_congruences(path):
+    """Generator over (a, b, m) aus einer Textdatei, eine Kongruenz 'a b m' pro Zeile."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.split("#", 1)[0].split()
+            if line:
+                yield tuple(int(v) for v in line)
 
 
 # --- Ausgabe ---
-solutions = solve_congruence(a, b, m)
-print(f"Lösungen von {a}x ≡ {b} (mod {m}): {solutions}")
+if __name__ == "__main__":
+    sol = congruence_solutions(a, b, m)
+    if sol is None:
+        print(f"❌ {a}x ≡ {b} (mod {m}): keine Lösung, da gcd(a, m) b nicht teilt.")
+    elif sol[2] <= 20:
+        print(f"Lösungen von {a}x ≡ {b} (mod {m}): {list(iter_solutions(a, b, m))}")
+    else:
+        x0, step, count = sol
+        print(f"Lösungen von {a}x ≡ {b} (mod {m}): x = {x0} + k·{step}, k = 0..{count - 1}")
@@ -24,17 +24,20 @@ mithilfe des Index–Calculus–Verfahrens.
 """
 
 import math
-from sympy import factorint, Matrix, mod_inverse, primerange
+import sys
+from pathlib import Path
+
+from sympy import Matrix, mod_inverse, primerange
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Batch-GCD"))
+from batch_smooth import batch_smooth, prime_product  # noqa: E402
+
+BATCH = 1000  # Kandidaten pro Batch-Glattheitstest (Produkt-/Restbaum)
 
 # ------------------------------------------------------------
 # 🧮 Hilfsfunktionen
 # ------------------------------------------------------------
 
-def is_B_smooth(n, B):
-    """Prüft, ob n vollständig aus Primfaktoren ≤ B besteht."""
-    factors = factorint(n)
-    return all(p <= B for p in factors.keys())
-
 def modexp(base, exp, mod):
     """Berechnet (base^exp mod mod)."""
     return pow(base, exp, mod)
@@ -54,19 +57,19 @@ def index_calculus(p, g, a, B, num_relations=20):
     factor_base = list(primerange(2, B + 1))
     print(f"\nFaktorbasis F(B): {factor_base}")
 
-    # 2️⃣ Relationen sammeln
+    # 2️⃣ Relationen sammeln: alle Kandidaten g^z auf einmal auf Glattheit testen
     relations = []
     rhs = []  # rechte Seite (Exponenten z)
-    z = 1
-    while len(relations) < len(factor_base) and z < num_relations:
-        val = modexp(g, z, p)
-        if is_B_smooth(val, B):
-            facs = factorint(val)
-            row = [facs.get(q, 0) for q in factor_base]
-            relations.append(row)
-            rhs.append(z)
-            print(f"Relation gefunden: g^{z} ≡ {val} = {facs}")
-        z += 1
+    P = prime_product(factor_base)
+    values = [modexp(g, z, p) for z in range(1, num_relations)]
+    for i, facs in batch_smooth(values, factor_base, P):
+        if len(relations) == len(factor_base):
+            break
+        z = i + 1
+        row = [facs.get(q, 0) for q in factor_base]
+        relations.append(row)
+        rhs.append(z)
+        print(f"Relation gefunden: g^{z} ≡ {values[i]} = {facs}")
 
     if len(relations) < len(factor_base):
         print("\n❌ Nicht genug B-glatte Zahlen gefunden. Erhöhe num_relations oder B.")
@@ -90,10 +93,13 @@ def index_calculus(p, g, a, B, num_relations=20):
 
     # 4️⃣ Individuellen Logarithmus berechnen
     print("\nSuche y, sodass a*g^y B-glatt ist...")
-    for y in range(1, p):
-        val = (a * modexp(g, y, p)) % p
-        if is_B_smooth(val, B):
-            facs = factorint(val)
+    for start in range(1, p, BATCH):
+        ys = range(start, min(start + BATCH, p))
+        values = [(a * modexp(g, y, p)) % p for y in ys]
+        hits = batch_smooth(values, factor_base, P)
+        if hits:
+            i, facs = hits[0]
+            y, val = ys[i], values[i]
             exps = sum(log_q[q] * e for q, e in facs.items() if q in log_q)
             x = (exps - y) % (p - 1)
             print(f"\n✅ Gefunden: a*g^{y} ≡ {val} = {facs}")
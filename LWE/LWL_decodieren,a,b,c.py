@@ -1,10 +1,8 @@
-def modinv(a, m):
-    """ Berechnet das multiplikative Inverse von a modulo m. """
-    a %= m
-    for x in range(m):
-        if (a * x) % m == 1:
-            return x
-    return None
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod_or_none as modinv  # noqa: E402
 
 
 def solve_equation(a, b, c, x, y, z, m, result):
@@ -1,15 +1,8 @@
-def egcd(a, b):
-    if b == 0:
-        return a, 1, 0
-    g, x1, y1 = egcd(b, a % b)
-    return g, y1, x1 - (a // b) * y1
-
-def modinv(a, m):
-    a %= m
-    g, x, _ = egcd(a, m)
-    if g != 1:
-        return None
-    return x % m
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod_or_none as modinv  # noqa: E402
 
 def solve_equation_verbose(a, b, c, x, y, z, m, result):
     print("Ausgangsgleichung:")
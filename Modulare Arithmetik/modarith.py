@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Gemeinsamer Kern für modulare Arithmetik.
+
+Statt eigener egcd/inv_mod/modinv in jedem Skript (rekursiv, also mit
+RecursionError bei großen Zahlen, oder sogar per Durchprobieren) rufen die
+Skripte diese Funktionen auf:
+
+egcd(a, b)              (g, x, y) mit a*x + b*y = g = ggT(a, b), iterativ
+inv_mod(a, m)           a^(-1) mod m per pow(a, -1, m) (in C), ValueError wenn ggT != 1
+inv_mod_or_none(a, m)   dasselbe, None statt ValueError
+batch_inv_mod(xs, m)    alle Inversen mit nur einer Inversion (Montgomery-Trick)
+jacobi(a, n)            Jacobi-Symbol, ohne Potenzieren
+legendre(a, p)          Legendre-Symbol für Primzahlen p
+sqrt_mod(a, p)          x mit x^2 ≡ a (mod p), None für Nichtreste
+SqrtContext(p)          einmal pro Primzahl: Zerlegung p - 1 = q * 2^s, Nichtrest,
+                        Wahl zwischen Tonelli–Shanks und Cipolla
+sqrt_mod_many(xs, p)    viele Wurzeln modulo derselben Primzahl
+
+Als Skript: Mikro-Benchmarks gegen die alten Varianten.
+"""
+
+from functools import lru_cache
+
+# -------------------------------------------------------------
+# HIER ANPASSEN:
+p = 2 ** 255 - 19  # <- Primzahl für die Benchmarks
+count = 20000  # <- Anzahl Werte pro Benchmark
+
+CIPOLLA_FACTOR = 24  # Cipolla statt Tonelli–Shanks ab s * (s - 1) > CIPOLLA_FACTOR * log2 p
+TABLE_RATIO = 10  # sqrt_mod_many mit Quadrattabelle ab p <= TABLE_RATIO * Anzahl Werte
+
+
+def egcd(a: int, b: int):
+    """Extended Euclid, iterativ: returns (g, x, y) with a*x + b*y = g = gcd(a, b)."""
+    x0, y0, x1, y1 = 1, 0, 0, 1
+    while b:
+        q, r = divmod(a, b)
+        a, b = b, r
+        x0, x1 = x1, x0 - q * x1
+        y0, y1 = y1, y0 - q * y1
+    if a < 0:
+        return -a, -x0, -y0
+    return a, x0, y0
+
+
+def inv_mod(a: int, m: int) -> int:
+    """Modular inverse a^(-1) mod m. ValueError wenn ggT(a, m) != 1."""
+    try:
+        return pow(a, -1, m)
+    except ValueError:
+        raise ValueError(f"Kein Inverses: ggT({a % m}, {m}) != 1") from None
+
+
+def inv_mod_or_none(a: int, m: int):
+    """Modular inverse a^(-1) mod m, or None if it does not exist."""
+    try:
+        return pow(a, -1, m)
+    except ValueError:
+        return None
+
+
+def batch_inv_mod(values, m: int):
+    """
+    Inverse aller values modulo m mit nur einer Inversion (Montgomery-Trick):
+    Präfixprodukte, ein Inverses des Gesamtprodukts, dann rückwärts
+    auflösen (3 Multiplikationen pro Wert). ValueError wenn ein Wert nicht
+    invertierbar ist.
+    """
+    values = [v % m for v in values]
+    prefix = []
+    acc = 1
+    for v in values:
+        prefix.append(acc)
+        acc = acc * v % m
+    inv = inv_mod(acc, m)
+    result = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        result[i] = inv * prefix[i] % m
+        inv = inv * values[i] % m
+    return result
+
+
+def jacobi(a: int, n: int) -> int:
+    """Jacobi-Symbol (a/n) für ungerades n > 0."""
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def legendre(a: int, p: int) -> int:
+    """Legendre-Symbol (a/p) für Primzahlen p: 1, -1 oder 0."""
+    if p == 2:
+        return a % 2
+    return jacobi(a, p)
+
+
+class SqrtContext:
+    """
+    Quadratwurzeln modulo einer festen ungeraden Primzahl p.
+    Einmal pro p: p - 1 = q * 2^s (q ungerade), für s > 1 ein Nichtrest z
+    und die Potenzen c_k = z^(q * 2^k) für k < s. Pro Wurzel dann je nach s:
+    - s = 1 (p ≡ 3 mod 4): a^((p+1)/4)
+    - s = 2 (p ≡ 5 mod 8): Atkin, ebenfalls nur eine Potenz
+    - sonst Tonelli–Shanks mit den c_k (bis zu s^2/2 Quadrierungen), oder
+      Cipolla in F_p(sqrt(t^2 - a)) wenn s groß ist (s * (s - 1) > CIPOLLA_FACTOR * log2 p):
+      unabhängig von s, aber jede Multiplikation in F_p^2 ist eine Python-Schleife.
+    Ob a ein Rest ist, zeigt die Probe x^2 ≡ a am Ende, ohne eigenes Legendre-Symbol.
+    """
+
+    def __init__(self, p: int):
+        if p < 3 or p % 2 == 0:
+            raise ValueError("p muss eine ungerade Primzahl sein.")
+        self.p = p
+        q, s = p - 1, 0
+        while q % 2 == 0:
+            q //= 2
+            s += 1
+        self.q, self.s = q, s
+
+        if s == 1:
+            # p ≡ 3 (mod 4): kein Nichtrest nötig
+            self.z = self.zq = None
+            self.method = "p3mod4"
+            return
+        z = 2
+        while legendre(z, p) != -1:
+            z += 1
+        self.z = z
+        self.zq = pow(z, q, p)
+
+        if s == 2:
+            self.method = "atkin"
+        elif s * (s - 1) > CIPOLLA_FACTOR * p.bit_length():
+            self.method = "cipolla"
+        else:
+            self.method = "tonelli"
+            powers = [self.zq]
+            for _ in range(s - 1):
+                powers.append(powers[-1] * powers[-1] % p)
+            self.powers = powers
+
+    def sqrt(self, a: int):
+        """x mit x^2 ≡ a (mod p) (die andere Wurzel ist p - x), None für Nichtreste."""
+        p = self.p
+        a %= p
+        if a == 0:
+            return 0
+        if self.method == "p3mod4":
+            x = pow(a, (p + 1) >> 2, p)
+        elif self.method == "atkin":
+            a2 = 2 * a % p
+            v = pow(a2, (p - 5) >> 3, p)
+            i = a2 * v * v % p
+            x = a * v * (i - 1) % p
+        elif self.method == "tonelli":
+            return self._tonelli(a)
+        else:
+            x = self._cipolla(a)
+        return x if x * x % p == a else None
+
+    def _tonelli(self, a: int):
+        p, s, powers = self.p, self.s, self.powers
+        r = pow(a, self.q >> 1, p)
+        x = a * r % p  # a^((q+1)/2)
+        t = x * r % p  # a^q
+        m = s
+        while t != 1:
+            i, t2i = 0, t
+            while t2i != 1:
+                t2i = t2i * t2i % p
+                i += 1
+                if i == m:
+                    return None  # t hat Ordnung 2^s: a ist kein Rest
+            # b = c^(2^(m-i-1)) mit c = z^(q * 2^(s-m)), also b = c_(s-i-1)
+            x = x * powers[s - i - 1] % p
+            t = t * powers[s - i] % p
+            m = i
+        return x
+
+    def _cipolla(self, a: int):
+        p = self.p
+        t = 1
+        while legendre(t * t - a, p) != -1:
+            t += 1
+            if t == p:
+                return 0
+        w = (t * t - a) % p
+        # (t + sqrt(w))^((p+1)/2) in F_p[sqrt(w)], binär von links
+        x0, x1 = 1, 0
+        for bit in bin((p + 1) >> 1)[2:]:
+            x0, x1 = (x0 * x0 + x1 * x1 % p * w) % p, 2 * x0 * x1 % p
+            if bit == "1":
+                x0, x1 = (x0 * t + x1 * w) % p, (x0 + x1 * t) % p
+        return x0
+
+
+@lru_cache(maxsize=256)
+def sqrt_context(p: int) -> SqrtContext:
+    """SqrtContext für p, zwischengespeichert (mehrere Aufrufe mit demselben p)."""
+    return SqrtContext(p)
+
+
+def sqrt_mod(a: int, p: int):
+    """
+    x mit x^2 ≡ a (mod p) für Primzahlen p (die andere Wurzel ist p - x),
+    None wenn a kein quadratischer Rest ist. Siehe SqrtContext.
+    """
+    if p == 2:
+        return a % 2
+    return sqrt_context(p).sqrt(a)
+
+
+def sqrt_mod_many(values, p: int):
+    """
+    sqrt_mod für viele Werte modulo derselben Primzahl p, als Liste (None
+    für Nichtreste). Ab etwa p / TABLE_RATIO Werten wird stattdessen einmal
+    die Tabelle aller Quadrate y^2 für y <= (p-1)/2 angelegt (Wurzel dann
+    immer die kleinere der beiden), sonst ein SqrtContext für alle Werte.
+    """
+    values = list(values)
+    if p == 2:
+        return [v % 2 for v in values]
+    if p <= TABLE_RATIO * len(values):
+        table = [None] * p
+        sq = 0
+        for y in range((p + 1) // 2):
+            table[sq] = y
+            sq += 2 * y + 1  # (y+1)^2 = y^2 + 2y + 1
+            if sq >= p:  # 2y + 1 <= p, also reicht einmal abziehen
+                sq -= p
+        return [table[v % p] for v in values]
+    root = SqrtContext(p).sqrt
+    return [root(v) for v in values]
+
+
+# -------------------------------------------------------------
+# Läuft als Skript:
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    def egcd_recursive(a, b):
+        # alte Variante aus den Skripten (zum Vergleich)
+        if b == 0:
+            return a, 1, 0
+        g, x1, y1 = egcd_recursive(b, a % b)
+        return g, y1, x1 - (a // b) * y1
+
+    def bench(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        print(f"  {label:34s} {(time.perf_counter() - start) * 1e6 / len(result):8.2f} µs pro Wert")
+        return result
+
+    rng = random.Random(1)
+    values = [rng.randrange(1, p) for _ in range(count)]
+    print(f"p hat {p.bit_length()} Bit, {count} Werte")
+
+    sys.setrecursionlimit(10000)
+    print("Inverse:")
+    old = bench("rekursiver egcd", lambda: [egcd_recursive(v, p)[1] % p for v in values])
+    new = bench("iterativer egcd", lambda: [egcd(v, p)[1] % p for v in values])
+    fermat = bench("Fermat pow(x, p-2, p)", lambda: [pow(v, p - 2, p) for v in values])
+    direct = bench("inv_mod (pow(x, -1, p))", lambda: [inv_mod(v, p) for v in values])
+    batch = bench("batch_inv_mod", lambda: batch_inv_mod(values, p))
+    print(f"  gleich: {old == new == fermat == direct == batch}")
+
+    print("Quadratische Reste:")
+    euler = bench("Euler pow(a, (p-1)/2, p)", lambda: [pow(v, (p - 1) // 2, p) == 1 for v in values])
+    jac = bench("jacobi", lambda: [jacobi(v, p) == 1 for v in values])
+    print(f"  gleich: {euler == jac}")
+
+    def tonelli_uncached(a, p):
+        # alte Variante: Zerlegung und Suche nach z bei jedem Aufruf
+        q, s = p - 1, 0
+        while q % 2 == 0:
+            q //= 2
+            s += 1
+        z = 2
+        while pow(z, (p - 1) // 2, p) != p - 1:
+            z += 1
+        c, x, t, m = pow(z, q, p), pow(a, (q + 1) // 2, p), pow(a, q, p), s
+        while t != 1:
+            i, t2i = 0, t
+            while t2i != 1:
+                t2i = t2i * t2i % p
+                i += 1
+            b = pow(c, 1 << (m - i - 1), p)
+            x, t, c, m = x * b % p, t * b * b % p, b * b % p, i
+        return x
+
+    # p aus HIER ANPASSEN, dazu zwei Primzahlen mit großem s (p - 1 = q * 2^s)
+    for q_p in (p, 2 ** 64 - 2 ** 32 + 1, 7 * 2 ** 120 + 1):
+        squares = [v * v % q_p for v in values[:count // 10]]
+        print(f"Wurzeln, p mit {q_p.bit_length()} Bit, s = {sqrt_context(q_p).s} ({sqrt_context(q_p).method}):")
+        old = bench("Tonelli–Shanks pro Aufruf", lambda: [tonelli_uncached(a, q_p) for a in squares])
+        new = bench("sqrt_mod_many", lambda: sqrt_mod_many(squares, q_p))
+        print(f"  Wurzeln korrekt: {all(r * r % q_p == a for r, a in zip(new, squares))}")
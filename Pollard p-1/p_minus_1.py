@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Pollard p−1: findet Primfaktoren p von n, für die p − 1 glatt ist.
+
+- Stufe 1: b = a^E mod n mit E = Produkt aller Primzahlpotenzen q^e <= B1
+  (Primzahlen aus dem segmentierten Sieb in Primzahlsieb/), dann gcd(b − 1, n)
+- Stufe 2: eine weitere Primzahl q in (B1, B2] darf in p − 1 stecken.
+  Baby-Step/Giant-Step mit q = kD ± d: b^(kD) und b^(±d) werden als
+  Lucas-Werte V_m = b^m + b^-m geführt, dann ist V_kD − V_d ≡ 0 (mod p)
+  genau dann, wenn b^(kD+d) ≡ 1 oder b^(kD−d) ≡ 1. Pro Primzahl nur eine
+  Multiplikation mod n.
+
+Pure Python, keine externen Bibliotheken.
+"""
+
+import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Primzahlsieb"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod  # noqa: E402
+from primzahlsieb import primes_between  # noqa: E402
+
+# -------------------------------------------------------------
+# HIER ANPASSEN:
+n = 2 ** 67 - 1  # <- Zu faktorierende Zahl (Cole 1903: 193707721 * 761838257287)
+a = 3  # <- Basis (a = 2 versagt bei Mersenne-Zahlen: 2^67 ≡ 1 mod n)
+B1 = 1000  # <- Schranke Stufe 1
+B2 = 100000  # <- Schranke Stufe 2 (None = 100 * B1)
+verbose = True  # <- True = Zwischenschritte mitdrucken
+
+GCD_EVERY = 1000    # gcd-Prüfung alle ... Primzahlen
+
+
+def prime_power(p: int, bound: int) -> int:
+    """Largest power p^e <= bound."""
+    q = p
+    while q * p <= bound:
+        q *= p
+    return q
+
+
+# ---------- Lucas-Folgen ----------
+
+def lucas_v(P: int, m: int, n: int) -> int:
+    """
+    V_m(P) mod n mit V_0 = 2, V_1 = P, V_(k+1) = P V_k − V_(k−1).
+    Montgomery-Leiter über (V_k, V_(k+1)):
+    V_2k = V_k^2 − 2,  V_(2k+1) = V_k V_(k+1) − P
+    """
+    if m == 0:
+        return 2 % n
+    x, y = P % n, (P * P - 2) % n
+    for bit in bin(m)[3:]:
+        if bit == "1":
+            x, y = (x * y - P) % n, (y * y - 2) % n
+        else:
+            x, y = (x * x - 2) % n, (x * y - P) % n
+    return x
+
+
+def stage2(n: int, P: int, B1: int, B2: int, D: int = 2310):
+    """
+    Gemeinsame Stufe 2 für p−1 und p+1 auf Lucas-Werten V_m(P).
+    Baby-Steps: V_d für ungerade d < D/2 mit gcd(d, D) = 1.
+    Giant-Steps: V_(kD) über V_((k+1)D) = V_(kD) V_D − V_((k−1)D).
+    Jede Primzahl q = kD ± d in (B1, B2] kostet eine Multiplikation.
+    Returns gcd(prod (V_kD − V_d), n).
+    """
+    half = D // 2
+    V2 = (P * P - 2) % n
+    baby = {}
+    prev, cur = P % n, P % n  # V_-1 = V_1
+    for d in range(1, half + 1, 2):
+        if math.gcd(d, D) == 1:
+            baby[d] = cur
+        prev, cur = cur, (cur * V2 - prev) % n
+
+    k = max(1, (B1 + half) // D)
+    VD = lucas_v(P, D, n)
+    giant_prev, giant = lucas_v(P, (k - 1) * D, n), lucas_v(P, k * D, n)
+
+    acc = 1
+    count = 0
+    for q in primes_between(B1 + 1, B2):
+        kq = (q + half) // D
+        while k < kq:
+            giant_prev, giant = giant, (giant * VD - giant_prev) % n
+            k += 1
+        d = abs(q - k * D)
+        if d in baby:
+            acc = acc * (giant - baby[d]) % n
+        else:
+            # nur bei sehr kleinem B1 (q teilt D oder q < D/2)
+            acc = acc * (lucas_v(P, q, n) - 2) % n
+        count += 1
+        if count % GCD_EVERY == 0:
+            g = math.gcd(acc, n)
+            if g > 1:
+                return g
+    return math.gcd(acc, n)
+
+
+# ---------- p−1 ----------
+
+def pm1_stage1(n: int, B1: int, a: int = 3):
+    """
+    Stufe 1: b = a^E mod n, E = Produkt der Primzahlpotenzen <= B1.
+    gcd alle GCD_EVERY Primzahlen; ist er n, wird der letzte Abschnitt
+    Primzahl für Primzahl wiederholt.
+    Returns (g, b) with g = gcd(b − 1, n).
+    """
+    b = a % n
+    chunk = []
+    saved = b
+    for p in primes_between(2, B1):
+        chunk.append(p)
+        b = pow(b, prime_power(p, B1), n)
+        if len(chunk) < GCD_EVERY:
+            continue
+        g = math.gcd(b - 1, n)
+        if g == n:
+            return _backtrack(n, B1, saved, chunk)
+        if g > 1:
+            return g, b
+        chunk = []
+        saved = b
+
+    g = math.gcd(b - 1, n)
+    if g == n and chunk:
+        return _backtrack(n, B1, saved, chunk)
+    return g, b
+
+
+def _backtrack(n: int, B1: int, b: int, chunk):
+    for p in chunk:
+        b = pow(b, prime_power(p, B1), n)
+        g = math.gcd(b - 1, n)
+        if g > 1:
+            return g, b
+    return n, b
+
+
+def pollard_pm1(n: int, B1: int = 10 ** 5, B2: int | None = None, a: int = 3,
+                verbose: bool = False):
+    """
+    Pollard p−1 with stage 1 and stage 2.
+    Returns a nontrivial factor of n, or None.
+    """
+    if B2 is None:
+        B2 = 100 * B1
+    g = math.gcd(a, n)
+    if 1 < g < n:
+        return g
+
+    g, b = pm1_stage1(n, B1, a)
+    if verbose:
+        print(f"Stufe 1 (B1 = {B1}): gcd(b - 1, n) = {g}")
+    if 1 < g < n:
+        return g
+    if g == n or B2 <= B1:
+        return None
+
+    # V_m(b + b^-1) = b^m + b^-m
+    g = math.gcd(b, n)
+    if 1 < g < n:
+        return g
+    g = stage2(n, b + inv_mod(b, n), B1, B2)
+    if verbose:
+        print(f"Stufe 2 (B2 = {B2}): gcd = {g}")
+    if 1 < g < n:
+        return g
+    return None
+
+
+# -------------------------------------------------------------
+# Läuft als Skript:
+if __name__ == "__main__":
+    factor = pollard_pm1(n, B1=B1, B2=B2, a=a, verbose=verbose)
+    if factor is None:
+        print("\nKein Faktor gefunden. Versuche größere B1/B2 oder eine andere Basis a.")
+    else:
+        other = n // factor
+        print(f"\nGefundener Faktor: {factor}")
+        print(f"Anderer Faktor   : {other}")
+        print(f"Prüfung          : {factor} * {other} = {factor * other}")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Williams p+1: findet Primfaktoren p von n, für die p + 1 glatt ist.
+
+Statt Potenzen a^E in Z_n^* wird die Lucas-Folge V_m(P) gerechnet
+(V_0 = 2, V_1 = P, V_(k+1) = P V_k − V_(k−1)). Ist P^2 − 4 ein
+Nichtrest mod p, dann gilt V_m(P) ≡ 2 (mod p) sobald p + 1 | m; ist es
+ein Rest, verhält sich das Verfahren wie p−1. Da man p nicht kennt, werden
+mehrere Startwerte P probiert (2/7 und 6/5 wie bei GMP-ECM).
+
+- Stufe 1: V = V_E(P) mit E = Produkt der Primzahlpotenzen <= B1,
+  über V_(ab)(P) = V_a(V_b(P)) Primzahl für Primzahl
+- Stufe 2: wie bei p−1 (stage2 in p_minus_1.py), Baby-Step/Giant-Step
+"""
+
+import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from p_minus_1 import GCD_EVERY, lucas_v, prime_power, primes_between, stage2  # noqa: E402
+from modarith import inv_mod  # noqa: E402
+
+# -------------------------------------------------------------
+# HIER ANPASSEN:
+n = 52900196053 * 1000000000000000003  # <- Zu faktorierende Zahl (p + 1 = 2 * 547 * 557 * 86813, p − 1 nicht glatt)
+B1 = 1000  # <- Schranke Stufe 1
+B2 = 100000  # <- Schranke Stufe 2 (None = 100 * B1)
+verbose = True  # <- True = Zwischenschritte mitdrucken
+
+SEEDS = ((2, 7), (6, 5), (3, 1), (5, 1))  # Startwerte P = Zähler / Nenner
+
+
+def pp1_stage1(n: int, B1: int, P: int):
+    """
+    Stufe 1: V = V_E(P) mod n. gcd alle GCD_EVERY Primzahlen, damit ein
+    früher Treffer nicht durch den zweiten Faktor zu gcd = n wird.
+    Returns (g, V) with g = gcd(V − 2, n).
+    """
+    V = P % n
+    count = 0
+    for p in primes_between(2, B1):
+        V = lucas_v(V, prime_power(p, B1), n)
+        count += 1
+        if count % GCD_EVERY == 0:
+            g = math.gcd(V - 2, n)
+            if g > 1:
+                return g, V
+    return math.gcd(V - 2, n), V
+
+
+def williams_pp1(n: int, B1: int = 10 ** 5, B2: int | None = None, seeds=SEEDS,
+                 verbose: bool = False):
+    """
+    Williams p+1 with stage 1 and stage 2, einmal pro Startwert.
+    Returns a nontrivial factor of n, or None.
+    """
+    if B2 is None:
+        B2 = 100 * B1
+    for num, den in seeds:
+        g = math.gcd(den, n)
+        if 1 < g < n:
+            return g
+        P = num * inv_mod(den, n) % n
+
+        g, V = pp1_stage1(n, B1, P)
+        if verbose:
+            print(f"P = {num}/{den}, Stufe 1 (B1 = {B1}): gcd(V - 2, n) = {g}")
+        if 1 < g < n:
+            return g
+        if g == n or B2 <= B1:
+            continue
+
+        g = stage2(n, V, B1, B2)
+        if verbose:
+            print(f"P = {num}/{den}, Stufe 2 (B2 = {B2}): gcd = {g}")
+        if 1 < g < n:
+            return g
+    return None
+
+
+# -------------------------------------------------------------
+# Läuft als Skript:
+if __name__ == "__main__":
+    factor = williams_pp1(n, B1=B1, B2=B2, verbose=verbose)
+    if factor is None:
+        print("\nKein Faktor gefunden. Versuche größere B1/B2 oder andere Startwerte.")
+    else:
+        other = n // factor
+        print(f"\nGefundener Faktor: {factor}")
+        print(f"Anderer Faktor   : {other}")
+        print(f"Prüfung          : {factor} * {other} = {factor * other}")
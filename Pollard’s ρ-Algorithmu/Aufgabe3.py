@@ -6,6 +6,7 @@ x0 = 2  # <- Startwert x0 (ändern)
 a = 5  # <- f(x) = x^2 + a (ändern) modulo n ist integriert
 max_iters = 10000  # <- Sicherheitslimit Iterationen (ändern)
 verbose = True  # <- True = Zwischenschritte mitdrucken
+method = "floyd"  # <- "floyd" oder "brent" (schneller, gcd nur alle ~100 Schritte)
 
 
 # -------------------------------------------------------------
@@ -48,10 +49,59 @@ def pollards_rho(n, x0=2, a=1, max_iters=10000, verbose=False):
     return d
 
 
+# -------------------------------------------------------------
+# Pollard ρ mit Brents Zyklus-Findung
+# - y läuft, x bleibt an den Stellen 2^k stehen: nur ein f pro Schritt
+# - |x - y| wird mod n aufmultipliziert, gcd nur alle `batch` Schritte
+# - ist der gcd = n, wird der letzte Block einzeln wiederholt (Backtracking)
+def pollards_rho_brent(n, x0=2, a=1, max_iters=10000, batch=100, verbose=False):
+    if n % 2 == 0:
+        return 2
+
+    y = x0
+    r = 1  # Länge des aktuellen Abschnitts (Zweierpotenz)
+    q = 1  # Produkt der |x - y| mod n
+    d = 1
+    it = 0
+
+    while d == 1 and it < max_iters:
+        x = y
+        for _ in range(r):
+            y = f(y, n, a)
+        it += r
+        k = 0
+        while k < r and d == 1:
+            ys = y  # Stand vor dem Block, fürs Backtracking
+            steps = min(batch, r - k)
+            for _ in range(steps):
+                y = f(y, n, a)
+                q = q * abs(x - y) % n
+            d = gcd(q, n)
+            k += steps
+            it += steps  # jede Auswertung von f genau einmal zählen
+            if verbose:
+                print(f"{it:6d}: r={r}, gcd(Produkt, n) = {d}")
+        r *= 2
+
+    if d == n:
+        # Produkt hat beide Faktoren erwischt: Block Schritt für Schritt
+        d = 1
+        while d == 1:
+            ys = f(ys, n, a)
+            d = gcd(abs(x - ys), n)
+
+    if d == n or d == 1:
+        return None  # kein Faktor gefunden (Parameter ändern/neu starten)
+    return d
+
+
 # -------------------------------------------------------------
 # Läuft als Skript:
 if __name__ == "__main__":
-    factor = pollards_rho(n=n, x0=x0, a=a, max_iters=max_iters, verbose=verbose)
+    if method == "brent":
+        factor = pollards_rho_brent(n=n, x0=x0, a=a, max_iters=max_iters, verbose=verbose)
+    else:
+        factor = pollards_rho(n=n, x0=x0, a=a, max_iters=max_iters, verbose=verbose)
     if factor is None:
         print("\nKein Faktor gefunden. Versuche andere Parameter (x0, a) oder mehr Iterationen.")
     else:
@@ -2,7 +2,12 @@
 # Universelles Pollard-ρ-Skript zur Lösung des diskreten Logarithmus g^x = h (mod p)
 # ÄNDERN: p, g, h (und optional order) im __main__-Block weiter unten.
 
+import sys
 from math import gcd
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod_or_none  # noqa: E402
 
 def default_partition(v):
     """Standardpartition: drei Klassen per v % 3. Kann angepasst werden."""
@@ -57,18 +62,9 @@ def pollard_rho_discrete_log(g, h, p, order=None, partition_func=None, max_itera
             A_red = A // d
             order_red = order // d
 
-            # Erweiterter Euklid zur Inversenberechnung
-            def egcd(a, b):
-                if b == 0:
-                    return (a, 1, 0)
-                else:
-                    g0, x1, y1 = egcd(b, a % b)
-                    return (g0, y1, x1 - (a // b) * y1)
-
-            g_inv, x_inv, _ = egcd(B_red, order_red)
-            if g_inv != 1:
+            inv_B = inv_mod_or_none(B_red, order_red)
+            if inv_B is None:
                 return None
-            inv_B = x_inv % order_red
             x0 = (inv_B * A_red) % order_red
 
             # Allgemeine Lösungen: x = x0 + k*order_red, k=0..d-1 -> prüfe kleinste, die passt
@@ -0,0 +1,57 @@
+# Benchmark: Pollard ρ mit Floyd vs. Brent (Aufgabe3.py)
+# -------------------------------------------------------------
+# Semiprimes mit 20–30 Stellen, aber unbalanciert (kleiner Faktor mit
+# 9–11 Stellen), damit ρ in Sekunden fertig wird: ρ braucht ca. sqrt(p)
+# Schritte, p = kleinster Primfaktor.
+# HIER ANPASSEN:
+digits = [(9, 20), (10, 24), (11, 30)]  # <- (Stellen kleiner Faktor, Stellen n)
+per_size = 3  # <- Zahlen pro Größe
+seed = 1  # <- Zufalls-Seed (reproduzierbar)
+
+import random
+import sys
+import time
+from pathlib import Path
+
+from Aufgabe3 import pollards_rho, pollards_rho_brent
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Primzahltest"))
+from primzahltest import is_prime  # noqa: E402
+
+
+def random_prime(rng, k):
+    while True:
+        p = rng.randrange(10 ** (k - 1), 10 ** k)
+        if is_prime(p):
+            return p
+
+
+def semiprimes(rng):
+    for small, total in digits:
+        for _ in range(per_size):
+            p = random_prime(rng, small)
+            q = random_prime(rng, total - small)
+            yield p, q
+
+
+def timed(fn, n):
+    start = time.perf_counter()
+    d = fn(n, x0=2, a=1, max_iters=10 ** 8)
+    return d, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rng = random.Random(seed)
+    total_floyd = total_brent = 0.0
+    print(f"{'n':>32} {'p':>12} {'Floyd [s]':>10} {'Brent [s]':>10} {'Faktor':>7}")
+    for p, q in semiprimes(rng):
+        n = p * q
+        d_f, t_f = timed(pollards_rho, n)
+        d_b, t_b = timed(pollards_rho_brent, n)
+        for d in (d_f, d_b):
+            assert d is None or n % d == 0
+        total_floyd += t_f
+        total_brent += t_b
+        print(f"{n:>32} {p:>12} {t_f:>10.3f} {t_b:>10.3f} {t_f / t_b:>6.1f}x")
+    print(f"\nSumme: Floyd {total_floyd:.2f} s, Brent {total_brent:.2f} s "
+          f"(Faktor {total_floyd / total_brent:.1f})")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Segmentiertes Sieb des Eratosthenes über bytearray (nur ungerade Zahlen).
+
+- ein Byte pro ungerader Zahl statt eines Python-bools (8 Byte) pro Zahl
+- gesiebt wird segmentweise (SEGMENT Bytes, passt in den L2-Cache), der
+  Speicher bleibt konstant: nur das Segment und die Basisprimzahlen bis
+  sqrt(obere Grenze) liegen im Speicher
+- Streichen per Slice-Zuweisung seg[off::p] = bytes(k), die Offsets pro
+  Basisprimzahl werden von Segment zu Segment weitergereicht
+
+primes_up_to(limit)        Liste aller Primzahlen <= limit
+iter_primes(start, stop)   Generator, stop = None läuft endlos
+primes_between(lo, hi)     Generator über lo <= p <= hi
+"""
+
+import itertools
+import math
+
+# -------------------------------------------------------------
+# HIER ANPASSEN:
+limit = 10 ** 7  # <- Primzahlen bis hier zählen
+
+SEGMENT = 1 << 17  # ungerade Zahlen pro Segment (128 KiB)
+
+
+def _odd_base_primes(limit: int):
+    """Odd primes <= limit (einfaches Sieb nur über ungerade Zahlen)."""
+    if limit < 3:
+        return []
+    size = (limit - 1) // 2  # Index i steht für 2i + 3
+    sieve = bytearray([1]) * size
+    for i in range((math.isqrt(limit) - 1) // 2):
+        if sieve[i]:
+            p = 2 * i + 3
+            start = (p * p - 3) // 2
+            sieve[start::p] = bytes(len(range(start, size, p)))
+    return list(itertools.compress(range(3, limit + 1, 2), sieve))
+
+
+def iter_primes(start: int = 2, stop: int | None = None, segment: int = SEGMENT):
+    """Generator over the primes p with start <= p <= stop (stop = None: endlos)."""
+    if start <= 2 and (stop is None or stop >= 2):
+        yield 2
+    lo = max(3, start | 1)
+    base, offsets = [], []
+    base_limit = 1
+
+    while stop is None or lo <= stop:
+        hi = lo + 2 * segment  # exklusiv, lo und hi ungerade
+        if stop is not None:
+            hi = min(hi, stop + 1 + stop % 2)
+        size = (hi - lo) // 2
+
+        # Basisprimzahlen bis sqrt(hi) nachladen
+        need = math.isqrt(hi - 1)
+        if need > base_limit:
+            for p in _odd_base_primes(need):
+                if p <= base_limit:
+                    continue
+                m = max(p * p, (lo + p - 1) // p * p)
+                if m % 2 == 0:
+                    m += p
+                base.append(p)
+                offsets.append((m - lo) // 2)
+            base_limit = need
+
+        seg = bytearray([1]) * size
+        for i, p in enumerate(base):
+            off = offsets[i]
+            if off < size:
+                count = (size - 1 - off) // p + 1
+                seg[off::p] = bytes(count)
+                off += count * p
+            offsets[i] = off - size
+        yield from itertools.compress(range(lo, hi, 2), seg)
+        lo = hi
+
+
+def primes_between(lo: int, hi: int, segment: int = SEGMENT):
+    """Generator over the primes p with lo <= p <= hi."""
+    return iter_primes(lo, hi, segment)
+
+
+def primes_up_to(limit: int):
+    """List of all primes <= limit."""
+    return list(iter_primes(2, limit))
+
+
+# -------------------------------------------------------------
+# Läuft als Skript:
+if __name__ == "__main__":
+    count = sum(1 for _ in iter_primes(2, limit))
+    print(f"π({limit}) = {count}")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Primzahltest: is_prime(n).
+
+- n < 3.3 * 10^24: Miller–Rabin mit den ersten 13 Primzahlen als Basen,
+  das ist für diesen Bereich bewiesen deterministisch
+- darüber BPSW: Miller–Rabin zur Basis 2 plus starker Lucas-Test
+  (Parameter nach Selfridge). Kein Gegenbeispiel bekannt, und für
+  tausendstellige Zahlen nur ein paar Potenzen mod n, also Millisekunden.
+
+Statt Probedivision bis sqrt(n) mit float-Wurzel (ungenau für große n).
+"""
+
+import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import jacobi  # noqa: E402
+
+# -------------------------------------------------------------
+# HIER ANPASSEN:
+n = 2 ** 3217 - 1  # <- zu testende Zahl (Mersenne-Primzahl, 969 Stellen)
+
+MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+MR_DETERMINISTIC_BOUND = 3317044064679887385961981  # gilt für die Basen bis 41
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61,
+                67, 71, 73, 79, 83, 89, 97)
+
+
+def miller_rabin(n: int, bases) -> bool:
+    """Strong probable prime test of odd n > 2 for all given bases."""
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for b in bases:
+        x = pow(b, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def strong_lucas_prp(n: int) -> bool:
+    """
+    Starker Lucas-Test mit P = 1, Q = (1 − D) / 4, D erstes aus
+    5, −7, 9, −11, ... mit (D/n) = −1 (Selfridge, Methode A).
+    n ungerade und keine Quadratzahl.
+    """
+    D = 5
+    while True:
+        j = jacobi(D, n)
+        if j == -1:
+            break
+        if j == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P, Q = 1, (1 - D) // 4
+
+    # n + 1 = d * 2^s mit d ungerade
+    d, s = n + 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    def half(x):
+        return (x + n if x & 1 else x) // 2 % n
+
+    # U_k, V_k, Q^k von links nach rechts über die Bits von d
+    U, V, Qk = 1, P, Q % n
+    for bit in bin(d)[3:]:
+        U, V, Qk = U * V % n, (V * V - 2 * Qk) % n, Qk * Qk % n
+        if bit == "1":
+            U, V = half(P * U + V), half(D * U + P * V)
+            Qk = Qk * Q % n
+
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if V == 0:
+            return True
+    return False
+
+
+def is_prime(n: int) -> bool:
+    """Deterministisch unter 3.3 * 10^24, darüber BPSW."""
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < 97 * 97:
+        return True
+    if n < MR_DETERMINISTIC_BOUND:
+        return miller_rabin(n, MR_BASES)
+    if not miller_rabin(n, (2,)):
+        return False
+    r = math.isqrt(n)
+    if r * r == n:
+        return False
+    return strong_lucas_prp(n)
+
+
+# -------------------------------------------------------------
+# Läuft als Skript:
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    result = is_prime(n)
+    ms = (time.perf_counter() - start) * 1000
+    print(f"n hat {len(str(n))} Stellen: {'prim' if result else 'zusammengesetzt'} ({ms:.1f} ms)")
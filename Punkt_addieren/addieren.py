@@ -3,6 +3,12 @@
 # Für Kurven der Form: y^2 = x^3 + a*x + b (mod p)
 # ============================================================
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod_or_none  # noqa: E402
+
 # --------- 1. PARAMETER ANPASSEN -----------------------------
 # >>> HIER deine Kurve und ECDSA-Parameter einstellen <<<
 
@@ -25,8 +31,8 @@ h = 121          # Hash-Wert der Nachricht
 # --------- 2. HILFSFUNKTIONEN -------------------------------
 
 def inv_mod(x, m):
-    """Modulare Inverse: finde y mit x*y ≡ 1 (mod m)."""
-    return pow(x % m, m - 2, m)  # nur korrekt, wenn m prim
+    """Modulare Inverse: finde y mit x*y ≡ 1 (mod m); 0 für x ≡ 0 wie bisher."""
+    return inv_mod_or_none(x, m) or 0
 
 def ec_add(P, Q):
     """Punktaddition auf der elliptischen Kurve.
@@ -5,6 +5,12 @@
 # Alles läuft über einem Primkörper F_p : 0,1,...,p-1
 # ============================================================
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import inv_mod_or_none  # noqa: E402
+
 # --------- 1. KURVENPARAMETER ANPASSEN ----------------------
 # Hier stellst du deine Kurve ein:
 #   E: y^2 = x^3 + a*x + b  (mod p)
@@ -29,10 +35,9 @@ n = 49363
 def inv_mod(x, p):
     """
     Modularer Inverser von x modulo p.
-    Findet y mit x * y ≡ 1 (mod p).
-    Voraussetzung: p ist prim, x != 0 (mod p).
+    Findet y mit x * y ≡ 1 (mod p); für x ≡ 0 (mod p) wie bisher 0.
     """
-    return pow(x % p, p - 2, p)   # Fermat's little theorem
+    return inv_mod_or_none(x, p) or 0
 
 
 def ec_add(P, Q):
@@ -4,41 +4,42 @@ Simple quadratic sieve implementation in pure Python.
 
 Educational version:
 - No external libraries
-- Works for mittelgroße n (z.B. bis ein paar Millionen / Milliarden),
-  nicht für echte RSA-Größen :)
+- Relationen werden per Log-Sieb gesammelt (bytearray), nur Kandidaten
+  über der Schwelle werden per Probedivision geprüft
+- Works für n mit ca. 30–40 Stellen, nicht für echte RSA-Größen :)
 """
 
+import bisect
 import math
-from itertools import count
+import multiprocessing
+import random
+import sys
+import time
+import warnings
+from pathlib import Path
 
+import relation_store
+from block_lanczos import block_lanczos
 
-# ---------- Hilfsfunktionen ----------
-
-def primes_up_to(limit: int):
-    """Sieve of Eratosthenes: list of primes <= limit."""
-    if limit < 2:
-        return []
-    sieve = [True] * (limit + 1)
-    sieve[0] = sieve[1] = False
-    for p in range(2, int(limit ** 0.5) + 1):
-        if sieve[p]:
-            step = p
-            start = p * p
-            sieve[start:limit + 1:step] = [False] * len(range(start, limit + 1, step))
-    return [p for p, is_p in enumerate(sieve) if is_p]
-
+# segmentiertes Sieb (bytearray) statt einer Liste mit einem bool pro Zahl
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Primzahlsieb"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Batch-GCD"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Primzahltest"))
+from batch_smooth import smooth_factors, smooth_parts  # noqa: E402
+from modarith import inv_mod, legendre, sqrt_mod  # noqa: E402
+from primzahlsieb import primes_up_to  # noqa: E402
+from primzahltest import miller_rabin  # noqa: E402
 
-def is_quadratic_residue(n: int, p: int) -> bool:
-    """Check if n is a quadratic residue mod p (Legendre symbol == 1)."""
-    return pow(n, (p - 1) // 2, p) == 1
 
+# ---------- Hilfsfunktionen ----------
 
 def trial_factor_with_base(m: int, factor_base):
     """
     Try to factor integer m completely over the given factor base.
     Returns (sign, exponents, remaining).
       sign: +1 or -1 (from factor -1)
-      exponents: list of exponents for primes in factor_base (without -1)
+      exponents: dict {Index in factor_base: Exponent}, nur Exponenten > 0
       remaining: leftover factor (>1 if not smooth)
     """
     sign = 1
@@ -46,25 +47,721 @@ def trial_factor_with_base(m: int, factor_base):
         sign = -1
         m = -m
 
-    exponents = [0] * len(factor_base)
+    exponents = {}
 
     for i, p in enumerate(factor_base):
         if p == -1:
             # -1 ist nur im sign enthalten
             continue
+        e = 0
         while m % p == 0:
             m //= p
-            exponents[i] += 1
+            e += 1
+        if e:
+            exponents[i] = e
 
     return sign, exponents, m
 
 
+def split_cofactor(m: int):
+    """Pollard rho on a composite cofactor m = q1 * q2. Returns q1 <= q2 or None."""
+    for c in range(1, 20):
+        x = y = 2
+        d = 1
+        while d == 1:
+            # gcd nur alle 32 Schritte über das Produkt der Differenzen
+            x_save, y_save, prod = x, y, 1
+            for _ in range(32):
+                x = (x * x + c) % m
+                y = (y * y + c) % m
+                y = (y * y + c) % m
+                prod = prod * abs(x - y) % m
+            d = math.gcd(prod, m)
+        if d == m:
+            # Block einzeln wiederholen
+            x, y, d = x_save, y_save, 1
+            while d == 1:
+                x = (x * x + c) % m
+                y = (y * y + c) % m
+                y = (y * y + c) % m
+                d = math.gcd(abs(x - y), m)
+        if d != m:
+            return min(d, m // d), max(d, m // d)
+    return None
+
+
+# ---------- Sieb ----------
+
+# Schranke für große Primzahlen (Large-Prime-Variante): Vielfaches von p_max
+LARGE_PRIME_MULTIPLIER = 64
+
+# large_primes = None: ab so vielen Stellen eine bzw. zwei große Primzahlen.
+# Gemessen (SIQS, ein Kern): LP1 spart ab ca. 35 Stellen 25–40 % (Faktor
+# 1.3–1.6), LP2 ist bis 55 Stellen nicht schneller als LP1 und erst bei
+# 60 Stellen knapp (ca. 7 %) vorne
+LP1_MIN_DIGITS = 35
+LP2_MIN_DIGITS = 60
+
+# Primzahlen unter dieser Grenze werden bei großen Faktorbasen nicht gesiebt:
+# sie treffen sehr viele Positionen, liefern aber nur wenige Bits.
+SMALL_PRIME_CUTOFF = 30
+
+# ab so vielen Kandidaten pro Block wird per Restbaum (Batch-GCD/batch_smooth.py)
+# statt per gcd pro Kandidat getestet
+BATCH_SMOOTH_MIN = 16
+
+# Schwelle pro Teilstück: log2|Q(x)| wächst mit dem Abstand zu sqrt(n), also
+# Teilstücke höchstens so lang wie ihr Abstand (<= 1 Bit Unterschied) und
+# höchstens THRESHOLD_CHUNK lang
+THRESHOLD_CHUNK = 1024
+
+# so viele Blockpaare hintereinander ohne neue Relation: aufgeben (sonst
+# endlos für kleine n, bei denen es kaum glatte Werte gibt)
+MAX_EMPTY_BLOCKS = 200
+
+# unter dieser Grenze Probedivision, wenn das Sieb nicht genug Relationen liefert
+TRIAL_DIVISION_LIMIT = 1 << 40
+
+# SIQS erst ab hier: darunter gibt es zu wenige brauchbare a = q_1 * ... * q_s
+SIQS_MIN = 10 ** 18
+
+
+def choose_parameters(n: int):
+    """
+    Heuristic parameters for n: returns (B, M).
+      B: smoothness bound, ungefähr L(n)^(1/2) = exp(1/2 * sqrt(ln n * ln ln n))
+      M: length of one sieve block, etwa sqrt(n) bis höchstens 2^16
+    """
+    ln_n = math.log(n)
+    B = int(math.exp(0.5 * math.sqrt(ln_n * math.log(ln_n))))
+    B = max(200, B)  # kleinere Faktorbasen liefern für kleine n zu wenige Relationen
+    M = min(1 << 16, max(1 << 10, 1 << (n.bit_length() // 2)))
+    return B, M
+
+
+def build_factor_base(n: int, B: int):
+    """Factor base: -1 plus all primes p <= B with (n|p) = 1."""
+    factor_base = [-1]
+    for p in primes_up_to(B):
+        if legendre(n, p) == 1:
+            factor_base.append(p)
+    return factor_base
+
+
+def sieve_setup(n: int, factor_base):
+    """
+    Precompute for every sieved prime p of the factor base:
+      (p, roots of x^2 ≡ n (mod p), round(log2 p))
+    Sehr kleine Primzahlen werden bei großen Faktorbasen ausgelassen.
+    """
+    fb_primes = factor_base[1:]
+    cutoff = SMALL_PRIME_CUTOFF if len(fb_primes) > 100 else 0
+
+    setup = []
+    for p in fb_primes:
+        if p < cutoff:
+            continue
+        t = sqrt_mod(n, p)
+        roots = (t,) if t == p - t or p == 2 else (t, p - t)
+        setup.append((p, roots, round(math.log2(p))))
+    return setup
+
+
+def sieve_interval(start: int, length: int, setup):
+    """
+    Log sieve over x = start, ..., start + length - 1 for Q(x) = x^2 - n.
+    Für jedes p der Faktorbasis wird log2(p) an allen Positionen mit
+    x ≡ ±t (mod p) addiert. Returns a bytearray of the sums.
+    """
+    block = bytearray(length)
+    for p, roots, logp in setup:
+        for r in roots:
+            for i in range((r - start) % p, length, p):
+                block[i] += logp
+    return block
+
+
+# Übersetzungstabellen für bytes.translate: _MARK_TABLES[t][v] = 1 <=> v >= t
+_MARK_TABLES = [bytes(1 if v >= t else 0 for v in range(256)) for t in range(257)]
+
+
+def smooth_candidates(block, threshold: int):
+    """Positions in the sieve block whose log sum reaches the threshold."""
+    marks = block.translate(_MARK_TABLES[min(threshold, 256)])
+    i = marks.find(1)
+    while i != -1:
+        yield i
+        i = marks.find(1, i + 1)
+
+
+def smooth_cofactor(v: int, fb_product: int) -> int:
+    """Part of |v| without factor-base primes, via gcd with their product."""
+    rem = abs(v)
+    g = math.gcd(rem, fb_product)
+    while g > 1:
+        rem //= g
+        g = math.gcd(rem, g)
+    return rem
+
+
+def large_part(rem: int, p_max: int, large_primes: int):
+    """
+    Classify the cofactor rem left after the factor base.
+    Returns () for rem = 1, (q,) or (q1, q2) for accepted large primes,
+    None otherwise.
+    """
+    if rem == 1:
+        return ()
+    # alle Primteiler von rem sind größer als p_max (sonst wären sie in
+    # der Faktorbasis), rem < p_max^2 ist also selbst prim
+    bound = LARGE_PRIME_MULTIPLIER * p_max
+    if large_primes >= 1 and rem < bound:
+        return (rem,)
+    # zwei große Primzahlen: mit rem < p_max * bound liegen beide Faktoren
+    # automatisch unter der Schranke (q1 > p_max => q2 < bound). Ein
+    # Miller–Rabin-Test zur Basis 2 reicht, um Primzahlen auszusortieren:
+    # eine Pseudoprimzahl kostet nur eine Relation, 13 Basen kosteten
+    # bei LP2 mehr Zeit als das Sieben
+    if large_primes >= 2 and p_max * p_max < rem < p_max * bound \
+            and not miller_rabin(rem, (2,)):
+        return split_cofactor(rem)
+    return None
+
+
+def make_relation(x: int, v: int, factor_base, large_primes: int = 0,
+                  fb_product: int | None = None):
+    """
+    Trial-divide v = x^2 - n over the factor base.
+    Returns the relation dict, or None if v is not smooth.
+
+    large_primes = 1: auch Teilrelationen mit Rest q < LP-Schranke behalten
+    large_primes = 2: zusätzlich Rest q1 * q2 mit q1, q2 < LP-Schranke
+    Die großen Primzahlen stehen in rel["large"] (leer bei vollen Relationen).
+    fb_product = Produkt der Faktorbasis: Vortest per gcd, nur passende
+    Kandidaten werden probedividiert.
+    """
+    if fb_product is not None:
+        large = large_part(smooth_cofactor(v, fb_product), factor_base[-1], large_primes)
+        if large is None:
+            return None
+        if large:
+            # Teilrelation: Probedivision erst, wenn sie in einem Kreis landet
+            return {"x": x, "v": v, "large": large}
+
+    sign, exps, rem = trial_factor_with_base(v, factor_base)
+    if fb_product is None:
+        large = large_part(rem, factor_base[-1], large_primes)
+        if large is None:
+            return None
+
+    return full_relation(x, v, sign, exps, large)
+
+
+def make_relations(candidates, factor_base, large_primes: int = 0,
+                   fb_product: int | None = None):
+    """
+    Batch version of make_relation for the (x, v) candidates of one block.
+    Die Reste nach der Faktorbasis kommen aus einem Restbaum (Bernstein),
+    volle Relationen werden nur noch über ihre Primteiler zerlegt.
+    """
+    if fb_product is None:
+        fb_product = math.prod(factor_base[1:])
+    if len(candidates) < BATCH_SMOOTH_MIN:
+        for x, v in candidates:
+            rel = make_relation(x, v, factor_base, large_primes, fb_product)
+            if rel is not None:
+                yield rel
+        return
+
+    parts = smooth_parts([v for _, v in candidates], fb_product)
+    for (x, v), s in zip(candidates, parts):
+        large = large_part(abs(v) // s, factor_base[-1], large_primes)
+        if large is None:
+            continue
+        if large:
+            yield {"x": x, "v": v, "large": large}
+            continue
+        exps = base_exponents(v, factor_base, math.gcd(s, fb_product))
+        yield full_relation(x, v, -1 if v < 0 else 1, exps)
+
+
+def base_exponents(v: int, factor_base, radical: int):
+    """
+    {Index in factor_base: Exponent} for the factor-base part of v.
+    radical = ggT(v, Produkt der Faktorbasis) (bzw. des glatten Teils): nur
+    dessen Primteiler werden abdividiert, keine Probedivision durch alle p.
+    """
+    return {bisect.bisect_left(factor_base, p, 1): e
+            for p, e in smooth_factors(v, factor_base[1:], radical).items()}
+
+
+def odd_columns(sign: int, exps):
+    """Matrix row as sorted column indices with odd exponent (0 für -1)."""
+    return ([0] if sign == -1 else []) + sorted(i for i, e in exps.items() if e % 2)
+
+
+def full_relation(x: int, v: int, sign: int, exps, large=()):
+    """
+    Relation dict with the mod-2 row for the matrix. Beides dünn:
+    exps = {Index in factor_base: Exponent}, row = odd_columns(sign, exps),
+    also O(Anzahl Primteiler von v) statt O(Größe der Faktorbasis).
+    """
+    row = odd_columns(sign, exps)
+
+    return {
+        "x": x,
+        "v": v,
+        "sign": sign,
+        "exponents": exps,
+        "row": row,
+        "large": large,
+    }
+
+
+def threshold_slack(factor_base, large_primes: int = 0):
+    """
+    How many bits below log2|Q(x)| a sieve value may stay and still be
+    trial-divided (ungesiebte kleine Primzahlen, Rundung, große Primzahlen).
+    """
+    p_max = factor_base[-1] if len(factor_base) > 1 else 2
+    slack = 1.5 * math.log2(p_max)
+    # größter erlaubter Rest (siehe large_part); die volle Länge würde zu viele
+    # Kandidaten ohne brauchbaren Rest liefern
+    # LP2 mit weniger als der Hälfte des Rests: sonst kosten die vielen
+    # Kandidaten (Restbaum, rho auf dem Rest) mehr, als die Kreise bringen
+    bound = LARGE_PRIME_MULTIPLIER * p_max
+    if large_primes == 1:
+        slack += 0.5 * math.log2(bound)
+    elif large_primes >= 2:
+        slack += 0.3 * math.log2(bound * p_max)
+    return round(slack)
+
+
+def threshold_chunks(start: int, length: int, x0: int, n: int, slack: int):
+    """
+    Split a sieve block into pieces (lo, hi, threshold) for smooth_candidates.
+    Die Schwelle kommt vom größten |Q(x)| im Teilstück; oberhalb von sqrt(n)
+    liegt das am rechten, unterhalb am linken Ende.
+    """
+    if start >= x0:
+        lo = 0
+        while lo < length:
+            hi = min(length, lo + min(THRESHOLD_CHUNK, start + lo - x0 + 1))
+            edge = start + hi
+            q_max = max(edge * edge - n, 2)
+            yield lo, hi, max(1, round(math.log2(q_max)) - slack)
+            lo = hi
+    else:
+        hi = length
+        while hi > 0:
+            lo = max(0, hi - min(THRESHOLD_CHUNK, x0 - (start + hi) + 1))
+            edge = start + lo
+            q_max = max(n - edge * edge, 2)
+            yield lo, hi, max(1, round(math.log2(q_max)) - slack)
+            hi = lo
+
+
+def sieve_relations(n: int, factor_base, M: int, large_primes: int = 0,
+                    part: int = 0, parts: int = 1, first_block: int = 0):
+    """
+    Generator of B-smooth relations x^2 - n.
+    Siebt abwechselnd Blöcke der Länge M oberhalb und unterhalb von sqrt(n);
+    unterhalb ist x^2 - n negativ, dafür steht -1 in der Faktorbasis.
+    part/parts: nur jedes parts-te Blockpaar (für parallele Worker).
+    first_block: Blockpaare davor sind schon gesiebt (Resume).
+    Endet nach MAX_EMPTY_BLOCKS eigenen Blockpaaren ohne Relation.
+    """
+    setup = sieve_setup(n, factor_base)
+    fb_product = math.prod(factor_base[1:])
+    slack = threshold_slack(factor_base, large_primes)
+    x0 = math.isqrt(n) + 1
+
+    k = first_block
+    empty = 0
+    while empty < MAX_EMPTY_BLOCKS:
+        blocks = [(x0 + k * M, M)]
+        upper = x0 - k * M
+        if upper > 1:
+            start = max(1, upper - M)
+            blocks.append((start, upper - start))
+        k += 1
+        if (k - 1 - first_block) % parts != part:
+            continue
+
+        empty += 1
+        for start, length in blocks:
+            block = sieve_interval(start, length, setup)
+            candidates = []
+            for lo, hi, threshold in threshold_chunks(start, length, x0, n, slack):
+                for i in smooth_candidates(block[lo:hi], threshold):
+                    x = start + lo + i
+                    v = x * x - n
+                    if v != 0:
+                        candidates.append((x, v))
+            for rel in make_relations(candidates, factor_base, large_primes, fb_product):
+                empty = 0
+                yield rel
+
+
+# ---------- SIQS: viele Polynome (ax+b)^2 - n ----------
+
+def siqs_choose_a(n: int, setup, half: int, rng, used, part: int = 0, parts: int = 1):
+    """
+    Choose a = q_1 * ... * q_s from the factor base with a ≈ sqrt(2n) / half.
+    Returns the list of setup indices of the q_l, or None if the factor base
+    is too small for n.
+    part/parts: nur a mit (Summe der Indizes) ≡ part (mod parts), so bekommen
+    parallele Worker disjunkte Polynome.
+    """
+    target = math.isqrt(2 * n) // half
+    primes = [p for p, _, _ in setup]
+    if target < 3 or len(primes) < 8:
+        return None
+
+    # Primfaktoren von a um 2000 herum (begrenzt durch die Faktorbasis)
+    q_size = min(2000, primes[-1] // 2)
+    s = max(1, round(math.log(target) / math.log(max(q_size, 3))))
+    q_ideal = target ** (1 / s)
+    band = [i for i, p in enumerate(primes) if q_ideal / 2 <= p <= 2 * q_ideal]
+    if len(band) < s + 2:
+        band = list(range(len(primes) // 3, len(primes)))
+
+    for _ in range(100):
+        chosen = rng.sample(band, s - 1) if s > 1 else []
+        prod = math.prod(primes[i] for i in chosen)
+        rest = target // prod
+        # letzter Faktor: noch unbenutzte Primzahl möglichst nahe am Rest
+        offset = sum(chosen)
+        for last in sorted((i for i in range(len(primes))
+                            if i not in chosen and (offset + i) % parts == part),
+                           key=lambda i: abs(primes[i] - rest))[:10]:
+            a = prod * primes[last]
+            if a not in used:
+                used.add(a)
+                return chosen + [last]
+    return None
+
+
+def siqs_relations(n: int, factor_base, M: int, seed: int | None = None,
+                   large_primes: int = 0, part: int = 0, parts: int = 1):
+    """
+    Endless generator of B-smooth relations from SIQS polynomials.
+
+    Für a = q_1 * ... * q_s gibt es 2^(s-1) Werte b mit b^2 ≡ n (mod a).
+    Mit Q(x) = (ax + b)^2 - n = a * g(x) ist |g(x)| ≈ sqrt(n/2) * M auf
+    dem Siebintervall -M/2 <= x < M/2. Der Wechsel zum nächsten b (Gray-Code)
+    kostet pro Primzahl nur eine Addition der Wurzeln.
+    Relationen haben dasselbe Format wie beim einfachen Sieb mit x = ax + b.
+    """
+    setup = sieve_setup(n, factor_base)
+    fb_product = math.prod(factor_base[1:])
+    rng = random.Random(seed)
+    used = set()
+    half = M // 2
+    slack = threshold_slack(factor_base, large_primes)
+    threshold = max(1, round(math.log2(half) + math.log2(n) / 2 - 0.5) - slack)
+
+    while True:
+        chosen = siqs_choose_a(n, setup, half, rng, used, part, parts)
+        if chosen is None:
+            raise ValueError(f"Faktorbasis zu klein für SIQS mit n = {n}")
+        a = math.prod(setup[i][0] for i in chosen)
+
+        # B_l mit B_l^2 ≡ n (mod q_l) und B_l ≡ 0 (mod q_j), j != l
+        B_list = []
+        for i in chosen:
+            q, roots, _ = setup[i]
+            a_q = a // q
+            gamma = roots[0] * inv_mod(a_q, q) % q
+            if gamma > q // 2:
+                gamma = q - gamma
+            B_list.append(a_q * gamma)
+        b = sum(B_list)
+
+        # Wurzeln von g(x) für alle Siebprimzahlen, die a nicht teilen
+        chosen_set = set(chosen)
+        active = []   # (p, logp, soln1, soln2, [2*B_l*a^-1 mod p])
+        for i, (p, roots, logp) in enumerate(setup):
+            if i in chosen_set:
+                continue
+            a_inv = inv_mod(a, p)
+            t = roots[0]
+            active.append([p, logp,
+                           a_inv * (t - b) % p, a_inv * (-t - b) % p,
+                           [2 * B_l * a_inv % p for B_l in B_list]])
+
+        for j in range(1 << (len(B_list) - 1)):
+            if j > 0:
+                # Gray-Code: b_(j+1) = b_j + 2 * (-1)^ceil(j / 2^(l+1)) * B_l
+                l = (j & -j).bit_length() - 1
+                up = -(-j // (1 << (l + 1))) % 2 == 0
+                b = b + 2 * B_list[l] if up else b - 2 * B_list[l]
+                for entry in active:
+                    p, delta = entry[0], entry[4][l]
+                    if up:
+                        entry[2] = (entry[2] - delta) % p
+                        entry[3] = (entry[3] - delta) % p
+                    else:
+                        entry[2] = (entry[2] + delta) % p
+                        entry[3] = (entry[3] + delta) % p
+
+            poly_setup = [(p, (s1,) if s1 == s2 else (s1, s2), logp)
+                          for p, logp, s1, s2, _ in active]
+            block = sieve_interval(-half, M, poly_setup)
+            candidates = []
+            for i in smooth_candidates(block, threshold):
+                X = a * (i - half) + b
+                v = X * X - n
+                if v != 0:
+                    candidates.append((X, v))
+            yield from make_relations(candidates, factor_base, large_primes, fb_product)
+
+
+# ---------- Parallel: mehrere Prozesse sieben, der Elternprozess sammelt ----------
+
+def relation_source(n: int, factor_base, M: int, method: str = "qs",
+                    large_primes: int = 0, part: int = 0, parts: int = 1,
+                    offset: int = 0):
+    """
+    Relation generator for the chosen method (Teil part von parts).
+    offset > 0 beim Resume: erstes Blockpaar (qs) bzw. anderer Seed (siqs),
+    damit nicht dieselben Relationen noch einmal gesiebt werden.
+    """
+    if method == "siqs":
+        return siqs_relations(n, factor_base, M, seed=offset * parts + part,
+                              large_primes=large_primes, part=part, parts=parts)
+    return sieve_relations(n, factor_base, M, large_primes=large_primes,
+                           part=part, parts=parts, first_block=offset)
+
+
+def sieve_worker(queue, stop, n: int, factor_base, M: int, method: str,
+                 large_primes: int, part: int, parts: int, offset: int = 0):
+    """
+    Worker process: sieves its share of blocks/polynomials and sends
+    relations in small batches through the queue until stop is set.
+    """
+    batch = []
+    last_flush = time.monotonic()
+    for rel in relation_source(n, factor_base, M, method, large_primes, part, parts,
+                               offset):
+        if stop.is_set():
+            return
+        batch.append(rel)
+        if len(batch) >= 32 or time.monotonic() - last_flush > 0.5:
+            queue.put(batch)
+            batch = []
+            last_flush = time.monotonic()
+    # Quelle erschöpft (siehe MAX_EMPTY_BLOCKS): Rest und Endmarke
+    queue.put(batch)
+    queue.put(None)
+
+
+def parallel_relations(n: int, factor_base, M: int, method: str = "qs",
+                       large_primes: int = 0, workers: int = 2, offset: int = 0):
+    """
+    Generator over relations from `workers` sieving processes.
+    Jeder Worker siebt disjunkte Blöcke (qs) bzw. Polynome (siqs). Beim
+    Schließen des Generators werden alle Worker beendet.
+    """
+    ctx = multiprocessing.get_context()
+    queue = ctx.Queue()
+    stop = ctx.Event()
+    procs = [ctx.Process(target=sieve_worker, daemon=True,
+                         args=(queue, stop, n, factor_base, M, method,
+                               large_primes, part, workers, offset))
+             for part in range(workers)]
+    for proc in procs:
+        proc.start()
+    try:
+        running = workers
+        while running:
+            batch = queue.get()
+            if batch is None:
+                running -= 1
+            else:
+                yield from batch
+    finally:
+        stop.set()
+        for proc in procs:
+            proc.terminate()
+            proc.join()
+
+
+# ---------- Large-Prime-Variante: Teilrelationen als Graph ----------
+
+def combine_relations(rels, n: int, factor_base, fb_product: int | None = None):
+    """
+    Multiply relations whose large primes all occur an even number of times.
+    Das Ergebnis ist eine volle Relation (x^2 ≡ v mod n, v glatt bis auf
+    Quadrate großer Primzahlen); rel["large_root"] ist die Wurzel dieser
+    Quadrate mod n.
+    Teilrelationen werden hier erst zerlegt (über den ggT mit fb_product)
+    und behalten ihre Exponenten, falls sie in weiteren Kreisen vorkommen.
+    """
+    if fb_product is None:
+        fb_product = math.prod(factor_base[1:])
+    x, v, sign = 1, 1, 1
+    exps = {}
+    large_count = {}
+    for rel in rels:
+        if "exponents" not in rel:
+            rel["sign"] = -1 if rel["v"] < 0 else 1
+            rel["exponents"] = base_exponents(rel["v"], factor_base,
+                                              math.gcd(rel["v"], fb_product))
+        rel_sign, rel_exps = rel["sign"], rel["exponents"]
+        x = (x * rel["x"]) % n
+        v *= rel["v"]
+        sign *= rel_sign
+        for i, e in rel_exps.items():
+            exps[i] = exps.get(i, 0) + e
+        for q in rel["large"]:
+            large_count[q] = large_count.get(q, 0) + 1
+
+    large_root = 1
+    for q, c in large_count.items():
+        large_root = large_root * pow(q, c // 2, n) % n
+
+    row = odd_columns(sign, exps)
+    return {
+        "x": x,
+        "v": v,
+        "sign": sign,
+        "exponents": exps,
+        "row": row,
+        "large": (),
+        "large_root": large_root,
+    }
+
+
+class PartialRelations:
+    """
+    Teilrelationen als Graph: Knoten sind große Primzahlen (1 für
+    "keine zweite Primzahl"), jede Teilrelation ist eine Kante. Schließt eine
+    neue Kante einen Kreis, kommt jede Primzahl im Kreis genau zweimal vor,
+    das Produkt der Relationen ist also eine volle Relation.
+    Gespeichert wird nur ein Wald mit Zeigern zur Wurzel (Hash-Tabelle).
+    """
+
+    def __init__(self, n: int, factor_base):
+        self.n = n
+        self.factor_base = factor_base
+        self.fb_product = math.prod(factor_base[1:])
+        self.up = {}       # Knoten -> (Elternknoten, Relation); Wurzeln fehlen
+        self.partials = 0
+        self.cycles = 0
+
+    def _chain(self, u):
+        """Vertices from u up to the root of its tree."""
+        chain = [u]
+        while chain[-1] in self.up:
+            chain.append(self.up[chain[-1]][0])
+        return chain
+
+    def add(self, rel):
+        """Add a partial relation. Returns a full relation if a cycle closes."""
+        self.partials += 1
+        u, w = (1, rel["large"][0]) if len(rel["large"]) == 1 else rel["large"]
+        if u == w:
+            # Rest q^2: schon für sich eine volle Relation
+            self.cycles += 1
+            return combine_relations([rel], self.n, self.factor_base, self.fb_product)
+
+        chain_u, chain_w = self._chain(u), self._chain(w)
+        if chain_u[-1] == chain_w[-1]:
+            # Kreis: Wege u -> lca und w -> lca plus die neue Kante
+            on_u = set(chain_u)
+            lca = next(v for v in chain_w if v in on_u)
+            rels = [rel]
+            for chain in (chain_u, chain_w):
+                for v in chain[:chain.index(lca)]:
+                    rels.append(self.up[v][1])
+            self.cycles += 1
+            return combine_relations(rels, self.n, self.factor_base, self.fb_product)
+
+        # u zur Wurzel seines Baums machen (Kanten umdrehen), dann an w hängen
+        edges = [self.up[v] for v in chain_u[:-1]]
+        for v, (parent, r) in zip(chain_u, edges):
+            self.up[parent] = (v, r)
+        self.up[u] = (w, rel)
+        return None
+
+
+class RelationSet:
+    """
+    Gesammelte Relationen: Duplikate (gleiches |x|) fallen weg,
+    Teilrelationen gehen in den Graphen, volle Relationen in die Matrix.
+    """
+
+    def __init__(self, n: int, factor_base):
+        self.relations = []      # list of dicts: {x, v, sign, exponents, row}
+        self.exponent_rows = []  # Spalten mit ungeradem Exponenten (0 = -1)
+        self.seen = set()        # verschiedene Polynome können dieselbe Relation liefern
+        self.partials = PartialRelations(n, factor_base)
+
+    def __len__(self):
+        return len(self.relations)
+
+    def add(self, rel) -> bool:
+        """Add a raw relation from the sieve. Returns False for duplicates."""
+        if abs(rel["x"]) in self.seen:
+            return False
+        self.seen.add(abs(rel["x"]))
+        if rel["large"]:
+            rel = self.partials.add(rel)
+            if rel is None:
+                return True
+        self.relations.append(rel)
+        self.exponent_rows.append(rel["row"])
+        return True
+
+
+# ---------- Relationen-Datei: Checkpoint, Resume, Merge ----------
+
+def relation_from_file(entry, n: int, factor_base, fb_index, fb_product: int):
+    """
+    Relation dict for one parsed line of a relation file (relation_store),
+    or None if it does not check out: anderes n, abgeschnittene Zeile oder
+    Primzahl außerhalb der Faktorbasis.
+    """
+    x = entry[1]
+    v = x * x - n
+    if v == 0:
+        return None
+    if entry[0] == "P":
+        large = entry[2]
+        q = math.prod(large)
+        if v % q or smooth_cofactor(v // q, fb_product) != 1:
+            return None
+        return {"x": x, "v": v, "large": large}
+
+    _, _, sign, primes = entry
+    exps = {}
+    for p, e in primes.items():
+        if p not in fb_index:
+            return None
+        exps[fb_index[p]] = e
+    if v != sign * math.prod(p ** e for p, e in primes.items()):
+        return None
+    return full_relation(x, v, sign, exps)
+
+
+def load_relations(paths, n: int, factor_base):
+    """Generator over the checked relations of one or more relation files."""
+    fb_index = {p: i for i, p in enumerate(factor_base) if p > 0}
+    fb_product = math.prod(factor_base[1:])
+    for path in paths:
+        for entry in relation_store.read_relations(path):
+            rel = relation_from_file(entry, n, factor_base, fb_index, fb_product)
+            if rel is not None:
+                yield rel
+
+
 # ---------- Lineare Algebra mod 2 ----------
 
-def find_dependencies_mod2(matrix):
+def find_dependencies_mod2(matrix, n_cols: int):
     """
     Find linear dependencies between rows of a 0/1-matrix over GF(2).
-    matrix: list of lists (rows)
+    matrix: list of rows, each row the list of columns with a 1
     Returns a list of bitmasks; each mask describes a nontrivial combination
     of rows that sums to the zero vector.
     """
@@ -72,32 +769,32 @@ def find_dependencies_mod2(matrix):
         return []
 
     n_rows = len(matrix)
-    n_cols = len(matrix[0])
 
     # represent each row as bit-int over columns
     row_bits = []
     for row in matrix:
         bits = 0
-        for c, val in enumerate(row):
-            if val & 1:
-                bits |= (1 << c)
+        for c in row:
+            bits ^= 1 << c
         row_bits.append(bits)
 
     # combination bits: which original rows make up this current row
     comb_bits = [1 << r for r in range(n_rows)]
 
     dependencies = []
+    used_pivot = [False] * n_rows
 
     # Gaussian elimination over GF(2)
     for col in range(n_cols):
-        # find pivot row with bit set in this col
+        # find pivot row with bit set in this col (each row only pivots once)
         pivot = None
         for r in range(n_rows):
-            if (row_bits[r] >> col) & 1:
+            if not used_pivot[r] and (row_bits[r] >> col) & 1:
                 pivot = r
                 break
         if pivot is None:
             continue
+        used_pivot[pivot] = True
 
         # use pivot to eliminate this column from other rows
         for r in range(n_rows):
@@ -113,25 +810,127 @@ def find_dependencies_mod2(matrix):
     return dependencies
 
 
+# Ab dieser Anzahl Relationen lohnt sich Block Lanczos gegenüber Gauss
+LANCZOS_MIN_RELATIONS = 300
+
+
+def find_dependencies(matrix, n_cols: int):
+    """
+    Dependencies between the rows of a 0/1-matrix over GF(2), as bitmasks.
+    matrix: dünne Zeilen (Spaltenindizes mit 1), n_cols Spalten.
+    Große Matrizen gehen direkt an Block Lanczos, kleine oder wenn Lanczos
+    nichts findet an find_dependencies_mod2.
+    """
+    if len(matrix) >= LANCZOS_MIN_RELATIONS:
+        deps = block_lanczos(matrix, n_cols)
+        if deps:
+            return deps
+    return find_dependencies_mod2(matrix, n_cols)
+
+
+# ---------- Quadratwurzel ----------
+
+def square_root(relations, mask: int, factor_base, n: int):
+    """
+    X and Y with X^2 ≡ Y^2 (mod n) for the relations selected by mask.
+    X = Produkt der x mod n. Für Y werden die Exponentenvektoren summiert,
+    halbiert und Y = prod p^(e/2) mod n direkt aus der Faktorbasis gebildet
+    (plus die Wurzeln der großen Primzahlen), ohne das riesige Produkt der v.
+    Returns (X, None) if some exponent sum is odd.
+    """
+    X = 1
+    sums = {}
+    negatives = 0
+    large_root = 1
+    for i, rel in enumerate(relations):
+        if (mask >> i) & 1:
+            X = (X * rel["x"]) % n
+            if rel["sign"] == -1:
+                negatives += 1
+            for j, e in rel["exponents"].items():
+                sums[j] = sums.get(j, 0) + e
+            large_root = large_root * rel.get("large_root", 1) % n
+
+    if negatives % 2 or any(e % 2 for e in sums.values()):
+        return X, None
+
+    Y = large_root
+    for j, e in sums.items():
+        Y = Y * pow(factor_base[j], e // 2, n) % n
+    return X, Y
+
+
 # ---------- Quadratisches Sieb ----------
 
-def quadratic_sieve(n: int, B: int = 50, max_relations: int | None = None):
+def default_large_primes(n: int) -> int:
+    """Large-prime variant for n (0, 1 or 2), nach den gemessenen Schwellen."""
+    digits = len(str(n))
+    if digits >= LP2_MIN_DIGITS:
+        return 2
+    if digits >= LP1_MIN_DIGITS:
+        return 1
+    return 0
+
+
+def quadratic_sieve(n: int, B: int | None = None, max_relations: int | None = None,
+                    M: int | None = None, method: str = "qs", large_primes: int | None = None,
+                    workers: int = 1, relation_file: str | None = None):
     """
-    Factor n using a simple quadratic sieve.
-    B    = smoothness bound (creates factor base of primes <= B)
+    Factor n using a quadratic sieve with log-approximation sieving.
+    B    = smoothness bound (creates factor base of primes <= B),
+           None = automatisch aus der Größe von n
     max_relations = optional upper bound for collected relations
+    M    = length of one sieve block (None = automatisch)
+    method = "qs"   : ein Polynom x^2 - n (Blöcke um sqrt(n))
+             "siqs" : self-initialising multiple polynomials (ax+b)^2 - n,
+                      lohnt sich ab ca. 25 Stellen; für n < SIQS_MIN (10^18)
+                      wird stattdessen "qs" genommen (mit RuntimeWarning)
+    large_primes = 0: nur volle Relationen
+                   1: Teilrelationen mit einer großen Primzahl (Kreise im Graph)
+                   2: auch mit zwei großen Primzahlen
+                   None: automatisch, 1 ab LP1_MIN_DIGITS (35) Stellen,
+                   2 ab LP2_MIN_DIGITS (60); darunter lohnt LP2 nicht
+    workers = Anzahl Sieb-Prozesse (1 = alles im aktuellen Prozess)
+    relation_file = Relationen-Datei (relation_store): vorhandene Relationen
+                    werden geladen, neue sofort angehängt. Ein abgebrochener
+                    Lauf macht mit denselben Parametern dort weiter.
     Returns a nontrivial factor of n, or None if it fails.
     """
+    if method not in ("qs", "siqs"):
+        raise ValueError(f"Unbekannte Methode: {method!r} (erwarte 'qs' oder 'siqs')")
+    if method == "siqs" and n < SIQS_MIN:
+        warnings.warn(f"SIQS braucht n >= 10^18, n = {n} wird mit method='qs' gesiebt",
+                      RuntimeWarning, stacklevel=2)
+        method = "qs"
+    if large_primes is None:
+        large_primes = default_large_primes(n)
 
     if n % 2 == 0:
         return 2
+    r = math.isqrt(n)
+    if r * r == n:
+        return r
+
+    header = None
+    if relation_file is not None:
+        header = relation_store.read_header(relation_file)
+        if header is not None and B is None:
+            # Resume: dieselbe Faktorbasis wie beim ersten Lauf
+            B = header["B"]
+
+    B_auto, M_auto = choose_parameters(n)
+    if B is None:
+        B = B_auto
+    if M is None:
+        M = M_auto
+
+    # kleine Primteiler fallen nicht in die Faktorbasis ((n|p) = 0)
+    for p in primes_up_to(B):
+        if n % p == 0:
+            return p
 
     # 1) Factor base bauen: -1 plus alle kleinen p mit (n|p)=1
-    primes = primes_up_to(B)
-    factor_base = [-1]
-    for p in primes:
-        if is_quadratic_residue(n, p):
-            factor_base.append(p)
+    factor_base = build_factor_base(n, B)
 
     # number of primes (without -1 for exponents)
     fb_primes = factor_base[1:]
@@ -141,59 +940,78 @@ def quadratic_sieve(n: int, B: int = 50, max_relations: int | None = None):
     if max_relations is None:
         max_relations = fb_size + 10
 
-    relations = []      # list of dicts: {x, v, sign, exponents}
-    exponent_rows = []  # exponents mod 2 (including -1)
+    collected = RelationSet(n, factor_base)
 
-    # 2) B-smooth Relationen sammeln: x^2 - n ist glatt
-    x0 = math.isqrt(n) + 1
-    for x in count(x0):
-        v = x * x - n
-        sign, exps, rem = trial_factor_with_base(v, factor_base)
-
-        if rem == 1:  # komplett glatt
-            # exponents incl -1 als erste Komponente (für die Matrix)
-            row = [0] * (1 + fb_size)  # index 0 für -1, 1.. für primes
-            if sign == -1:
-                row[0] = 1
-            for i, e in enumerate(exps[1:], start=1):
-                row[i] = e % 2
-
-            relations.append({
-                "x": x,
-                "v": v,
-                "sign": sign,
-                "exponents": exps,
-                "row": row,
-            })
-            exponent_rows.append(row)
-
-            if len(relations) >= max_relations:
+    # Resume: schon gespeicherte Relationen zuerst
+    store = None
+    offset = 0
+    if relation_file is not None:
+        if header is not None:
+            x0 = math.isqrt(n) + 1
+            loaded, farthest = 0, 0
+            for rel in load_relations([relation_file], n, factor_base):
+                collected.add(rel)
+                loaded += 1
+                farthest = max(farthest, abs(rel["x"] - x0))
+                if len(collected) >= max_relations:
+                    break
+            if header["method"] == method and loaded:
+                # qs: hinter dem weitesten Blockpaar weitersieben,
+                # siqs: neuer Seed für andere Polynome
+                offset = farthest // M + 1 if method == "qs" else loaded
+        store = relation_store.RelationWriter(relation_file, n, B, factor_base, method)
+
+    # 2) B-smooth Relationen sammeln: x^2 - n ist glatt (nur Siebkandidaten)
+    if len(collected) < max_relations:
+        if workers > 1:
+            source = parallel_relations(n, factor_base, M, method, large_primes,
+                                        workers, offset)
+        else:
+            source = relation_source(n, factor_base, M, method, large_primes,
+                                     offset=offset)
+
+        for rel in source:
+            if not collected.add(rel):
+                continue
+            if store is not None:
+                store.append(rel)
+            if len(collected) >= max_relations:
                 break
+        source.close()  # stoppt ggf. die Worker-Prozesse
+    if store is not None:
+        store.close()
 
-    if len(relations) <= fb_size:
+    if len(collected) > fb_size:
+        f = factor_from_relations(collected.relations, collected.exponent_rows,
+                                  factor_base, n)
+        if f is not None:
+            return f
+    else:
         print("Not enough relations collected.")
-        return None
 
+    # kleine n: zu wenige glatte Werte oder nur triviale Abhängigkeiten
+    if n < TRIAL_DIVISION_LIMIT:
+        for p in primes_up_to(math.isqrt(n)):
+            if n % p == 0:
+                return p
+    return None
+
+
+def factor_from_relations(relations, exponent_rows, factor_base, n: int):
+    """
+    Schritte 3-5 des QS: Abhängigkeiten mod 2, Quadratwurzeln, gcd.
+    Returns a nontrivial factor of n, or None.
+    """
     # 3) Lineare Abhängigkeiten im Exponentenraum mod 2 finden
-    deps = find_dependencies_mod2(exponent_rows)
+    deps = find_dependencies(exponent_rows, len(factor_base))
     if not deps:
         print("No dependencies found.")
         return None
 
     # 4) Jede gefundene Abhängigkeit liefert einen Kandidaten (X, Y)
     for mask in deps:
-        X = 1
-        V = 1
-        used_indices = []
-        for i, rel in enumerate(relations):
-            if (mask >> i) & 1:
-                used_indices.append(i)
-                X = (X * rel["x"]) % n
-                V *= rel["v"]
-
-        # V sollte perfektes Quadrat sein:
-        Y = math.isqrt(abs(V))
-        if Y * Y != abs(V):
+        X, Y = square_root(relations, mask, factor_base, n)
+        if Y is None:
             # Something went wrong; skip this dependency
             continue
 
@@ -206,9 +1024,38 @@ def quadratic_sieve(n: int, B: int = 50, max_relations: int | None = None):
     return None
 
 
-def factor_with_quadratic_sieve(n: int, B: int = 50):
+def factor_from_relation_files(paths):
+    """
+    Nur lineare Algebra und Quadratwurzel auf vorhandenen Relationen-Dateien
+    (z.B. von mehreren Rechnern gesammelt). n und B stehen in der Kopfzeile;
+    alle Dateien müssen dazu passen.
+    Returns a nontrivial factor of n, or None.
+    """
+    headers = [relation_store.read_header(path) for path in paths]
+    if not headers or any(h is None for h in headers):
+        raise ValueError("jede Relationen-Datei braucht eine Kopfzeile")
+    n, B = headers[0]["n"], headers[0]["B"]
+    if any((h["n"], h["B"]) != (n, B) for h in headers):
+        raise ValueError("Relationen-Dateien für verschiedene n oder B")
+
+    factor_base = build_factor_base(n, B)
+    collected = RelationSet(n, factor_base)
+    for rel in load_relations(paths, n, factor_base):
+        collected.add(rel)
+
+    if len(collected) < len(factor_base):
+        print(f"Not enough relations: {len(collected)} of {len(factor_base)}.")
+        return None
+    return factor_from_relations(collected.relations, collected.exponent_rows,
+                                 factor_base, n)
+
+
+def factor_with_quadratic_sieve(n: int, B: int | None = None, method: str = "qs",
+                                large_primes: int | None = None, workers: int = 1,
+                                relation_file: str | None = None):
     """Convenience wrapper: returns (p, q) with p*q = n, or None."""
-    f = quadratic_sieve(n, B=B)
+    f = quadratic_sieve(n, B=B, method=method, large_primes=large_primes,
+                        workers=workers, relation_file=relation_file)
     if f is None:
         return None
     return f, n // f
@@ -219,3 +1066,8 @@ if __name__ == "__main__":
     n = 737
     factors = factor_with_quadratic_sieve(n, B=50)
     print(f"n = {n}, factors = {factors}")
+
+    # Kontrolle: kleine Semiprimzahlen mit automatischen Parametern
+    for n, p in ((737, 11), (8051, 83), (10403, 101), (1022117, 1009)):
+        factors = factor_with_quadratic_sieve(n)
+        print(f"n = {n}, factors = {factors}, ok: {factors is not None and p in factors}")
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Block Lanczos (Montgomery 1995) über GF(2) für die lineare Algebra im QS.
+
+Die Matrix wird dünn gespeichert (compressed sparse rows): pro Relation die
+Liste der Primzahl-Indizes mit ungeradem Exponenten. Gesucht sind
+Kombinationen von Relationen, deren Exponentenvektoren sich zu 0 addieren,
+also der Kern von B mit B = (Primzahlen x Relationen).
+
+- Filter: Singletons (Primzahlen in nur einer Relation) entfernen
+- Lanczos auf A = B^T B mit Blöcken aus 64 Vektoren (ein Python-int pro Zeile)
+- Nachbearbeitung: aus X - Y und V_m die Kernvektoren von B kombinieren
+
+Pure Python, keine externen Bibliotheken.
+"""
+
+import random
+
+N = 64
+ALL_ONES = (1 << N) - 1
+
+
+# ---------- Filter ----------
+
+def remove_singletons(rows):
+    """
+    Drop relations that contain a prime occurring in no other relation;
+    repeated until nothing changes.
+    rows: list of lists of prime indices (one list per relation)
+    Returns the indices of the remaining relations.
+    """
+    alive = [True] * len(rows)
+    count = {}
+    for cols in rows:
+        for c in cols:
+            count[c] = count.get(c, 0) + 1
+
+    changed = True
+    while changed:
+        changed = False
+        for j, cols in enumerate(rows):
+            if alive[j] and any(count[c] == 1 for c in cols):
+                alive[j] = False
+                changed = True
+                for c in cols:
+                    count[c] -= 1
+    return [j for j in range(len(rows)) if alive[j]]
+
+
+def compress_columns(rows):
+    """Renumber the prime indices of rows to 0..k-1. Returns (rows, k)."""
+    index = {}
+    new_rows = []
+    for cols in rows:
+        new_rows.append([index.setdefault(c, len(index)) for c in cols])
+    return new_rows, len(index)
+
+
+# ---------- dichte 64x64-Operationen (Zeile = ein int) ----------
+
+def _byte_tables(M):
+    """For each byte position k: table[b] = XOR of M[8k + i] for bits i of b."""
+    tables = []
+    for k in range(N // 8):
+        part = M[8 * k:8 * k + 8]
+        table = [0] * 256
+        for b in range(1, 256):
+            low = b & -b
+            table[b] = table[b ^ low] ^ part[low.bit_length() - 1]
+        tables.append(table)
+    return tables
+
+
+def mul_nx64_64x64(V, M):
+    """(n x 64) * (64 x 64): row i of the result is XOR of M[c] for bits c of V[i]."""
+    t0, t1, t2, t3, t4, t5, t6, t7 = _byte_tables(M)
+    return [t0[v & 255] ^ t1[(v >> 8) & 255] ^ t2[(v >> 16) & 255] ^ t3[(v >> 24) & 255]
+            ^ t4[(v >> 32) & 255] ^ t5[(v >> 40) & 255] ^ t6[(v >> 48) & 255]
+            ^ t7[v >> 56] for v in V]
+
+
+def mul_64xn_nx64(X, Y):
+    """X^T * Y for two (n x 64) blocks: result row c is XOR of Y[i] for bit c of X[i]."""
+    tables = [[0] * 256 for _ in range(N // 8)]
+    for x, y in zip(X, Y):
+        k = 0
+        while x:
+            b = x & 255
+            if b:
+                tables[k][b] ^= y
+            x >>= 8
+            k += 1
+
+    result = [0] * N
+    for k, table in enumerate(tables):
+        for b in range(1, 256):
+            y = table[b]
+            if y:
+                while b:
+                    low = b & -b
+                    result[8 * k + low.bit_length() - 1] ^= y
+                    b ^= low
+    return result
+
+
+def _identity():
+    return [1 << i for i in range(N)]
+
+
+# ---------- dünne Matrix ----------
+
+def mul_sparse(rows, n_cols, V):
+    """B * V: V has one word per relation, the result one word per prime."""
+    out = [0] * n_cols
+    for cols, v in zip(rows, V):
+        if v:
+            for c in cols:
+                out[c] ^= v
+    return out
+
+
+def mul_sparse_transposed(rows, T):
+    """B^T * T: one word per relation."""
+    out = []
+    for cols in rows:
+        acc = 0
+        for c in cols:
+            acc ^= T[c]
+        out.append(acc)
+    return out
+
+
+def mul_symmetric(rows, n_cols, V):
+    """A * V with A = B^T B (A wird nie explizit gebildet)."""
+    return mul_sparse_transposed(rows, mul_sparse(rows, n_cols, V))
+
+
+# ---------- Lanczos ----------
+
+def find_nonsingular_sub(T, last_s, last_dim):
+    """
+    Choose the columns S_i for which S^T (V^T A V) S is invertible and
+    compute W_inv = S (S^T V^T A V S)^-1 S^T.
+    Spalten, die in S_(i-1) fehlten, werden bevorzugt (Montgomery).
+    Returns (w_inv, s, dim) or None if the step fails.
+    """
+    M = [[T[i], 1 << i] for i in range(N)]
+
+    # Spalten aus last_s ans Ende, alle anderen nach vorne
+    mask = 0
+    s = [0] * N
+    for i in range(last_dim):
+        mask |= 1 << last_s[i]
+        s[N - 1 - i] = last_s[i]
+    j = 0
+    for i in range(N):
+        if not mask & (1 << i):
+            s[j] = i
+            j += 1
+
+    dim = 0
+    for i in range(N):
+        bit = 1 << s[i]
+        row_i = M[s[i]]
+
+        # Pivot in der linken Hälfte suchen
+        for j in range(i, N):
+            row_j = M[s[j]]
+            if row_j[0] & bit:
+                row_i[:], row_j[:] = row_j[:], row_i[:]
+                break
+        else:
+            j = N
+
+        if j < N:
+            for k in range(N):
+                row_k = M[s[k]]
+                if row_k is not row_i and row_k[0] & bit:
+                    row_k[0] ^= row_i[0]
+                    row_k[1] ^= row_i[1]
+            s[dim] = s[i]
+            dim += 1
+            continue
+
+        # sonst mit der rechten Hälfte ausgleichen und die Zeile löschen
+        for j in range(i, N):
+            row_j = M[s[j]]
+            if row_j[1] & bit:
+                row_i[:], row_j[:] = row_j[:], row_i[:]
+                break
+        else:
+            return None
+
+        for k in range(N):
+            row_k = M[s[k]]
+            if row_k is not row_i and row_k[1] & bit:
+                row_k[0] ^= row_i[0]
+                row_k[1] ^= row_i[1]
+        row_i[0] = row_i[1] = 0
+
+    # alle Spalten müssen in S_i oder S_(i-1) vorkommen
+    used = 0
+    for i in range(dim):
+        used |= 1 << s[i]
+    for i in range(last_dim):
+        used |= 1 << last_s[i]
+    if used != ALL_ONES:
+        return None
+
+    return [M[i][1] for i in range(N)], s[:dim], dim
+
+
+def _lanczos_iteration(rows, n_cols, rng):
+    """
+    Core iteration. Returns (X + Y, V_m) with A (X + Y) = 0 ideally,
+    or None if the iteration broke down.
+    """
+    n = len(rows)
+    Y = [rng.getrandbits(N) for _ in range(n)]
+    v0 = mul_symmetric(rows, n_cols, Y)
+
+    X = [0] * n
+    v = [v0, [0] * n, [0] * n]
+    w_inv = [None, [0] * N, [0] * N]
+    vt_a_v = [None, [0] * N]
+    vt_a2_v = [None, [0] * N]
+    s1, dim1, mask1 = list(range(N)), N, ALL_ONES
+    identity = _identity()
+
+    for _ in range(n // (N - 1) + 20):
+        av = mul_symmetric(rows, n_cols, v[0])
+        vt_a_v[0] = mul_64xn_nx64(v[0], av)
+        vt_a2_v[0] = mul_64xn_nx64(av, av)
+
+        if not any(vt_a_v[0]):
+            break
+
+        found = find_nonsingular_sub(vt_a_v[0], s1, dim1)
+        if found is None:
+            return None
+        w_inv[0], s0, dim0 = found
+        if dim0 == 0:
+            return None
+        mask0 = 0
+        for c in s0:
+            mask0 |= 1 << c
+
+        # D = I - W_inv0 (V0^T A^2 V0 S0 S0^T + V0^T A V0)
+        d = [(a2 & mask0) ^ a for a2, a in zip(vt_a2_v[0], vt_a_v[0])]
+        d = mul_nx64_64x64(w_inv[0], d)
+        d = [x ^ i for x, i in zip(d, identity)]
+
+        # E = - W_inv1 V0^T A V0 S0 S0^T
+        e = [x & mask0 for x in mul_nx64_64x64(w_inv[1], vt_a_v[0])]
+
+        # F = - W_inv2 (I - V1^T A V1 W_inv1)(V1^T A^2 V1 S1 S1^T + V1^T A V1) S0 S0^T
+        f = mul_nx64_64x64(vt_a_v[1], w_inv[1])
+        f = [x ^ i for x, i in zip(f, identity)]
+        f = mul_nx64_64x64(w_inv[2], f)
+        f2 = [((a2 & mask1) ^ a) & mask0 for a2, a in zip(vt_a2_v[1], vt_a_v[1])]
+        f = mul_nx64_64x64(f, f2)
+
+        # V_(i+1) = A V0 S0 S0^T + V0 D + V1 E + V2 F
+        vd = mul_nx64_64x64(v[0], d)
+        ve = mul_nx64_64x64(v[1], e)
+        vf = mul_nx64_64x64(v[2], f)
+        v_next = [(a & mask0) ^ x ^ y ^ z for a, x, y, z in zip(av, vd, ve, vf)]
+
+        # X += V0 W_inv0 V0^T v0
+        coeff = mul_nx64_64x64(w_inv[0], mul_64xn_nx64(v[0], v0))
+        X = [x ^ y for x, y in zip(X, mul_nx64_64x64(v[0], coeff))]
+
+        v = [v_next, v[0], v[1]]
+        w_inv = [None, w_inv[0], w_inv[1]]
+        vt_a_v = [None, vt_a_v[0]]
+        vt_a2_v = [None, vt_a2_v[0]]
+        s1, dim1, mask1 = s0, dim0, mask0
+    else:
+        return None
+
+    return [x ^ y for x, y in zip(X, Y)], v[0]
+
+
+def _combine_nullspace(rows, n_cols, X, Vm):
+    """
+    Linear combinations of the 128 columns of [X | V_m] that B maps to zero.
+    Returns a list of relation bitmasks (over the rows passed in).
+    """
+    Z = [x | (y << N) for x, y in zip(X, Vm)]
+    BZ = mul_sparse(rows, n_cols, Z)
+
+    # Spalten von B*Z als ints über die Primzahlen, Gauss mit Kombinationen
+    columns = [0] * (2 * N)
+    for r, word in enumerate(BZ):
+        while word:
+            low = word & -word
+            columns[low.bit_length() - 1] |= 1 << r
+            word ^= low
+
+    pivots = {}   # niedrigstes Bit -> (Spalte, Kombination)
+    combos = []
+    for c in range(2 * N):
+        col, comb = columns[c], 1 << c
+        while col:
+            low = col & -col
+            if low not in pivots:
+                pivots[low] = (col, comb)
+                break
+            p_col, p_comb = pivots[low]
+            col ^= p_col
+            comb ^= p_comb
+        else:
+            combos.append(comb)
+
+    deps = set()
+    for u in combos:
+        mask = 0
+        for j, z in enumerate(Z):
+            if (z & u).bit_count() & 1:
+                mask |= 1 << j
+        if mask:
+            deps.add(mask)
+    return list(deps)
+
+
+def block_lanczos(rows, n_cols: int, seed: int | None = None, tries: int = 3):
+    """
+    Find dependencies among the rows (relations) of a sparse GF(2) matrix.
+    rows:   list of lists of column indices (Primzahlen mit ungeradem Exponenten)
+    n_cols: number of columns
+    Returns a list of bitmasks over rows, like find_dependencies_mod2 in QS.py.
+    Leere Liste, wenn die Iteration mehrfach zusammenbricht.
+    """
+    keep = remove_singletons(rows)
+    sub_rows, sub_cols = compress_columns([rows[j] for j in keep])
+    if len(sub_rows) <= sub_cols or len(sub_rows) < 2 * N:
+        return []
+
+    rng = random.Random(seed)
+    for _ in range(tries):
+        result = _lanczos_iteration(sub_rows, sub_cols, rng)
+        if result is None:
+            continue
+        deps = _combine_nullspace(sub_rows, sub_cols, *result)
+        if not deps:
+            continue
+
+        # Masken von den gefilterten auf die ursprünglichen Relationen umrechnen
+        out = []
+        for mask in deps:
+            full = 0
+            for j, orig in enumerate(keep):
+                if (mask >> j) & 1:
+                    full |= 1 << orig
+            out.append(full)
+        return out
+    return []
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Relationen-Datei für lange QS-Läufe: Checkpoint, Resume und Merge.
+
+Zeilenformat (Text, es wird nur angehängt):
+    # QS n=<n> B=<B> method=<qs|siqs>
+    F <x> [-1] <p>[^e] ...      volle Relation:  x^2 - n = (-1) * prod p^e
+    P <x> <q1> [<q2>]           Teilrelation mit großen Primzahlen q1 (, q2)
+
+x ist immer der Wert mit x^2 ≡ v (mod n), bei SIQS also ax + b. Jede Zeile
+wird sofort geschrieben; eine beim Abbruch abgeschnittene letzte Zeile wird
+beim Lesen übersprungen. Die Prüfung der Relationen (stimmt die
+Faktorisierung?) passiert beim Laden in QS.py.
+"""
+
+import os
+
+
+def format_header(n: int, B: int, method: str) -> str:
+    return f"# QS n={n} B={B} method={method}\n"
+
+
+def read_header(path):
+    """
+    Parameters from the header line of a relation file as a dict
+    {"n", "B", "method"}, or None if the file is missing or empty.
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="ascii") as f:
+        line = f.readline()
+    if not line:
+        return None
+    fields = line.split()
+    if fields[:2] != ["#", "QS"]:
+        raise ValueError(f"{path}: keine QS-Relationen-Datei")
+    header = dict(field.split("=", 1) for field in fields[2:])
+    return {"n": int(header["n"]), "B": int(header["B"]),
+            "method": header.get("method", "qs")}
+
+
+def format_relation(rel, factor_base) -> str:
+    """One line for a raw relation dict from the sieve (full or partial)."""
+    if rel["large"]:
+        return "P " + " ".join(str(q) for q in (rel["x"], *rel["large"])) + "\n"
+    parts = ["F", str(rel["x"])]
+    if rel["sign"] == -1:
+        parts.append("-1")
+    for i, e in sorted(rel["exponents"].items()):
+        p = factor_base[i]
+        if e == 1:
+            parts.append(str(p))
+        elif e > 1:
+            parts.append(f"{p}^{e}")
+    return " ".join(parts) + "\n"
+
+
+def parse_relation(line: str):
+    """
+    Parse one relation line.
+    Returns ("F", x, sign, {p: e}) or ("P", x, (q1, ...)), None for
+    comments and broken lines.
+    """
+    fields = line.split()
+    if len(fields) < 2 or fields[0] not in ("F", "P") or not line.endswith("\n"):
+        return None
+    try:
+        x = int(fields[1])
+        if fields[0] == "P":
+            large = tuple(int(q) for q in fields[2:])
+            return ("P", x, large) if 1 <= len(large) <= 2 else None
+        sign, exps = 1, {}
+        for field in fields[2:]:
+            if field == "-1":
+                sign = -1
+                continue
+            p, _, e = field.partition("^")
+            exps[int(p)] = int(e) if e else 1
+    except ValueError:
+        return None
+    return "F", x, sign, exps
+
+
+def read_relations(path):
+    """Generator over the parsed relations of one file (siehe parse_relation)."""
+    with open(path, encoding="ascii") as f:
+        for line in f:
+            rel = parse_relation(line)
+            if rel is not None:
+                yield rel
+
+
+class RelationWriter:
+    """
+    Append-only writer. Legt die Datei mit Kopfzeile an oder prüft, dass
+    eine vorhandene Datei zu n und B passt. Zeilenpuffer: jede Relation
+    steht sofort auf der Platte.
+    """
+
+    def __init__(self, path, n: int, B: int, factor_base, method: str = "qs"):
+        header = read_header(path)
+        if header is not None and (header["n"], header["B"]) != (n, B):
+            raise ValueError(f"{path}: Relationen für n={header['n']}, "
+                             f"B={header['B']}, nicht für n={n}, B={B}")
+        self.path = path
+        self.factor_base = factor_base
+        self.count = 0
+        self.file = open(path, "a", encoding="ascii", buffering=1)
+        if header is None:
+            self.file.write(format_header(n, B, method))
+        elif not _ends_with_newline(path):
+            # abgeschnittene Zeile vom letzten Abbruch abschließen
+            self.file.write("\n")
+
+    def append(self, rel):
+        self.file.write(format_relation(rel, self.factor_base))
+        self.count += 1
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _ends_with_newline(path) -> bool:
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return True
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+def merge_relation_files(out_path, paths):
+    """
+    Merge relation files (z.B. von mehreren Rechnern) into out_path.
+    Alle Dateien müssen dasselbe n und B haben; doppelte x werden nur
+    einmal übernommen. Returns the number of relations written.
+    """
+    headers = [read_header(path) for path in paths]
+    headers = [(h, path) for h, path in zip(headers, paths) if h is not None]
+    if not headers:
+        raise ValueError("keine Relationen-Dateien mit Kopfzeile gefunden")
+    first = headers[0][0]
+    for h, path in headers:
+        if (h["n"], h["B"]) != (first["n"], first["B"]):
+            raise ValueError(f"{path}: anderes n oder B als {headers[0][1]}")
+
+    # erst in eine Temp-Datei schreiben: out_path darf selbst eine der
+    # Eingaben sein und wird erst am Ende ersetzt
+    tmp_path = f"{out_path}.tmp"
+    seen = set()
+    count = 0
+    try:
+        with open(tmp_path, "w", encoding="ascii") as out:
+            out.write(format_header(first["n"], first["B"], first["method"]))
+            for _, path in headers:
+                with open(path, encoding="ascii") as f:
+                    for line in f:
+                        rel = parse_relation(line)
+                        if rel is None or abs(rel[1]) in seen:
+                            continue
+                        seen.add(abs(rel[1]))
+                        out.write(line)
+                        count += 1
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return count
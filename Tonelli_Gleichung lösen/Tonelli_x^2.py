@@ -1,4 +1,11 @@
 # x^2 ≡ n (mod p)  with p an odd prime
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import sqrt_context  # noqa: E402
+
 p = 103
 n = 50
 
@@ -19,25 +26,18 @@ if p % 4 == 3:
     print("Lösungen:", x, p - x)
     exit()
 
-# 2) Factor p-1 = q * 2^s with q odd
-q = p - 1
-s = 0
-while q % 2 == 0:
-    q //= 2
-    s += 1
+# 2) Factor p-1 = q * 2^s with q odd (und 3) Nichtrest z): einmal pro p in sqrt_context
+ctx = sqrt_context(p)
+q, s, z = ctx.q, ctx.s, ctx.z
 
 print("2) Zerlegung:")
 print(f"   p-1 = {p-1} = {q} * 2^{s}\n")
 
-# 3) Find a quadratic non-residue z
-z = 2
-while pow(z, (p - 1) // 2, p) != p - 1:
-    z += 1
 print("3) Nichtquadratischer Rest:")
 print(f"   z = {z}\n")
 
 # 4) Tonelli–Shanks init
-c = pow(z, q, p)
+c = ctx.zq
 x = pow(n, (q + 1) // 2, p)
 t = pow(n, q, p)
 m = s
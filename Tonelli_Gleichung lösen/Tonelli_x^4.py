@@ -4,16 +4,17 @@
 # Dann: für jedes y die Lösungen von x^2 ≡ y (mod p)
 # ============================================================
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Modulare Arithmetik"))
+from modarith import legendre, sqrt_context  # noqa: E402
+
 p = 83
 a = 75
 verbose = True
 
 
-def legendre_symbol(n: int, p: int) -> int:
-    """Legendre-Symbol (n/p) als Wert in {0, 1, p-1}."""
-    return pow(n % p, (p - 1) // 2, p)
-
-
 def tonelli_shanks(n: int, p: int, verbose: bool = False, label: str = ""):
     """
     Löst x^2 ≡ n (mod p) für ungerades Prim p.
@@ -22,8 +23,14 @@ def tonelli_shanks(n: int, p: int, verbose: bool = False, label: str = ""):
       - n=0 Spezialfall
       - p ≡ 3 (mod 4) Shortcut
       - sonst Tonelli–Shanks allgemein
+    Zerlegung von p-1 und Nichtrest z kommen aus sqrt_context(p) (einmal
+    pro p). Ohne verbose rechnet sqrt_context(p).sqrt direkt (dort auch
+    Cipolla für großes s).
     """
     n %= p
+    if not verbose:
+        x = sqrt_context(p).sqrt(n)
+        return None if x is None else (x, (p - x) % p)
     if verbose:
         print(f"\n{label}Löse x² ≡ {n} (mod {p})")
 
@@ -34,10 +41,10 @@ def tonelli_shanks(n: int, p: int, verbose: bool = False, label: str = ""):
         return (0, 0)
 
     # Legendre-Test
-    ls = legendre_symbol(n, p)
+    ls = legendre(n, p)
     if verbose:
         print("Legendre-Test:")
-        print(f"  {n}^(({p}-1)/2) mod {p} = {ls}")
+        print(f"  ({n}/{p}) = {ls}")
 
     if ls != 1:
         if verbose:
@@ -55,28 +62,20 @@ def tonelli_shanks(n: int, p: int, verbose: bool = False, label: str = ""):
         return (x, (p - x) % p)
 
     # Tonelli–Shanks allgemein
-    # Schreibe p-1 = q * 2^s mit q ungerade
-    q = p - 1
-    s = 0
-    while q % 2 == 0:
-        q //= 2
-        s += 1
+    # p-1 = q * 2^s mit q ungerade und Nichtrest z: einmal pro p
+    ctx = sqrt_context(p)
+    q, s, z = ctx.q, ctx.s, ctx.z
 
     if verbose:
         print("\nZerlegung von p−1:")
         print(f"  p−1 = {p-1} = {q} · 2^{s}")
 
-    # Finde z = Nicht-Quadratischer Rest
-    z = 2
-    while legendre_symbol(z, p) != p - 1:
-        z += 1
-
     if verbose:
         print("\nNichtquadratischer Rest z:")
         print(f"  z = {z} (weil (z/p) = -1)")
 
     # Initialisierung
-    c = pow(z, q, p)
+    c = ctx.zq
     x = pow(n, (q + 1) // 2, p)
     t = pow(n, q, p)
     m = s
@@ -156,6 +156,8 @@ RSA Verschlüsselung
 • Zwei große Primzahlen p, q generieren:
     p = nextprime(10^1000 + random(10^1000))
     q = nextprime(10^1000 + random(10^1000))
+• Primzahltest für so große p, q: ispseudoprime(p) (BPSW, Millisekunden)
+  statt isprime(p) (vollständiger Beweis, dauert bei 1000 Stellen sehr lange)
     
 Anzahle mögliche Verschlüsselungsexponente e, N gegeben:
 eulerphi(eulerphi(N))    